@@ -238,6 +238,26 @@ COSTOS_TRANSPORTE_DISTRIBUCION = {
     }
 }
 
+# Capacidad mensual de cada ruta planta → centro (botellas/mes, compartida por
+# todos los productos: camiones disponibles en la ruta)
+CAPACIDAD_RUTAS_DISTRIBUCION = {
+    "Planta_Quito": {
+        "Centro_Quito": 300000,
+        "Centro_Guayaquil": 150000,
+        "Centro_Cuenca": 150000,
+    },
+    "Planta_Guayaquil": {
+        "Centro_Quito": 150000,
+        "Centro_Guayaquil": 300000,
+        "Centro_Cuenca": 150000,
+    },
+    "Planta_Cuenca": {
+        "Centro_Quito": 150000,
+        "Centro_Guayaquil": 150000,
+        "Centro_Cuenca": 200000,
+    }
+}
+
 # Costo de transporte por botella (USD) desde centros de distribución a puntos de venta
 COSTOS_TRANSPORTE_VENTA = {
     "Centro_Quito": {
@@ -325,6 +345,20 @@ NODOS_RED = {
     "puntos_venta": list(PUNTOS_VENTA.keys()),
 }
 
+# Coordenadas (latitud, longitud) de las ciudades de operación
+COORDENADAS_CIUDADES = {
+    "Quito": (-0.1807, -78.4678),
+    "Guayaquil": (-2.1710, -79.9224),
+    "Cuenca": (-2.9001, -79.0059),
+}
+
+# Coordenadas de cada nodo de la red según la ciudad de su ubicación
+COORDENADAS_NODOS = {
+    nodo: COORDENADAS_CIUDADES[datos["ubicacion"].split(" - ")[0]]
+    for grupo in (PLANTAS, CENTROS_DISTRIBUCION, PUNTOS_VENTA)
+    for nodo, datos in grupo.items()
+}
+
 # ============================================================================
 # 11. INFORMACIÓN ADICIONAL
 # ============================================================================
@@ -1,5 +1,12 @@
 """Módulo de Problemas de Redes"""
 
 from .ruta_corta import RutaMasCorta
+from .csr import RedCSR
+from .todos_pares import todos_los_pares
+from .landmarks import LandmarksALT
+from .ruta_dinamica import RutaDinamica
+from .simplex_redes import SimplexRedes
+from .escalamiento_capacidad import EscalamientoCapacidad
 
-__all__ = ['RutaMasCorta']
\ No newline at end of file
+__all__ = ['RutaMasCorta', 'RedCSR', 'todos_los_pares', 'LandmarksALT', 'RutaDinamica', 'SimplexRedes',
+           'EscalamientoCapacidad']
\ No newline at end of file
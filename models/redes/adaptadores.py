@@ -5,6 +5,8 @@ para algoritmos como Dijkstra
 
 import math
 
+from .csr import RedCSR
+
 
 def red_a_matriz_distancias(red):
     """
@@ -77,6 +79,28 @@ def red_a_matriz_costos(red):
     return matriz, nodos
 
 
+def arcos_de_red(red):
+    """
+    Recorre los arcos de una Red o de una RedCSR con nombres de nodos.
+
+    Yields:
+        tuple: (origen, destino, costo, capacidad, distancia)
+    """
+    if isinstance(red, RedCSR):
+        nodos = red.nodos
+        yield from (
+            (nodos[u], nodos[v], costo, capacidad, distancia)
+            for u, v, costo, capacidad, distancia in zip(
+                red.origen.tolist(), red.destino.tolist(), red.costo.tolist(),
+                red.capacidad.tolist(), red.distancia.tolist()
+            )
+        )
+        return
+
+    for arco in red.arcos:
+        yield (arco["origen"], arco["destino"], arco["costo"], arco["capacidad"], arco["distancia"])
+
+
 def obtener_info_nodo(red, nodo):
     """
     Obtiene información completa de un nodo
@@ -95,11 +119,11 @@ def obtener_arcos_desde(red, nodo):
     """
     Obtiene todos los arcos que salen de un nodo
     """
-    return [arco for arco in red.arcos if arco["origen"] == nodo]
+    return red.obtener_vecinos(nodo)
 
 
 def obtener_arcos_hacia(red, nodo):
     """
     Obtiene todos los arcos que llegan a un nodo
     """
-    return [arco for arco in red.arcos if arco["destino"] == nodo]
\ No newline at end of file
+    return red.obtener_entrantes(nodo)
\ No newline at end of file
@@ -1,11 +1,64 @@
+import numpy as np
+
+from .csr import como_csr
+
+
 class ArbolMinimo:
     def __init__(self, nodos):
         self.nodos = nodos
         self.aristas = []
+        # (origen, destino, costo) como arreglos con índices enteros de nodo;
+        # desde_red los llena sin crear una tupla de Python por arista
+        self._arreglos = None
+
+    @classmethod
+    def desde_red(cls, red, campo="costo"):
+        """
+        Construye el problema desde una Red o una RedCSR (los arcos se toman
+        como aristas no dirigidas).
+
+        Args:
+            red: Red o RedCSR
+            campo: Peso de las aristas ('costo' o 'distancia')
+        """
+        if campo not in ("costo", "distancia"):
+            raise ValueError(f"Campo de arco desconocido: {campo}")
+
+        csr = como_csr(red)
+        arbol = cls(list(csr.nodos))
+        arbol._arreglos = (csr.origen, csr.destino, csr.peso(campo))
+        return arbol
 
     def agregar_arista(self, u, v, costo):
+        self._a_lista()
         self.aristas.append((costo, u, v))
 
+    def _a_lista(self):
+        """Pasa las aristas guardadas como arreglos a la lista de tuplas (costo, u, v)"""
+        if self._arreglos is None:
+            return
+        origen, destino, costo = self._arreglos
+        nodos = self.nodos
+        self.aristas.extend(
+            (c, nodos[u], nodos[v])
+            for u, v, c in zip(origen.tolist(), destino.tolist(), costo.tolist())
+        )
+        self._arreglos = None
+
+    def _a_arreglos(self):
+        """Aristas como arreglos (origen, destino, costo) con índices enteros de nodo"""
+        if self._arreglos is not None:
+            return self._arreglos
+
+        indice = {nodo: i for i, nodo in enumerate(self.nodos)}
+        try:
+            origen = np.fromiter((indice[u] for _, u, _ in self.aristas), dtype=np.int64, count=len(self.aristas))
+            destino = np.fromiter((indice[v] for _, _, v in self.aristas), dtype=np.int64, count=len(self.aristas))
+        except KeyError as e:
+            raise ValueError(f"Nodo inválido: {e.args[0]}") from None
+        costo = np.array([c for c, _, _ in self.aristas], dtype=float)
+        return origen, destino, costo
+
     # ---------------------------
     # Union-Find
     # ---------------------------
@@ -31,6 +84,7 @@ class ArbolMinimo:
     # KRUSKAL
     # ---------------------------
     def resolver(self):
+        self._a_lista()
         self.aristas.sort()  # por costo
 
         padre = {n: n for n in self.nodos}
@@ -63,3 +117,92 @@ class ArbolMinimo:
             "costo_total": costo_total,
             "iteraciones": iteraciones
         }
+
+    # ---------------------------
+    # KRUSKAL SOBRE ARREGLOS
+    # ---------------------------
+    def resolver_arreglos(self, registrar_iteraciones=True):
+        """
+        Kruskal con nodos como índices enteros: np.argsort sobre el arreglo de
+        costos y unión-búsqueda en listas con compresión por mitades
+        (iterativa, sin recursión) y unión por tamaño. Pensado para redes con
+        millones de aristas.
+
+        Args:
+            registrar_iteraciones: Si es False no se arma la lista de iteraciones
+
+        Returns:
+            dict: Igual que resolver()
+        """
+        origen, destino, costo = self._a_arreglos()
+        n = len(self.nodos)
+        nodos = self.nodos
+
+        orden = np.argsort(costo, kind="stable")
+        orden = orden[origen[orden] != destino[orden]]  # los lazos nunca entran al árbol
+        elegidas = kruskal_arreglos(n, origen[orden].tolist(), destino[orden].tolist())
+        elegidas = orden[elegidas]
+
+        costos = costo[elegidas].tolist()
+        arbol = list(zip(
+            (nodos[u] for u in origen[elegidas].tolist()),
+            (nodos[v] for v in destino[elegidas].tolist()),
+            costos
+        ))
+        acumulado = np.cumsum(costos).tolist()
+
+        iteraciones = []
+        if registrar_iteraciones:
+            iteraciones = [
+                {
+                    "arista": f"{u} → {v}",
+                    "costo": c,
+                    "costo_acumulado": total
+                }
+                for (u, v, c), total in zip(arbol, acumulado)
+            ]
+
+        return {
+            "arbol": arbol,
+            "costo_total": acumulado[-1] if acumulado else 0,
+            "iteraciones": iteraciones
+        }
+
+
+def kruskal_arreglos(n, origen, destino):
+    """
+    Unión-búsqueda sobre aristas ya ordenadas por costo.
+
+    Args:
+        n: Cantidad de nodos
+        origen: Nodo origen (índice) de cada arista, en orden de costo
+        destino: Nodo destino (índice) de cada arista, en orden de costo
+
+    Returns:
+        list: Posiciones (en el orden dado) de las aristas del árbol
+    """
+    padre = list(range(n))
+    tamano = [1] * n
+    elegidas = []
+    faltan = n - 1
+
+    for k, (u, v) in enumerate(zip(origen, destino)):
+        # Compresión por mitades: cada nodo del camino apunta a su abuelo
+        while padre[u] != u:
+            padre[u] = u = padre[padre[u]]
+        while padre[v] != v:
+            padre[v] = v = padre[padre[v]]
+        if u == v:
+            continue
+
+        if tamano[u] < tamano[v]:
+            u, v = v, u
+        padre[v] = u
+        tamano[u] += tamano[v]
+
+        elegidas.append(k)
+        faltan -= 1
+        if faltan == 0:
+            break
+
+    return elegidas
@@ -0,0 +1,197 @@
+"""
+models/redes/csr.py
+Representación compacta (CSR) de la Red de distribución con arreglos NumPy
+"""
+
+import numpy as np
+
+
+class RedCSR:
+    """
+    Red congelada en formato de filas comprimidas (CSR).
+
+    Los arcos que salen del nodo u ocupan las posiciones
+    inicio[u] : inicio[u + 1] de los arreglos destino, costo, capacidad y
+    distancia. Cada arco ocupa unos 40 bytes (frente a ~500 de un diccionario
+    de cinco claves), y los algoritmos pueden recorrer los vecinos con
+    rebanadas o vectorizar operaciones sobre todos los arcos.
+
+    Los nodos se identifican por un índice entero; `nodos` e `indice`
+    traducen entre índices y nombres.
+    """
+
+    def __init__(self, nodos, origen, destino, costo=None, capacidad=None, distancia=None,
+                 oferta_demanda=None, tipos_nodo=None, coordenadas=None):
+        """
+        Args:
+            nodos: Lista de nombres de nodos
+            origen: Índice del nodo origen de cada arco
+            destino: Índice del nodo destino de cada arco
+            costo: Costo de cada arco (por defecto 0)
+            capacidad: Capacidad de cada arco (por defecto infinita)
+            distancia: Distancia de cada arco (por defecto 0)
+            oferta_demanda: Oferta (+) o demanda (-) de cada nodo (por defecto 0)
+            tipos_nodo: Diccionario {nodo: tipo} (opcional)
+            coordenadas: Diccionario {nodo: (latitud, longitud)} (opcional)
+        """
+        self.nodos = list(nodos)
+        self.indice = {nombre: i for i, nombre in enumerate(self.nodos)}
+        n = len(self.nodos)
+
+        origen = np.asarray(origen, dtype=np.int64)
+        destino = np.asarray(destino, dtype=np.int64)
+        m = origen.size
+
+        if destino.size != m:
+            raise ValueError("origen y destino deben tener la misma longitud")
+        if m and (min(origen.min(), destino.min()) < 0 or max(origen.max(), destino.max()) >= n):
+            raise ValueError("Hay arcos con nodos fuera de rango")
+
+        costo = _arreglo(costo, m, 0.0, "costo")
+        capacidad = _arreglo(capacidad, m, np.inf, "capacidad")
+        distancia = _arreglo(distancia, m, 0.0, "distancia")
+        if np.any(capacidad < 0):
+            raise ValueError("La capacidad no puede ser negativa")
+
+        # Orden estable por origen: se conserva el orden de inserción de cada nodo
+        orden = np.argsort(origen, kind="stable")
+        tipo_indice = np.int32 if n < 2 ** 31 else np.int64
+
+        self.origen = origen[orden].astype(tipo_indice)
+        self.destino = destino[orden].astype(tipo_indice)
+        self.costo = costo[orden]
+        self.capacidad = capacidad[orden]
+        self.distancia = distancia[orden]
+        self.arco_original = orden  # posición del arco en la lista de entrada
+
+        self.inicio = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(origen, minlength=n), out=self.inicio[1:])
+
+        if oferta_demanda is None:
+            self.oferta_demanda = np.zeros(n)
+        else:
+            self.oferta_demanda = _arreglo(oferta_demanda, n, 0.0, "oferta_demanda")
+        self.tipos_nodo = dict(tipos_nodo or {})
+
+        # Latitud y longitud en grados; NaN para los nodos sin ubicación
+        self.latitud = np.full(n, np.nan)
+        self.longitud = np.full(n, np.nan)
+        for nombre, (lat, lon) in (coordenadas or {}).items():
+            self.latitud[self.indice[nombre]] = lat
+            self.longitud[self.indice[nombre]] = lon
+
+        self._entrantes = None
+
+    @classmethod
+    def desde_red(cls, red):
+        """
+        Congela un objeto Red (ver Red.congelar).
+
+        Returns:
+            RedCSR
+        """
+        indice = {nombre: i for i, nombre in enumerate(red.nodos)}
+        m = len(red.arcos)
+
+        origen = np.fromiter((indice[a["origen"]] for a in red.arcos), dtype=np.int64, count=m)
+        destino = np.fromiter((indice[a["destino"]] for a in red.arcos), dtype=np.int64, count=m)
+        costo = np.fromiter((a["costo"] for a in red.arcos), dtype=float, count=m)
+        capacidad = np.fromiter((a["capacidad"] for a in red.arcos), dtype=float, count=m)
+        distancia = np.fromiter((a["distancia"] for a in red.arcos), dtype=float, count=m)
+        oferta_demanda = [red.oferta_demanda.get(nombre, 0) for nombre in red.nodos]
+
+        return cls(red.nodos, origen, destino, costo, capacidad, distancia,
+                   oferta_demanda=oferta_demanda, tipos_nodo=red.tipos_nodo,
+                   coordenadas=red.coordenadas)
+
+    @property
+    def num_nodos(self):
+        return len(self.nodos)
+
+    @property
+    def num_arcos(self):
+        return int(self.destino.size)
+
+    def __len__(self):
+        return self.num_arcos
+
+    def peso(self, campo):
+        """Arreglo de pesos de los arcos: 'costo', 'distancia' o 'capacidad'"""
+        if campo not in ("costo", "distancia", "capacidad"):
+            raise ValueError(f"Campo de arco desconocido: {campo}")
+        return getattr(self, campo)
+
+    @property
+    def tiene_coordenadas(self):
+        """Indica si todos los nodos tienen latitud y longitud"""
+        return not (np.isnan(self.latitud).any() or np.isnan(self.longitud).any())
+
+    def arcos_desde(self, u):
+        """Índices (rango) de los arcos que salen del nodo u"""
+        return range(self.inicio[u], self.inicio[u + 1])
+
+    def vecinos(self, u):
+        """Nodos destino de los arcos que salen de u"""
+        return self.destino[self.inicio[u]:self.inicio[u + 1]]
+
+    def arcos_hacia(self, v):
+        """Índices de los arcos que llegan al nodo v"""
+        inicio, orden = self.entrantes()
+        return orden[inicio[v]:inicio[v + 1]]
+
+    def entrantes(self):
+        """
+        Índice inverso (CSC) calculado la primera vez que se pide.
+
+        Returns:
+            tuple: (inicio, orden) con los arcos que llegan a v en
+                   orden[inicio[v]:inicio[v + 1]]
+        """
+        if self._entrantes is None:
+            orden = np.argsort(self.destino, kind="stable")
+            inicio = np.zeros(self.num_nodos + 1, dtype=np.int64)
+            np.cumsum(np.bincount(self.destino, minlength=self.num_nodos), out=inicio[1:])
+            self._entrantes = (inicio, orden)
+        return self._entrantes
+
+    def a_matriz(self, campo="distancia"):
+        """
+        Matriz n×n densa (sólo para ejemplos pequeños): diagonal 0, infinito
+        donde no hay arco y el menor peso si hay arcos paralelos.
+
+        Returns:
+            np.ndarray
+        """
+        n = self.num_nodos
+        matriz = np.full((n, n), np.inf)
+        np.minimum.at(matriz, (self.origen, self.destino), self.peso(campo))
+        np.fill_diagonal(matriz, 0)
+        return matriz
+
+    def memoria(self):
+        """Bytes ocupados por los arreglos de la red"""
+        arreglos = (self.origen, self.destino, self.costo, self.capacidad, self.distancia,
+                    self.arco_original, self.inicio, self.oferta_demanda,
+                    self.latitud, self.longitud)
+        return int(sum(a.nbytes for a in arreglos))
+
+    def __repr__(self):
+        return f"RedCSR(nodos={self.num_nodos}, arcos={self.num_arcos})"
+
+
+def _arreglo(valores, longitud, defecto, nombre):
+    """Arreglo float64 de la longitud indicada (o relleno con el valor por defecto)"""
+    if valores is None:
+        return np.full(longitud, defecto, dtype=float)
+
+    valores = np.asarray(valores, dtype=float)
+    if valores.shape != (longitud,):
+        raise ValueError(f"{nombre} debe tener {longitud} valores")
+    return valores
+
+
+def como_csr(red):
+    """Devuelve la red en formato CSR (congelándola si es un objeto Red)"""
+    if isinstance(red, RedCSR):
+        return red
+    return RedCSR.desde_red(red)
@@ -0,0 +1,234 @@
+"""
+models/redes/escalamiento_capacidad.py
+Flujo de costo mínimo por escalamiento de capacidades para redes grandes
+
+Las rutas sucesivas (FlujoCostoMinimo) envían a veces muy poco flujo por
+ruta, y el número de rutas crece con las capacidades. Aquí el flujo se
+envía en cantidades Δ = 2^k, 2^(k-1), ..., 1:
+
+- Al empezar cada fase se saturan los arcos residuales con capacidad ≥ Δ y
+  costo reducido negativo, así los costos reducidos vuelven a ser ≥ 0 en la
+  red residual de la fase.
+- Mientras haya un nodo con exceso ≥ Δ que llegue a un nodo con déficit ≥ Δ,
+  se envía flujo (al menos Δ unidades) por la ruta más barata entre ellos
+  (Dijkstra multiorigen con potenciales, sólo por arcos con capacidad ≥ Δ).
+
+Cada fase hace O(m) aumentos, así que el total es O(m log U) búsquedas de
+Dijkstra, con U la mayor capacidad u oferta. La red residual se construye
+directamente desde los arreglos de la RedCSR.
+"""
+
+import numpy as np
+
+from .csr import como_csr
+from .flujo_costo_minimo import _ResidualCosto
+
+
+class EscalamientoCapacidad:
+    """
+    Flujo de costo mínimo con ofertas y demandas por escalamiento de capacidades.
+
+    Uso:
+        escalamiento = EscalamientoCapacidad(red)
+        resultado = escalamiento.resolver()
+    """
+
+    def __init__(self, red):
+        """
+        Args:
+            red: Red o RedCSR con costo y capacidad (enteras) por arco y
+                 oferta_demanda (entera) por nodo
+        """
+        self.csr = como_csr(red)
+        self.fases = 0
+        self.aumentos = 0
+
+    # -------------------------------------------------
+    # MÉTODO PRINCIPAL
+    # -------------------------------------------------
+    def resolver(self):
+        """
+        Calcula el flujo de costo mínimo que satisface todas las ofertas y demandas.
+
+        Returns:
+            dict: {
+                'costo_total': costo del flujo óptimo,
+                'flujo_arcos': {(origen, destino): flujo} de los arcos con flujo,
+                'flujos': [{'origen', 'destino', 'costo', 'capacidad', 'flujo'}] por arco,
+                'fases': fases de escalamiento (valores de Δ),
+                'aumentos': envíos de flujo por una ruta
+            }
+        """
+        csr = self.csr
+        nodos = csr.nodos
+        n, m = csr.num_nodos, csr.num_arcos
+
+        oferta = csr.oferta_demanda
+        finitas = csr.capacidad[np.isfinite(csr.capacidad)]
+        if np.any(oferta % 1) or np.any(finitas % 1):
+            raise ValueError("El escalamiento de capacidades requiere capacidades y ofertas enteras")
+        if oferta.sum() != 0:
+            raise ValueError(
+                f"La red no está balanceada (suma = {oferta.sum()}). "
+                "Oferta total debe ser igual a demanda total."
+            )
+
+        # "Infinito" finito: ningún flujo acotado por las ofertas y las
+        # capacidades finitas llega a la mitad de este valor
+        infinito = 2 * (int(np.abs(oferta).sum()) + int(finitas.sum())) + 1
+        residual = _ResidualCosto.desde_csr(csr, infinito)
+        residual.capacidad = [int(c) for c in residual.capacidad]
+
+        exceso = [int(b) for b in oferta.tolist()]
+        potencial = [0] * n
+        mayor = max(int(finitas.max(initial=0)), max(map(abs, exceso), default=0))
+        delta = 1 << (mayor.bit_length() - 1) if mayor else 0
+
+        self.fases = self.aumentos = 0
+        while delta >= 1:
+            self.fases += 1
+            self._saturar_negativos(residual, potencial, exceso, delta)
+
+            while True:
+                origenes = [i for i in range(n) if exceso[i] >= delta]
+                destinos = {i for i in range(n) if exceso[i] <= -delta}
+                if not origenes or not destinos:
+                    break
+
+                dist, arco_padre, t = residual.dijkstra(origenes, potencial, destinos, minimo=delta - 1)
+                if t == -1:
+                    break
+
+                d_t = dist[t]
+                for v in range(n):
+                    potencial[v] += min(dist[v], d_t)
+
+                # Todos los arcos de la ruta tienen capacidad >= Δ: se envía lo más
+                # que permitan la ruta, el exceso del origen y el déficit del destino
+                ruta = residual.camino(t, arco_padre)
+                s = residual.cabeza[ruta[0] ^ 1]
+                cantidad = min(exceso[s], -exceso[t], min(residual.capacidad[k] for k in ruta))
+                residual.aumentar(ruta, cantidad)
+                exceso[s] -= cantidad
+                exceso[t] += cantidad
+                self.aumentos += 1 + self._aumentar_admisibles(residual, potencial, exceso, delta)
+
+            delta //= 2
+
+        if any(exceso):
+            raise ValueError("No existe un flujo factible que cumpla las ofertas y demandas")
+
+        flujo = [residual.capacidad[2 * k + 1] for k in range(m)]
+        if any(flujo[k] * 2 >= infinito for k in np.flatnonzero(np.isinf(csr.capacidad)).tolist()):
+            raise ValueError("El problema es ilimitado: hay un ciclo de costo negativo sin límite de capacidad")
+
+        # Arcos en el orden en que se agregaron a la Red
+        origen, destino = csr.origen.tolist(), csr.destino.tolist()
+        costo, capacidad = csr.costo.tolist(), csr.capacidad.tolist()
+        flujos = []
+        flujo_arcos = {}
+        for k in np.argsort(csr.arco_original, kind="stable").tolist():
+            u, v = nodos[origen[k]], nodos[destino[k]]
+            flujos.append({
+                "origen": u,
+                "destino": v,
+                "costo": costo[k],
+                "capacidad": capacidad[k],
+                "flujo": flujo[k]
+            })
+            if flujo[k]:
+                flujo_arcos[(u, v)] = flujo_arcos.get((u, v), 0) + flujo[k]
+
+        return {
+            "costo_total": sum(f * c for f, c in zip(flujo, costo) if f),
+            "flujo_arcos": flujo_arcos,
+            "flujos": flujos,
+            "fases": self.fases,
+            "aumentos": self.aumentos
+        }
+
+    @staticmethod
+    def _saturar_negativos(residual, potencial, exceso, delta):
+        """Satura los arcos con capacidad residual ≥ Δ y costo reducido negativo"""
+        cabeza, cap, costo, adyacentes, inicio = (
+            residual.cabeza, residual.capacidad, residual.costo,
+            residual.adyacentes, residual.inicio
+        )
+        for u in range(residual.n):
+            p_u = potencial[u]
+            for k in adyacentes[inicio[u]:inicio[u + 1]]:
+                if cap[k] >= delta:
+                    v = cabeza[k]
+                    if costo[k] + p_u - potencial[v] < 0:
+                        cantidad = cap[k]
+                        cap[k] = 0
+                        cap[k ^ 1] += cantidad
+                        exceso[u] -= cantidad
+                        exceso[v] += cantidad
+
+    @staticmethod
+    def _aumentar_admisibles(residual, potencial, exceso, delta):
+        """
+        Aprovecha los potenciales recién actualizados antes de repetir Dijkstra:
+        cualquier ruta de arcos con capacidad ≥ Δ y costo reducido 0 entre un
+        nodo con exceso y uno con déficit también es de costo mínimo. Se buscan
+        por DFS con arco actual, como el flujo bloqueante de Dinic.
+
+        Returns:
+            int: Cantidad de rutas aumentadas
+        """
+        cabeza, cap, costo, adyacentes, inicio = (
+            residual.cabeza, residual.capacidad, residual.costo,
+            residual.adyacentes, residual.inicio
+        )
+        actual = inicio[:-1]
+        en_camino = [False] * residual.n
+        aumentos = 0
+
+        for s in range(residual.n):
+            camino = []
+            u = s
+            while exceso[s] >= delta:
+                if u != s and exceso[u] <= -delta:
+                    cantidad = min(exceso[s], -exceso[u], min(cap[k] for k in camino))
+                    for k in camino:
+                        cap[k] -= cantidad
+                        cap[k ^ 1] += cantidad
+                    exceso[s] -= cantidad
+                    exceso[u] += cantidad
+                    aumentos += 1
+
+                    # Retroceder hasta la cola del primer arco que quedó por debajo de Δ
+                    corte = next((i for i, k in enumerate(camino) if cap[k] < delta), len(camino))
+                    for k in camino[corte:]:
+                        en_camino[cabeza[k]] = False
+                    u = cabeza[camino[corte] ^ 1] if corte < len(camino) else u
+                    del camino[corte:]
+                    continue
+
+                en_camino[u] = True
+                fin, p_u = inicio[u + 1], potencial[u]
+                while actual[u] < fin:
+                    k = adyacentes[actual[u]]
+                    v = cabeza[k]
+                    # Los ciclos de costo 0 se cortan: no se entra a un nodo del camino
+                    if cap[k] >= delta and not en_camino[v] and costo[k] + p_u - potencial[v] == 0:
+                        break
+                    actual[u] += 1
+
+                if actual[u] < fin:
+                    camino.append(adyacentes[actual[u]])
+                    u = cabeza[camino[-1]]
+                elif u == s:
+                    break
+                else:
+                    # Callejón sin salida: u no se vuelve a explorar en esta ronda
+                    en_camino[u] = False
+                    u = cabeza[camino.pop() ^ 1]
+                    actual[u] += 1
+
+            en_camino[s] = False
+            for k in camino:
+                en_camino[cabeza[k]] = False
+
+        return aumentos
@@ -1,6 +1,22 @@
+"""
+models/redes/flujo_costo_minimo.py
+Flujo de costo mínimo por rutas de menor costo sucesivas (SSP)
+
+En cada iteración se envía flujo por la ruta más barata de la red residual,
+que incluye los arcos inversos (costo negativo) para poder deshacer envíos
+anteriores cuando otra combinación de rutas resulta más barata. Dijkstra
+trabaja con costos reducidos c(u, v) + p(u) - p(v), que los potenciales p
+mantienen no negativos (reponderación de Johnson), así que sigue siendo
+válido aunque la red residual tenga arcos de costo negativo.
+"""
+
 import math
 import heapq
-from copy import deepcopy
+from collections import deque
+
+import numpy as np
+
+from .adaptadores import arcos_de_red
 
 
 class FlujoCostoMinimo:
@@ -14,6 +30,14 @@ class FlujoCostoMinimo:
         self.arcos = []
         self.iteraciones = []
 
+    @classmethod
+    def desde_red(cls, red):
+        """Construye el problema desde una Red o una RedCSR"""
+        flujo = cls(list(red.nodos))
+        for origen, destino, costo, capacidad, _ in arcos_de_red(red):
+            flujo.agregar_arco(origen, destino, capacidad, costo)
+        return flujo
+
     # -------------------------------------------------
     # DEFINICIÓN DE ARCO
     # -------------------------------------------------
@@ -29,79 +53,254 @@ class FlujoCostoMinimo:
     # MÉTODO PRINCIPAL
     # -------------------------------------------------
     def resolver(self, origen, destino, flujo_requerido):
+        """
+        Envía `flujo_requerido` de origen a destino al menor costo.
+
+        Se admiten arcos de costo negativo, pero no ciclos de costo negativo
+        (ni lazos de costo negativo) en ninguna parte de la red: con ellos el
+        flujo óptimo circularía también fuera de las rutas de origen a
+        destino, y estas rutas sucesivas no lo encuentran.
+
+        Returns:
+            dict: {
+                'costo_total', 'flujo_enviado', 'costo_promedio',
+                'iteraciones': [{'ruta', 'costo_ruta', 'flujo_enviado',
+                                 'flujo_restante', 'costo_acumulado'}],
+                'flujo_arcos': {(origen, destino): flujo} de los arcos con flujo
+            }
+        """
+        residual = _ResidualCosto(self.nodos)
+        for arco in self.arcos:
+            residual.agregar(arco["origen"], arco["destino"], arco["capacidad"], arco["costo"])
+        residual.construir()
+
+        for nodo in (origen, destino):
+            if nodo not in residual.indice:
+                raise ValueError(f"Nodo inválido: {nodo}")
+        s, t = residual.indice[origen], residual.indice[destino]
+
         flujo_restante = flujo_requerido
         costo_total = 0
-
-        # grafo residual
-        residual = deepcopy(self.arcos)
+        self.iteraciones = []
+        potencial = residual.potenciales_iniciales()
 
         while flujo_restante > 0:
-            ruta, costo_ruta = self._ruta_mas_barata(residual, origen, destino)
-
-            if not ruta:
+            dist, arco_padre, _ = residual.dijkstra([s], potencial, destinos={t})
+            if dist[t] == math.inf:
                 raise ValueError("No existe ruta suficiente para enviar todo el flujo")
 
-            # capacidad mínima de la ruta
-            capacidad_ruta = min(
-                arco["capacidad"] for arco in ruta
-            )
+            # p(v) += min(d(v), d(t)): los costos reducidos siguen siendo >= 0
+            # aunque Dijkstra se haya detenido al fijar el destino
+            for v in range(residual.n):
+                potencial[v] += min(dist[v], dist[t])
+
+            ruta = residual.camino(t, arco_padre)
+            costo_ruta = sum(residual.costo[k] for k in ruta)
+            flujo_enviado = min(min(residual.capacidad[k] for k in ruta), flujo_restante)
+            residual.aumentar(ruta, flujo_enviado)
 
-            flujo_enviado = min(capacidad_ruta, flujo_restante)
             flujo_restante -= flujo_enviado
             costo_total += flujo_enviado * costo_ruta
 
             # guardar iteración
             self.iteraciones.append({
-                "ruta": [(a["origen"], a["destino"]) for a in ruta],
+                "ruta": residual.nombres_camino(ruta),
                 "costo_ruta": costo_ruta,
                 "flujo_enviado": flujo_enviado,
                 "flujo_restante": flujo_restante,
                 "costo_acumulado": costo_total
             })
 
-            # actualizar capacidades
-            for arco in ruta:
-                arco["capacidad"] -= flujo_enviado
-
         return {
             "costo_total": costo_total,
-            "iteraciones": self.iteraciones
+            "flujo_enviado": flujo_requerido,
+            "costo_promedio": costo_total / flujo_requerido if flujo_requerido else 0,
+            "iteraciones": self.iteraciones,
+            "flujo_arcos": residual.flujos()
         }
 
-    # -------------------------------------------------
-    # RUTA MÁS BARATA (DIJKSTRA SOBRE CAPACIDAD > 0)
-    # -------------------------------------------------
-    def _ruta_mas_barata(self, arcos, origen, destino):
-        nodos = self.nodos
-        dist = {n: math.inf for n in nodos}
-        prev = {n: None for n in nodos}
-        dist[origen] = 0
 
-        cola = [(0, origen)]
+class _ResidualCosto:
+    """
+    Red residual con costos en listas de Python.
+
+    El arco original i ocupa las posiciones 2i (directo: capacidad y costo)
+    y 2i + 1 (inverso: capacidad 0 y costo negativo). Los arcos que salen
+    del nodo u son adyacentes[inicio[u]:inicio[u + 1]].
+    """
+
+    def __init__(self, nodos):
+        self.nombres = list(nodos)
+        self.indice = {nombre: i for i, nombre in enumerate(self.nombres)}
+        self.cabeza = []
+        self.capacidad = []
+        self.costo = []
+        self.capacidad_original = []
 
+    def agregar(self, origen, destino, capacidad, costo):
+        for nombre in (origen, destino):
+            if nombre not in self.indice:
+                self.indice[nombre] = len(self.nombres)
+                self.nombres.append(nombre)
+        if capacidad < 0:
+            raise ValueError("La capacidad no puede ser negativa")
+
+        u, v = self.indice[origen], self.indice[destino]
+        self.cabeza += [v, u]
+        self.capacidad += [capacidad, 0]
+        self.costo += [costo, -costo]
+        self.capacidad_original.append(capacidad)
+
+    @classmethod
+    def desde_csr(cls, csr, infinito=math.inf):
+        """
+        Red residual a partir de los arreglos de una RedCSR, sin recorrer los
+        arcos uno por uno desde Python.
+
+        Args:
+            csr: RedCSR
+            infinito: Valor que reemplaza a las capacidades infinitas
+        """
+        residual = cls(csr.nodos)
+        m = csr.num_arcos
+        capacidad = np.where(np.isinf(csr.capacidad), infinito, csr.capacidad)
+
+        cabeza = np.empty(2 * m, dtype=np.int64)
+        cabeza[0::2], cabeza[1::2] = csr.destino, csr.origen
+        residual.cabeza = cabeza.tolist()
+        residual.costo = np.column_stack([csr.costo, -csr.costo]).ravel().tolist()
+        residual.capacidad = np.column_stack([capacidad, np.zeros(m)]).ravel().tolist()
+        residual.capacidad_original = capacidad.tolist()
+
+        # La cola del arco k es la cabeza de k ^ 1
+        cola = cabeza.reshape(-1, 2)[:, ::-1].ravel()
+        residual.n = n = csr.num_nodos
+        residual.adyacentes = np.argsort(cola, kind="stable").tolist()
+        inicio = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cola, minlength=n), out=inicio[1:])
+        residual.inicio = inicio.tolist()
+        return residual
+
+    def construir(self):
+        """Agrupa los arcos por nodo de salida (orden de conteo, O(V + E))"""
+        self.n = n = len(self.nombres)
+        grado = [0] * n
+        for k in range(len(self.cabeza)):
+            grado[self.cabeza[k ^ 1]] += 1
+
+        self.inicio = [0] * (n + 1)
+        for u in range(n):
+            self.inicio[u + 1] = self.inicio[u] + grado[u]
+        siguiente = self.inicio[:-1]
+        self.adyacentes = [0] * len(self.cabeza)
+        for k in range(len(self.cabeza)):
+            u = self.cabeza[k ^ 1]
+            self.adyacentes[siguiente[u]] = k
+            siguiente[u] += 1
+
+    def potenciales_iniciales(self):
+        """
+        Potenciales iniciales: distancias con Bellman-Ford (cola FIFO) desde un
+        origen virtual unido a todos los nodos con costo 0, si hay costos
+        negativos; con costos no negativos bastan ceros. Al partir de todos los
+        nodos se revisa la red completa, no sólo lo alcanzable desde el origen.
+
+        Raises:
+            ValueError: Si hay un ciclo (o un lazo) de costo negativo
+        """
+        if all(self.costo[k] >= 0 for k in range(0, len(self.costo), 2)):
+            return [0] * self.n
+
+        cabeza, cap, costo, adyacentes, inicio = (
+            self.cabeza, self.capacidad, self.costo, self.adyacentes, self.inicio
+        )
+        dist = [0] * self.n
+        en_cola = [True] * self.n
+        arcos_camino = [0] * self.n
+        cola = deque(range(self.n))
         while cola:
-            d, u = heapq.heappop(cola)
-            if u == destino:
-                break
-
-            for arco in arcos:
-                if arco["origen"] == u and arco["capacidad"] > 0:
-                    v = arco["destino"]
-                    nd = d + arco["costo"]
-                    if nd < dist[v]:
-                        dist[v] = nd
-                        prev[v] = arco
-                        heapq.heappush(cola, (nd, v))
-
-        if dist[destino] == math.inf:
-            return None, None
-
-        # reconstruir ruta
+            u = cola.popleft()
+            en_cola[u] = False
+            for k in adyacentes[inicio[u]:inicio[u + 1]]:
+                v = cabeza[k]
+                if cap[k] > 0 and dist[u] + costo[k] < dist[v]:
+                    dist[v] = dist[u] + costo[k]
+                    # Una ruta más corta con n arcos o más repite un nodo: ciclo
+                    # negativo (un lazo negativo la alarga en cada pasada)
+                    arcos_camino[v] = arcos_camino[u] + 1
+                    if arcos_camino[v] >= self.n:
+                        raise ValueError("La red tiene un ciclo de costo negativo")
+                    if not en_cola[v]:
+                        en_cola[v] = True
+                        cola.append(v)
+
+        return dist
+
+    def dijkstra(self, origenes, potencial, destinos=(), minimo=0):
+        """
+        Dijkstra con costos reducidos sobre los arcos con capacidad > minimo,
+        desde varios orígenes a la vez; se detiene al fijar el primer destino.
+
+        Returns:
+            tuple: (distancias reducidas, arco por el que se llegó a cada nodo,
+                    destino alcanzado o -1)
+        """
+        cabeza, cap, costo, adyacentes, inicio = (
+            self.cabeza, self.capacidad, self.costo, self.adyacentes, self.inicio
+        )
+        dist = [math.inf] * self.n
+        arco_padre = [-1] * self.n
+        fijado = [False] * self.n
+        for s in origenes:
+            dist[s] = 0
+        cola = [(0, s) for s in origenes]
+
+        while cola:
+            d_u, u = heapq.heappop(cola)
+            if fijado[u]:
+                continue
+            fijado[u] = True
+            if u in destinos:
+                return dist, arco_padre, u
+
+            p_u = potencial[u]
+            for k in adyacentes[inicio[u]:inicio[u + 1]]:
+                if cap[k] > minimo:
+                    v = cabeza[k]
+                    nueva = d_u + costo[k] + p_u - potencial[v]
+                    if nueva < dist[v] and not fijado[v]:
+                        dist[v] = nueva
+                        arco_padre[v] = k
+                        heapq.heappush(cola, (nueva, v))
+
+        return dist, arco_padre, -1
+
+    def camino(self, t, arco_padre):
+        """Arcos residuales desde el origen de la búsqueda hasta t según arco_padre"""
         ruta = []
-        actual = destino
-        while actual != origen:
-            arco = prev[actual]
-            ruta.insert(0, arco)
-            actual = arco["origen"]
+        v = t
+        while arco_padre[v] != -1:
+            k = arco_padre[v]
+            ruta.append(k)
+            v = self.cabeza[k ^ 1]
+        ruta.reverse()
+        return ruta
+
+    def aumentar(self, ruta, cantidad):
+        for k in ruta:
+            self.capacidad[k] -= cantidad
+            self.capacidad[k ^ 1] += cantidad
+
+    def nombres_camino(self, ruta):
+        nombres, cabeza = self.nombres, self.cabeza
+        return [(nombres[cabeza[k ^ 1]], nombres[cabeza[k]]) for k in ruta]
 
-        return ruta, dist[destino]
+    def flujos(self):
+        """{(origen, destino): flujo} de los arcos originales con flujo (paralelos sumados)"""
+        flujos = {}
+        for i in range(len(self.capacidad_original)):
+            enviado = self.capacidad[2 * i + 1]
+            if enviado > 0:
+                par = (self.nombres[self.cabeza[2 * i + 1]], self.nombres[self.cabeza[2 * i]])
+                flujos[par] = flujos.get(par, 0) + enviado
+        return flujos
@@ -1,12 +1,49 @@
+"""
+models/redes/flujo_maximo.py
+Flujo máximo entre dos nodos de la red de distribución
+
+Métodos (parámetro `metodo` de FlujoMaximo.resolver):
+- 'edmonds_karp': caminos de aumento más cortos (BFS), uno por iteración.
+  Es el método de clase y el que muestran las vistas paso a paso.
+- 'dinic': grafo de niveles + flujo bloqueante con punteros al arco actual.
+- 'push_relabel': preflujo con selección del nodo activo más alto y
+  heurística de brecha (gap); no usa caminos de aumento.
+
+Los tres trabajan sobre una red residual en listas: el arco k y su inverso
+k ^ 1 guardan su capacidad residual en la misma lista, y los arcos que salen
+de cada nodo son un tramo contiguo (como en la forma CSR).
+
+Al terminar, una BFS sobre la red residual da el corte mínimo s–t: los nodos
+alcanzables desde s y los arcos que salen de ellos hacia el resto, que son
+los que limitan el flujo (cuellos de botella).
+"""
+
 from collections import deque, defaultdict
 import math
 
+from .adaptadores import arcos_de_red
+
+
+METODOS_FLUJO = ("edmonds_karp", "dinic", "push_relabel")
+
 
 class FlujoMaximo:
     def __init__(self, nodos):
         self.nodos = nodos
         self.capacidad = defaultdict(dict)
 
+    @classmethod
+    def desde_red(cls, red):
+        """Construye el problema desde una Red o una RedCSR (arcos paralelos suman capacidad)"""
+        capacidades = {}
+        for origen, destino, _, capacidad, _ in arcos_de_red(red):
+            capacidades[(origen, destino)] = capacidades.get((origen, destino), 0) + capacidad
+
+        flujo = cls(list(red.nodos))
+        for (u, v), cap in capacidades.items():
+            flujo.agregar_arco(u, v, cap)
+        return flujo
+
     def agregar_arco(self, u, v, cap):
         # arco directo
         self.capacidad[u][v] = cap
@@ -14,56 +51,347 @@ class FlujoMaximo:
         if u not in self.capacidad[v]:
             self.capacidad[v][u] = 0
 
-    def bfs(self, origen, destino, padre):
-        visitado = {n: False for n in self.nodos}
-        cola = deque([origen])
-        visitado[origen] = True
-        padre.clear()
+    def resolver(self, origen, destino, metodo="edmonds_karp"):
+        """
+        Calcula el flujo máximo de origen a destino. Las capacidades
+        originales (self.capacidad) no se modifican.
+
+        Args:
+            origen: Nodo fuente
+            destino: Nodo sumidero
+            metodo: 'edmonds_karp', 'dinic' o 'push_relabel'
+
+        Returns:
+            dict: {
+                'flujo_maximo': valor (math.inf si hay un camino de capacidad infinita),
+                'iteraciones': caminos aumentados [{'ruta', 'flujo_enviado', 'flujo_acumulado'}]
+                               (vacío con push_relabel),
+                'flujos': [{'origen', 'destino', 'capacidad', 'flujo'}] por arco,
+                'corte_minimo': {
+                    'alcanzables': nodos del lado del origen,
+                    'arcos': [{'origen', 'destino', 'capacidad'}] arcos saturados del corte,
+                    'capacidad': suma de sus capacidades (= flujo máximo)
+                },
+                'metodo': método usado
+            }
+        """
+        if metodo not in METODOS_FLUJO:
+            raise ValueError(f"Método de flujo máximo desconocido: {metodo}")
+        if origen == destino:
+            raise ValueError("El origen y el destino deben ser distintos")
+
+        residual = _RedResidual(self.nodos, self.capacidad)
+        for nodo in (origen, destino):
+            if nodo not in residual.indice:
+                raise ValueError(f"Nodo inválido: {nodo}")
+        s, t = residual.indice[origen], residual.indice[destino]
+
+        if metodo == "edmonds_karp":
+            flujo_maximo, iteraciones = residual.edmonds_karp(s, t)
+        elif metodo == "dinic":
+            flujo_maximo, iteraciones = residual.dinic(s, t)
+        else:
+            flujo_maximo, iteraciones = residual.push_relabel(s, t), []
+
+        if flujo_maximo >= residual.infinito:
+            flujo_maximo = math.inf
+
+        return {
+            "flujo_maximo": flujo_maximo,
+            "iteraciones": iteraciones,
+            "flujos": residual.flujos(),
+            "corte_minimo": residual.corte_minimo(s),
+            "metodo": metodo
+        }
+
+
+class _RedResidual:
+    """
+    Red residual en listas de Python.
+
+    El arco original i ocupa las posiciones 2i (directo) y 2i + 1 (inverso,
+    capacidad inicial 0). Los arcos que salen del nodo u (directos e
+    inversos) son adyacentes[inicio[u]:inicio[u + 1]].
+    """
+
+    def __init__(self, nodos, capacidades):
+        self.nombres = list(nodos)
+        self.indice = {nombre: i for i, nombre in enumerate(self.nombres)}
+        for u, salientes in capacidades.items():
+            for nombre in (u, *salientes):
+                if nombre not in self.indice:
+                    self.indice[nombre] = len(self.nombres)
+                    self.nombres.append(nombre)
+        n = len(self.nombres)
+
+        arcos = [(u, v, cap) for u, salientes in capacidades.items()
+                 for v, cap in salientes.items() if cap > 0]
+
+        # Capacidad infinita: se reemplaza por una cota mayor que cualquier
+        # corte finito; un flujo que la alcance indica flujo no acotado
+        self.infinito = sum(cap for _, _, cap in arcos if cap != math.inf) + 1
+
+        self.cabeza = []
+        self.capacidad = []
+        self.arcos = []  # (u, v, capacidad original) de cada arco directo
+        grado = [0] * n
+        for u, v, cap in arcos:
+            iu, iv = self.indice[u], self.indice[v]
+            self.arcos.append((iu, iv, cap))
+            self.cabeza += [iv, iu]
+            self.capacidad += [self.infinito if cap == math.inf else cap, 0]
+            grado[iu] += 1
+            grado[iv] += 1
+
+        self.inicio = [0] * (n + 1)
+        for u in range(n):
+            self.inicio[u + 1] = self.inicio[u] + grado[u]
+        siguiente = self.inicio[:-1]
+        self.adyacentes = [0] * len(self.cabeza)
+        for k in range(len(self.cabeza)):
+            u = self.cabeza[k ^ 1]
+            self.adyacentes[siguiente[u]] = k
+            siguiente[u] += 1
+
+        self.n = n
 
+    def flujos(self):
+        """Flujo de cada arco original: lo que el inverso ganó de capacidad residual"""
+        nombres = self.nombres
+        return [
+            {
+                "origen": nombres[u],
+                "destino": nombres[v],
+                "capacidad": cap,
+                "flujo": self.capacidad[2 * i + 1]
+            }
+            for i, (u, v, cap) in enumerate(self.arcos)
+        ]
+
+    def corte_minimo(self, s):
+        """Corte mínimo s–t a partir de una sola BFS sobre la red residual final"""
+        cabeza, cap, adyacentes, inicio = self.cabeza, self.capacidad, self.adyacentes, self.inicio
+        alcanzable = [False] * self.n
+        alcanzable[s] = True
+        cola = deque([s])
         while cola:
             u = cola.popleft()
-            for v, cap in self.capacidad[u].items():
-                if not visitado[v] and cap > 0:
-                    visitado[v] = True
-                    padre[v] = u
+            for k in adyacentes[inicio[u]:inicio[u + 1]]:
+                v = cabeza[k]
+                if cap[k] > 0 and not alcanzable[v]:
+                    alcanzable[v] = True
                     cola.append(v)
-                    if v == destino:
-                        return True
-        return False
-
-    def resolver(self, origen, destino):
-        padre = {}
-        flujo_maximo = 0
-        iteraciones = []
-
-        while self.bfs(origen, destino, padre):
-            # cuello de botella
-            flujo_camino = math.inf
-            v = destino
-            ruta = []
-
-            while v != origen:
-                u = padre[v]
-                flujo_camino = min(flujo_camino, self.capacidad[u][v])
-                ruta.append((u, v))
-                v = u
-
-            ruta.reverse()
-
-            # actualizar red residual
-            for u, v in ruta:
-                self.capacidad[u][v] -= flujo_camino
-                self.capacidad[v][u] += flujo_camino
-
-            flujo_maximo += flujo_camino
-
-            iteraciones.append({
-                "ruta": ruta,
-                "flujo_enviado": flujo_camino,
-                "flujo_acumulado": flujo_maximo
-            })
 
+        arcos = [
+            {"origen": self.nombres[u], "destino": self.nombres[v], "capacidad": c}
+            for u, v, c in self.arcos if alcanzable[u] and not alcanzable[v]
+        ]
         return {
-            "flujo_maximo": flujo_maximo,
-            "iteraciones": iteraciones
+            "alcanzables": [self.nombres[u] for u in range(self.n) if alcanzable[u]],
+            "arcos": arcos,
+            "capacidad": sum(arco["capacidad"] for arco in arcos)
         }
+
+    def _registrar(self, arcos_camino, enviado, acumulado, iteraciones):
+        """Agrega un camino aumentado (con nombres) a las iteraciones"""
+        nombres, cabeza = self.nombres, self.cabeza
+        iteraciones.append({
+            "ruta": [(nombres[cabeza[k ^ 1]], nombres[cabeza[k]]) for k in arcos_camino],
+            "flujo_enviado": enviado,
+            "flujo_acumulado": acumulado
+        })
+
+    def edmonds_karp(self, s, t):
+        """
+        Caminos de aumento por BFS. Las marcas de visita se reutilizan entre
+        búsquedas con un número de versión (sin un diccionario por BFS).
+        """
+        cabeza, cap, adyacentes, inicio = self.cabeza, self.capacidad, self.adyacentes, self.inicio
+        marca = [0] * self.n
+        arco_padre = [-1] * self.n
+        flujo, iteraciones = 0, []
+        version = 0
+
+        while True:
+            version += 1
+            marca[s] = version
+            cola = deque([s])
+            encontrado = False
+
+            while cola and not encontrado:
+                u = cola.popleft()
+                for k in adyacentes[inicio[u]:inicio[u + 1]]:
+                    v = cabeza[k]
+                    if cap[k] > 0 and marca[v] != version:
+                        marca[v] = version
+                        arco_padre[v] = k
+                        if v == t:
+                            encontrado = True
+                            break
+                        cola.append(v)
+
+            if not encontrado:
+                return flujo, iteraciones
+
+            camino = []
+            v = t
+            while v != s:
+                k = arco_padre[v]
+                camino.append(k)
+                v = cabeza[k ^ 1]
+            camino.reverse()
+
+            enviado = min(cap[k] for k in camino)
+            for k in camino:
+                cap[k] -= enviado
+                cap[k ^ 1] += enviado
+            flujo += enviado
+            self._registrar(camino, enviado, flujo, iteraciones)
+
+    def dinic(self, s, t):
+        """
+        Dinic: BFS de niveles desde s y, en cada fase, flujo bloqueante por
+        DFS iterativa que sólo avanza a nivel + 1. Cada nodo recuerda su arco
+        actual, así cada arco se descarta una sola vez por fase.
+        """
+        cabeza, cap, adyacentes, inicio = self.cabeza, self.capacidad, self.adyacentes, self.inicio
+        flujo, iteraciones = 0, []
+
+        while True:
+            nivel = [-1] * self.n
+            nivel[s] = 0
+            cola = deque([s])
+            while cola:
+                u = cola.popleft()
+                for k in adyacentes[inicio[u]:inicio[u + 1]]:
+                    v = cabeza[k]
+                    if cap[k] > 0 and nivel[v] < 0:
+                        nivel[v] = nivel[u] + 1
+                        cola.append(v)
+            if nivel[t] < 0:
+                return flujo, iteraciones
+
+            actual = inicio[:-1]
+            camino = []
+            u = s
+            while True:
+                if u == t:
+                    enviado = min(cap[k] for k in camino)
+                    for k in camino:
+                        cap[k] -= enviado
+                        cap[k ^ 1] += enviado
+                    flujo += enviado
+                    self._registrar(camino, enviado, flujo, iteraciones)
+
+                    # Retroceder hasta la cola del primer arco saturado
+                    corte = next(i for i, k in enumerate(camino) if cap[k] == 0)
+                    u = cabeza[camino[corte] ^ 1]
+                    del camino[corte:]
+                    continue
+
+                fin = inicio[u + 1]
+                while actual[u] < fin:
+                    k = adyacentes[actual[u]]
+                    v = cabeza[k]
+                    if cap[k] > 0 and nivel[v] == nivel[u] + 1:
+                        break
+                    actual[u] += 1
+
+                if actual[u] < fin:
+                    camino.append(adyacentes[actual[u]])
+                    u = cabeza[camino[-1]]
+                elif u == s:
+                    break
+                else:
+                    # Callejón sin salida: se descarta u en esta fase
+                    nivel[u] = -1
+                    u = cabeza[camino.pop() ^ 1]
+                    actual[u] += 1
+
+    def push_relabel(self, s, t):
+        """
+        Push-relabel con el nodo activo de mayor altura, alturas iniciales por
+        BFS inversa desde t y heurística de brecha: si ningún nodo queda a
+        una altura h < n, los nodos por encima ya no alcanzan t y suben a n + 1.
+
+        Returns:
+            Valor del flujo máximo (el exceso acumulado en t)
+        """
+        cabeza, cap, adyacentes, inicio = self.cabeza, self.capacidad, self.adyacentes, self.inicio
+        n = self.n
+
+        # Alturas iniciales: distancia a t en la red residual
+        altura = [n] * n
+        altura[t] = 0
+        cola = deque([t])
+        while cola:
+            v = cola.popleft()
+            for k in adyacentes[inicio[v]:inicio[v + 1]]:
+                u = cabeza[k]
+                if cap[k ^ 1] > 0 and altura[u] == n and u != s:
+                    altura[u] = altura[v] + 1
+                    cola.append(u)
+        altura[s] = n
+
+        cuenta = [0] * (2 * n + 1)
+        for h in altura:
+            cuenta[h] += 1
+
+        exceso = [0] * n
+        activos = [[] for _ in range(2 * n + 1)]
+        mas_alto = 0
+        for k in adyacentes[inicio[s]:inicio[s + 1]]:
+            v, c = cabeza[k], cap[k]
+            if c > 0:
+                cap[k] = 0
+                cap[k ^ 1] += c
+                if exceso[v] == 0 and v != t:
+                    activos[altura[v]].append(v)
+                    mas_alto = max(mas_alto, altura[v])
+                exceso[v] += c
+                exceso[s] -= c
+
+        actual = inicio[:-1]
+        while mas_alto >= 0:
+            if not activos[mas_alto]:
+                mas_alto -= 1
+                continue
+            u = activos[mas_alto].pop()
+
+            # Descargar u
+            while exceso[u] > 0:
+                if actual[u] == inicio[u + 1]:
+                    # Reetiquetar: una unidad sobre el vecino residual más bajo
+                    anterior = altura[u]
+                    nueva = 2 * n
+                    for k in adyacentes[inicio[u]:inicio[u + 1]]:
+                        if cap[k] > 0 and altura[cabeza[k]] + 1 < nueva:
+                            nueva = altura[cabeza[k]] + 1
+                    cuenta[anterior] -= 1
+                    altura[u] = nueva
+                    cuenta[nueva] += 1
+                    actual[u] = inicio[u]
+
+                    if anterior < n and cuenta[anterior] == 0:
+                        for w in range(n):
+                            if anterior < altura[w] < n + 1 and w != s:
+                                cuenta[altura[w]] -= 1
+                                altura[w] = n + 1
+                                cuenta[n + 1] += 1
+                    continue
+
+                k = adyacentes[actual[u]]
+                v = cabeza[k]
+                if cap[k] > 0 and altura[u] == altura[v] + 1:
+                    enviado = min(exceso[u], cap[k])
+                    cap[k] -= enviado
+                    cap[k ^ 1] += enviado
+                    exceso[u] -= enviado
+                    if exceso[v] == 0 and v != s and v != t:
+                        activos[altura[v]].append(v)
+                        mas_alto = max(mas_alto, altura[v])
+                    exceso[v] += enviado
+                else:
+                    actual[u] += 1
+
+        return exceso[t]
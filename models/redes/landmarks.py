@@ -0,0 +1,209 @@
+"""
+models/redes/landmarks.py
+Preprocesamiento ALT (A*, Landmarks y desigualdad Triangular) para consultas
+repetidas de ruta más corta sobre una red estática
+
+Se eligen unos pocos nodos de referencia (landmarks) y se guardan las
+distancias desde y hacia cada uno. Por la desigualdad triangular,
+para cualquier landmark L:
+
+    d(v, t) >= d(L, t) - d(L, v)      y      d(v, t) >= d(v, L) - d(t, L)
+
+La mayor de estas cotas guía un A* que fija sólo una fracción de los nodos
+que fijaría Dijkstra. El preprocesamiento se guarda en disco (np.savez) con
+la huella de la red, y al cargarlo se comprueba que la red no haya cambiado.
+"""
+
+import numpy as np
+
+from .csr import RedCSR, como_csr
+from .ruta_corta import RutaMasCorta
+from .todos_pares import huella_red
+
+
+class LandmarksALT:
+    """
+    Distancias desde y hacia los landmarks, y consultas A* con esas cotas.
+
+    Uso:
+        alt = LandmarksALT.preprocesar(red, num_landmarks=8)
+        alt.guardar("red_alt.npz")
+        ...
+        alt = LandmarksALT.cargar("red_alt.npz", red)
+        alt.consultar("Planta_Quito", "SupermercadoB")
+    """
+
+    def __init__(self, red, landmarks, desde, hacia, campo="distancia"):
+        """
+        Args:
+            red: Red o RedCSR sobre la que se calcularon las distancias
+            landmarks: Índices de los nodos landmark
+            desde: Matriz k×n con d(L, v)
+            hacia: Matriz k×n con d(v, L)
+            campo: Peso de los arcos ('distancia' o 'costo')
+        """
+        self.csr = como_csr(red)
+        self.campo = campo
+        self.landmarks = np.asarray(landmarks, dtype=np.int64)
+        self.desde = np.asarray(desde, dtype=np.float64)
+        self.hacia = np.asarray(hacia, dtype=np.float64)
+
+        forma = (self.landmarks.size, self.csr.num_nodos)
+        if self.desde.shape != forma or self.hacia.shape != forma:
+            raise ValueError(f"Las distancias de los landmarks deben ser {forma[0]}×{forma[1]}")
+
+        self._dijkstra = RutaMasCorta.desde_red(self.csr, campo)
+        # Distancias de cada nodo a los k landmarks en filas contiguas (n×k)
+        self._desde_nodo = np.ascontiguousarray(self.desde.T)
+        self._hacia_nodo = np.ascontiguousarray(self.hacia.T)
+
+    @classmethod
+    def preprocesar(cls, red, campo="distancia", num_landmarks=8, semilla=0):
+        """
+        Elige los landmarks por el método del más lejano y calcula sus
+        distancias: 2 Dijkstra completos por landmark (red directa e inversa).
+
+        Args:
+            red: Red o RedCSR
+            campo: Peso de los arcos ('distancia' o 'costo')
+            num_landmarks: Cantidad de landmarks
+            semilla: Semilla para elegir el primer landmark
+
+        Returns:
+            LandmarksALT
+        """
+        csr = como_csr(red)
+        n = csr.num_nodos
+        if num_landmarks < 1:
+            raise ValueError("Se requiere al menos un landmark")
+        num_landmarks = min(num_landmarks, n)
+
+        peso = csr.peso(campo)
+        inversa = RedCSR(csr.nodos, csr.destino, csr.origen, **{campo: peso})
+        directa = RutaMasCorta.desde_red(csr, campo)
+        reversa = RutaMasCorta.desde_red(inversa, campo)
+
+        landmarks = [int(np.random.default_rng(semilla).integers(n))]
+        desde, hacia = [], []
+        cercania = np.full(n, np.inf)
+
+        while True:
+            directa.resolver(landmarks[-1])
+            reversa.resolver(landmarks[-1])
+            desde.append(np.array(directa.dist))
+            hacia.append(np.array(reversa.dist))
+            if len(landmarks) == num_landmarks:
+                break
+
+            # Siguiente landmark: el nodo más alejado (ida y vuelta) de los elegidos;
+            # los nodos inalcanzables desde los anteriores tienen prioridad
+            recorrido = desde[-1] + hacia[-1]
+            recorrido[np.isinf(recorrido)] = np.finfo(float).max
+            cercania = np.minimum(cercania, recorrido)
+            cercania[landmarks] = -1
+            landmarks.append(int(np.argmax(cercania)))
+
+        return cls(csr, landmarks, np.vstack(desde), np.vstack(hacia), campo)
+
+    def guardar(self, ruta):
+        """Guarda el preprocesamiento (con la huella de la red) en un archivo .npz"""
+        np.savez(
+            ruta,
+            landmarks=self.landmarks,
+            desde=self.desde,
+            hacia=self.hacia,
+            campo=np.array(self.campo),
+            huella=np.array(huella_red(self.csr, self.campo))
+        )
+
+    @classmethod
+    def cargar(cls, ruta, red):
+        """
+        Carga un preprocesamiento guardado con guardar().
+
+        Args:
+            ruta: Archivo .npz
+            red: Red o RedCSR actual; debe coincidir con la del preprocesamiento
+
+        Returns:
+            LandmarksALT
+        """
+        csr = como_csr(red)
+        with np.load(ruta, allow_pickle=False) as datos:
+            campo = str(datos["campo"])
+            if str(datos["huella"]) != huella_red(csr, campo):
+                raise ValueError("La red cambió desde el preprocesamiento; vuelva a ejecutar preprocesar()")
+            return cls(csr, datos["landmarks"], datos["desde"], datos["hacia"], campo)
+
+    def cota(self, destino_idx):
+        """
+        Cota inferior de d(v, destino) por nodo. Se calcula al consultarla
+        (máximo sobre los k landmarks) y sólo para los nodos que alcanza el
+        A*, así una consulta local no recorre los n nodos de la red.
+
+        Returns:
+            _CotaLandmarks: Indexable por nodo (inf si v no puede llegar al destino)
+        """
+        return _CotaLandmarks(self._desde_nodo, self._hacia_nodo, destino_idx)
+
+    def consultar(self, origen, destino):
+        """
+        Ruta más corta entre dos nodos con A* guiado por los landmarks.
+
+        Las búsquedas reutilizan un mismo espacio de trabajo de Dijkstra
+        (listas marcadas por versión), sin crear listas de tamaño V por consulta.
+
+        Args:
+            origen: Nombre del nodo origen
+            destino: Nombre del nodo destino
+
+        Returns:
+            dict: Igual que RutaMasCorta.resolver(origen, destino)
+        """
+        try:
+            origen_idx, destino_idx = self.csr.indice[origen], self.csr.indice[destino]
+        except KeyError as e:
+            raise ValueError(f"Nodo inválido: {e.args[0]}") from None
+
+        espacio = self._dijkstra._espacio_trabajo()
+        encontrada = espacio.ruta(origen_idx, destino_idx, cota=self.cota(destino_idx))
+        distancia, ruta = "∞", []
+        if encontrada is not None:
+            distancia = encontrada[0]
+            ruta = espacio.nodos(origen_idx, encontrada[1])
+
+        nodos = self.csr.nodos
+        return {
+            "origen": origen,
+            "destino": destino,
+            "distancia": distancia,
+            "ruta": " → ".join(nodos[v] for v in ruta),
+            "ruta_indices": ruta,
+            "nodos_explorados": espacio.explorados
+        }
+
+
+class _CotaLandmarks:
+    """Cotas ALT hacia un destino, calculadas y guardadas nodo a nodo"""
+
+    def __init__(self, desde_nodo, hacia_nodo, destino_idx):
+        self.desde_nodo = desde_nodo
+        self.hacia_nodo = hacia_nodo
+        self.desde_destino = desde_nodo[destino_idx].tolist()
+        self.hacia_destino = hacia_nodo[destino_idx].tolist()
+        self.valores = {}
+
+    def __getitem__(self, v):
+        valor = self.valores.get(v)
+        if valor is None:
+            valor = 0.0
+            # inf - inf (el landmark no alcanza a ninguno de los dos) da NaN y la
+            # comparación lo descarta; +inf indica que v no puede llegar al destino
+            for d_lt, d_lv, d_vl, d_tl in zip(self.desde_destino, self.desde_nodo[v].tolist(),
+                                              self.hacia_nodo[v].tolist(), self.hacia_destino):
+                if d_lt - d_lv > valor:
+                    valor = d_lt - d_lv
+                if d_vl - d_tl > valor:
+                    valor = d_vl - d_tl
+            self.valores[v] = valor
+        return valor
@@ -3,6 +3,8 @@ Red de distribución Coca-Cola
 Adapta la clase Red para manejar plantas, centros de distribución y puntos de venta
 """
 
+from .csr import RedCSR
+
 
 class Red:
     def __init__(self, nodos):
@@ -13,9 +15,17 @@ class Red:
         self.arcos = []
         self.oferta_demanda = {n: 0 for n in self.nodos}
         self.tipos_nodo = {}  # Para clasificar nodos: 'planta', 'distribucion', 'venta'
+        self.coordenadas = {}  # Opcional: {nodo: (latitud, longitud)} para A*
+
+        # Índices de adyacencia mantenidos por agregar_arco: los arcos que salen
+        # y llegan a cada nodo, y (origen, destino) -> arco. Los vecinos de un
+        # nodo se obtienen en O(grado) y un arco en O(1), sin recorrer self.arcos.
+        self.salientes = {n: [] for n in self.nodos}
+        self.entrantes = {n: [] for n in self.nodos}
+        self.indice_arcos = {}
 
     def agregar_arco(self, origen, destino, costo=0, capacidad=float("inf"), distancia=0):
-        if origen not in self.nodos or destino not in self.nodos:
+        if origen not in self.salientes or destino not in self.salientes:
             raise ValueError(f"Arco inválido: {origen} -> {destino}")
 
         if capacidad < 0:
@@ -30,20 +40,33 @@ class Red:
         }
 
         self.arcos.append(arco)
+        self.salientes[origen].append(arco)
+        self.entrantes[destino].append(arco)
+        # Con arcos paralelos se conserva el primero, como hacía la búsqueda lineal
+        self.indice_arcos.setdefault((origen, destino), arco)
 
     def set_oferta_demanda(self, nodo, valor):
-        if nodo not in self.nodos:
+        if nodo not in self.salientes:
             raise ValueError(f"Nodo inválido: {nodo}")
 
         self.oferta_demanda[nodo] = valor
 
     def set_tipo_nodo(self, nodo, tipo):
         """Clasifica el tipo de nodo: 'planta', 'distribucion', 'venta'"""
-        if nodo not in self.nodos:
+        if nodo not in self.salientes:
             raise ValueError(f"Nodo inválido: {nodo}")
 
         self.tipos_nodo[nodo] = tipo
 
+    def set_coordenadas(self, nodo, latitud, longitud):
+        """Ubicación geográfica del nodo en grados (usada por la heurística de A*)"""
+        if nodo not in self.salientes:
+            raise ValueError(f"Nodo inválido: {nodo}")
+        if not (-90 <= latitud <= 90 and -180 <= longitud <= 180):
+            raise ValueError(f"Coordenadas inválidas para {nodo}: ({latitud}, {longitud})")
+
+        self.coordenadas[nodo] = (latitud, longitud)
+
     def validar_balance(self):
         total = sum(self.oferta_demanda.values())
         if total != 0:
@@ -53,16 +76,24 @@ class Red:
             )
 
     def obtener_vecinos(self, nodo):
-        return [
-            arco for arco in self.arcos
-            if arco["origen"] == nodo
-        ]
+        return list(self.salientes.get(nodo, []))
+
+    def obtener_entrantes(self, nodo):
+        return list(self.entrantes.get(nodo, []))
 
     def obtener_arco(self, origen, destino):
-        for arco in self.arcos:
-            if arco["origen"] == origen and arco["destino"] == destino:
-                return arco
-        return None
+        return self.indice_arcos.get((origen, destino))
+
+    def congelar(self):
+        """
+        Convierte la red a su forma compacta CSR (arreglos NumPy), que aceptan
+        todos los algoritmos de models/redes. Los cambios posteriores a la Red
+        no se reflejan en la copia congelada.
+
+        Returns:
+            RedCSR
+        """
+        return RedCSR.desde_red(self)
 
     def __repr__(self):
         return (
@@ -5,21 +5,133 @@ Adaptado para la red de distribución Coca-Cola
 
 import heapq
 import math
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+
+from .csr import como_csr
+
+
+RADIO_TIERRA_KM = 6371.0088
 
 
 class RutaMasCorta:
-    def __init__(self, matriz_distancias, nodos):
+    """
+    Dijkstra desde un origen.
+
+    Dos formas de construirlo:
+    - RutaMasCorta(matriz, nodos): matriz n×n de distancias (ejemplos pequeños
+      de clase); cada nodo fijado revisa las n columnas, O(V²).
+    - RutaMasCorta.desde_red(red): recorre sólo los arcos salientes de la
+      forma CSR de la red con una cola de prioridad, O((V + E) log V).
+
+    Guardar cada iteración (distancias y predecesores de todos los nodos)
+    cuesta O(V) por nodo fijado; en redes grandes conviene desactivarlo con
+    registrar_iteraciones=False.
+
+    Para una sola consulta origen → destino, resolver(origen, destino) se
+    detiene al fijar el destino y, con bidireccional=True (sólo desde_red),
+    busca a la vez desde ambos extremos. Las rutas del árbol completo se
+    reconstruyen sólo cuando se consultan.
+
+    k_rutas(origen, destino, k) da rutas alternativas sin ciclos (Yen).
+
+    Con a_estrella=True (sólo desde_red, con coordenadas en todos los nodos)
+    la cola se ordena por distancia + cota inferior: la distancia en línea
+    recta (haversine) hasta el destino multiplicada por una escala de peso
+    por km. Por defecto la escala es el menor peso/km de los arcos de la red,
+    lo que hace la cota admisible y consistente para cualquier campo.
+    """
+
+    def __init__(self, matriz_distancias, nodos, registrar_iteraciones=True):
         self.matriz = matriz_distancias
         self.nodos = nodos
         self.n = len(nodos)
+        self.registrar_iteraciones = registrar_iteraciones
+
+        # Forma CSR (sólo con desde_red)
+        self.csr = None
+        self.campo = None
+        self.escala_heuristica = None
 
         self.dist = [math.inf] * self.n
         self.pred = [-1] * self.n
         self.visitados = set()
         self.iteraciones = []
 
-    def resolver(self, origen_idx):
-        """Resuelve el problema de ruta más corta desde un origen"""
+        self._directa = None
+        self._inversa = None
+        self._espacio = None
+
+    @classmethod
+    def desde_red(cls, red, campo="distancia", registrar_iteraciones=False, escala_heuristica=None):
+        """
+        Construye el problema sobre la lista de adyacencia (CSR) de la red,
+        sin matriz n×n.
+
+        Args:
+            red: Red o RedCSR
+            campo: Peso de los arcos ('distancia' o 'costo')
+            registrar_iteraciones: Guardar el estado de cada iteración
+            escala_heuristica: Peso mínimo por km en línea recta para A*
+                               (por defecto se calcula de los arcos)
+        """
+        csr = como_csr(red)
+        if csr.num_arcos and csr.peso(campo).min() < 0:
+            raise ValueError("Dijkstra requiere pesos no negativos")
+
+        ruta = cls(None, csr.nodos, registrar_iteraciones)
+        ruta.csr = csr
+        ruta.campo = campo
+        ruta.escala_heuristica = escala_heuristica
+        return ruta
+
+    def resolver(self, origen_idx, destino_idx=None, bidireccional=False, a_estrella=False, cota=None):
+        """
+        Resuelve el problema de ruta más corta desde un origen.
+
+        Args:
+            origen_idx: Índice del nodo origen
+            destino_idx: Índice del destino; si se indica, la búsqueda termina
+                         al fijarlo y se devuelve sólo esa ruta
+            bidireccional: Buscar desde el origen y desde el destino a la vez
+                           (requiere destino_idx y desde_red)
+            a_estrella: Guiar la búsqueda con la distancia geográfica al
+                        destino (requiere destino_idx, desde_red y coordenadas)
+            cota: Cota inferior de la distancia al destino indexable por nodo
+                  (p. ej. de LandmarksALT); guía la búsqueda como A*
+
+        Returns:
+            dict: Sin destino: {'origen', 'predecesores', 'rutas'}.
+                  Con destino: {'origen', 'destino', 'distancia', 'ruta',
+                  'ruta_indices', 'nodos_explorados'}.
+        """
+        self.dist = [math.inf] * self.n
+        self.pred = [-1] * self.n
+        self.visitados = set()
+        self.iteraciones = []
+
+        if a_estrella or cota is not None:
+            if destino_idx is None:
+                raise ValueError("A* requiere un destino")
+            if bidireccional:
+                raise ValueError("A* no se combina con la búsqueda bidireccional")
+            if self.csr is None:
+                raise ValueError("A* requiere construir con desde_red")
+            if cota is None:
+                cota = self._heuristica(destino_idx)
+            return self._resolver_csr(origen_idx, destino_idx, cota)
+
+        if bidireccional:
+            if destino_idx is None:
+                raise ValueError("La búsqueda bidireccional requiere un destino")
+            if self.csr is None:
+                raise ValueError("La búsqueda bidireccional requiere construir con desde_red")
+            return self._resolver_bidireccional(origen_idx, destino_idx)
+
+        if self.csr is not None:
+            return self._resolver_csr(origen_idx, destino_idx)
+
         self.dist[origen_idx] = 0
         cola = [(0, origen_idx)]
 
@@ -67,10 +179,281 @@ class RutaMasCorta:
                 relajaciones=relajaciones
             )
 
+            if u == destino_idx:
+                break
+
+        if destino_idx is not None:
+            return self._resultado_punto(origen_idx, destino_idx, self._reconstruir(destino_idx))
+        return self._resultado_final(origen_idx)
+
+    def _adyacencia(self):
+        """Listas (inicio, destino, peso) de la forma CSR, convertidas una sola vez"""
+        if self._directa is None:
+            self._directa = (
+                self.csr.inicio.tolist(),
+                self.csr.destino.tolist(),
+                self.csr.peso(self.campo).tolist()
+            )
+        return self._directa
+
+    def _adyacencia_inversa(self):
+        """Listas (inicio, origen, peso) de los arcos agrupados por nodo destino"""
+        if self._inversa is None:
+            inicio, orden = self.csr.entrantes()
+            self._inversa = (
+                inicio.tolist(),
+                self.csr.origen[orden].tolist(),
+                self.csr.peso(self.campo)[orden].tolist()
+            )
+        return self._inversa
+
+    def _heuristica(self, destino_idx):
+        """Cota inferior de la distancia de cada nodo al destino (lista)"""
+        csr = self.csr
+        if not csr.tiene_coordenadas:
+            raise ValueError("A* requiere coordenadas (latitud, longitud) en todos los nodos")
+
+        if self.escala_heuristica is None:
+            # Menor peso por km de los arcos: peso(u, v) >= escala · haversine(u, v)
+            km = haversine(csr.latitud[csr.origen], csr.longitud[csr.origen],
+                           csr.latitud[csr.destino], csr.longitud[csr.destino])
+            con_recorrido = km > 0
+            if con_recorrido.any():
+                # Margen relativo para que el redondeo no vuelva la cota inadmisible
+                escala = float((csr.peso(self.campo)[con_recorrido] / km[con_recorrido]).min())
+                self.escala_heuristica = max(escala, 0.0) * (1 - 1e-9)
+            else:
+                self.escala_heuristica = 0.0
+
+        km = haversine(csr.latitud, csr.longitud, csr.latitud[destino_idx], csr.longitud[destino_idx])
+        return (self.escala_heuristica * km).tolist()
+
+    def _resolver_csr(self, origen_idx, destino_idx=None, heuristica=None):
+        """
+        Dijkstra con cola de prioridad sobre los arcos salientes de cada nodo.
+        Con una heurística (A*), la clave de la cola es distancia + heurística.
+        """
+        inicio, destino, peso = self._adyacencia()
+        dist, pred = self.dist, self.pred
+        fijado = [False] * self.n
+        explorados = []
+        registrar = self.registrar_iteraciones
+
+        dist[origen_idx] = 0
+        cola = [(heuristica[origen_idx] if heuristica is not None else 0, origen_idx)]
+
+        if registrar:
+            self._guardar_iteracion(nodo_fijado=None, relajaciones=[])
+
+        while cola:
+            _, u = heapq.heappop(cola)
+            if fijado[u]:
+                continue
+            d_u = dist[u]
+
+            fijado[u] = True
+            explorados.append(u)
+            relajaciones = []
+
+            for k in range(inicio[u], inicio[u + 1]):
+                v = destino[k]
+                if fijado[v]:
+                    continue
+
+                nueva = d_u + peso[k]
+                if registrar:
+                    relajaciones.append({
+                        "desde": self.nodos[u],
+                        "hacia": self.nodos[v],
+                        "dist_u": d_u,
+                        "costo": peso[k],
+                        "nueva": nueva,
+                        "antes": dist[v],
+                        "mejora": nueva < dist[v]
+                    })
+
+                if nueva < dist[v]:
+                    dist[v] = nueva
+                    pred[v] = u
+                    heapq.heappush(cola, (nueva + heuristica[v] if heuristica is not None else nueva, v))
+
+            if registrar:
+                self._guardar_iteracion(nodo_fijado=self.nodos[u], relajaciones=relajaciones)
+
+            if u == destino_idx:
+                break
+
+        self.visitados = set(explorados)
+        if destino_idx is not None:
+            return self._resultado_punto(origen_idx, destino_idx, self._reconstruir(destino_idx))
         return self._resultado_final(origen_idx)
 
+    def _resolver_bidireccional(self, origen_idx, destino_idx):
+        """
+        Dijkstra bidireccional: avanza por el lado con la cola de menor clave
+        y termina cuando la suma de los dos mínimos alcanza la mejor ruta
+        encontrada (mu). No registra iteraciones.
+        """
+        lados = (self._adyacencia(), self._adyacencia_inversa())
+        dist = (self.dist, [math.inf] * self.n)
+        pred = (self.pred, [-1] * self.n)
+        fijado = ([False] * self.n, [False] * self.n)
+        colas = ([(0, origen_idx)], [(0, destino_idx)])
+        explorados = set()
+        dist[0][origen_idx] = 0
+        dist[1][destino_idx] = 0
+
+        mu = math.inf if origen_idx != destino_idx else 0
+        encuentro = origen_idx if origen_idx == destino_idx else -1
+
+        while colas[0] and colas[1] and colas[0][0][0] + colas[1][0][0] < mu:
+            lado = 0 if colas[0][0][0] <= colas[1][0][0] else 1
+            d_u, u = heapq.heappop(colas[lado])
+            if fijado[lado][u]:
+                continue
+            fijado[lado][u] = True
+            explorados.add(u)
+
+            inicio, vecino, peso = lados[lado]
+            propia, otra = dist[lado], dist[1 - lado]
+            for k in range(inicio[u], inicio[u + 1]):
+                v = vecino[k]
+                nueva = d_u + peso[k]
+                if nueva < propia[v]:
+                    propia[v] = nueva
+                    pred[lado][v] = u
+                    heapq.heappush(colas[lado], (nueva, v))
+                if nueva + otra[v] < mu:
+                    mu = nueva + otra[v]
+                    encuentro = v
+
+        self.visitados = explorados
+        if encuentro == -1:
+            return self._resultado_punto(origen_idx, destino_idx, [])
+
+        # Origen → encuentro por los predecesores; encuentro → destino por los sucesores
+        ruta = self._reconstruir(encuentro)
+        sucesor = pred[1][encuentro] if encuentro != destino_idx else -1
+        while sucesor != -1:
+            ruta.append(sucesor)
+            sucesor = pred[1][sucesor]
+        self.dist[destino_idx] = mu
+        return self._resultado_punto(origen_idx, destino_idx, ruta)
+
+    def k_rutas(self, origen_idx, destino_idx, k=3):
+        """
+        Las k rutas más cortas sin ciclos de origen a destino (algoritmo de Yen).
+
+        Cada ruta aceptada sólo se desvía desde el nodo en que se separó de
+        su ruta madre en adelante (los desvíos anteriores ya se evaluaron
+        para la madre), y todas las búsquedas de desvío comparten un mismo
+        espacio de trabajo de Dijkstra, sin crear listas de tamaño V por desvío.
+        Las búsquedas de desvío son A* con la distancia exacta al destino en
+        la red sin exclusiones (un solo Dijkstra inverso): excluir nodos o
+        arcos sólo alarga las rutas, así que la cota es admisible.
+
+        Args:
+            origen_idx: Índice del nodo origen
+            destino_idx: Índice del nodo destino
+            k: Cantidad de rutas
+
+        Returns:
+            list: [{'k', 'distancia', 'ruta', 'ruta_indices'}, ...] ordenadas
+                  por distancia (menos de k si no hay más rutas)
+        """
+        if self.csr is None:
+            raise ValueError("k_rutas requiere construir con desde_red")
+        if k < 1:
+            raise ValueError("k debe ser al menos 1")
+
+        espacio = self._espacio_trabajo()
+        inicio, destino = espacio.inicio, espacio.destino
+
+        cota = self._distancias_hasta(destino_idx)
+        primera = espacio.ruta(origen_idx, destino_idx, cota=cota)
+        if primera is None:
+            return []
+
+        aceptadas = [(primera[0], primera[1], 0)]  # (distancia, arcos, índice de desvío)
+        candidatas = []
+        vistas = {tuple(espacio.nodos(origen_idx, primera[1]))}
+        contador = 0
+
+        while len(aceptadas) < k:
+            _, arcos_previa, desvio_previa = aceptadas[-1]
+            nodos_previa = espacio.nodos(origen_idx, arcos_previa)
+            acumulado = 0.0
+            for arco in arcos_previa[:desvio_previa]:
+                acumulado += espacio.peso[arco]
+
+            for i in range(desvio_previa, len(arcos_previa)):
+                desvio = nodos_previa[i]
+                raiz = nodos_previa[:i + 1]
+
+                # Arcos que repetirían una ruta ya aceptada con la misma raíz
+                siguientes = set()
+                for _, arcos_a, _ in aceptadas:
+                    nodos_a = espacio.nodos(origen_idx, arcos_a)
+                    if len(nodos_a) > i + 1 and nodos_a[:i + 1] == raiz:
+                        siguientes.add(nodos_a[i + 1])
+                excluidos = {a for a in range(inicio[desvio], inicio[desvio + 1]) if destino[a] in siguientes}
+
+                tramo = espacio.ruta(desvio, destino_idx, nodos_previa[:i], excluidos, cota)
+                if tramo is not None:
+                    arcos = arcos_previa[:i] + tramo[1]
+                    clave = tuple(espacio.nodos(origen_idx, arcos))
+                    if clave not in vistas:
+                        vistas.add(clave)
+                        contador += 1
+                        heapq.heappush(candidatas, (acumulado + tramo[0], contador, arcos, i))
+
+                acumulado += espacio.peso[arcos_previa[i]]
+
+            if not candidatas:
+                break
+            distancia, _, arcos, desvio = heapq.heappop(candidatas)
+            aceptadas.append((distancia, arcos, desvio))
+
+        rutas = []
+        for j, (distancia, arcos, _) in enumerate(aceptadas):
+            ruta = espacio.nodos(origen_idx, arcos)
+            rutas.append({
+                "k": j + 1,
+                "distancia": distancia,
+                "ruta": " → ".join(self.nodos[v] for v in ruta),
+                "ruta_indices": ruta
+            })
+        return rutas
+
+    def _espacio_trabajo(self):
+        """Espacio de Dijkstra reutilizable (se crea en la primera búsqueda)"""
+        if self._espacio is None:
+            self._espacio = _EspacioDijkstra(*self._adyacencia(), self.csr.origen.tolist())
+        return self._espacio
+
+    def _distancias_hasta(self, destino_idx):
+        """Distancia de cada nodo al destino (Dijkstra sobre los arcos entrantes)"""
+        inicio, vecino, peso = self._adyacencia_inversa()
+        dist = [math.inf] * self.n
+        dist[destino_idx] = 0
+        cola = [(0, destino_idx)]
+        while cola:
+            d_u, u = heapq.heappop(cola)
+            if d_u > dist[u]:
+                continue
+            for k in range(inicio[u], inicio[u + 1]):
+                v = vecino[k]
+                nueva = d_u + peso[k]
+                if nueva < dist[v]:
+                    dist[v] = nueva
+                    heapq.heappush(cola, (nueva, v))
+        return dist
+
     def _guardar_iteracion(self, nodo_fijado, relajaciones):
         """Guarda el estado de cada iteración para visualización"""
+        if not self.registrar_iteraciones:
+            return
+
         self.iteraciones.append({
             "nodo_fijado": nodo_fijado,
             "distancias": {
@@ -85,30 +468,191 @@ class RutaMasCorta:
         })
 
     def _resultado_final(self, origen_idx):
-        """Construye el resultado final con todas las rutas"""
-        rutas = []
-        for i in range(self.n):
-            ruta = self._reconstruir(i)
-            rutas.append({
-                "destino": self.nodos[i],
-                "distancia": self.dist[i] if self.dist[i] != math.inf else "∞",
-                "ruta": " → ".join(self.nodos[j] for j in ruta),
-                "ruta_indices": ruta
-            })
+        """
+        Construye el resultado final con todas las rutas.
 
+        'rutas' y 'predecesores' se arman al consultarlos (una ruta se
+        reconstruye cuando se accede a ella), así resolver() no recorre los
+        V árboles de predecesores si sólo se usan unas pocas rutas.
+        """
         return {
             "origen": self.nodos[origen_idx],
-            "predecesores": {
-                self.nodos[i]: (self.nodos[self.pred[i]] if self.pred[i] != -1 else None)
-                for i in range(self.n)
-            },
-            "rutas": rutas
+            "predecesores": _Predecesores(self.nodos, self.pred),
+            "rutas": _Rutas(self.nodos, self.dist, self.pred)
+        }
+
+    def _resultado_punto(self, origen_idx, destino_idx, ruta):
+        """Resultado de una consulta origen → destino"""
+        distancia = self.dist[destino_idx]
+        if distancia == math.inf:
+            ruta = []
+        return {
+            "origen": self.nodos[origen_idx],
+            "destino": self.nodos[destino_idx],
+            "distancia": distancia if distancia != math.inf else "∞",
+            "ruta": " → ".join(self.nodos[j] for j in ruta),
+            "ruta_indices": ruta,
+            "nodos_explorados": len(self.visitados)
         }
 
     def _reconstruir(self, i):
         """Reconstruye la ruta desde origen hasta destino i"""
-        r = []
-        while i != -1:
-            r.append(i)
-            i = self.pred[i]
-        return r[::-1]
\ No newline at end of file
+        return _reconstruir(self.pred, i)
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    """
+    Distancia en línea recta sobre la Tierra (km) entre puntos en grados.
+    Acepta escalares o arreglos NumPy.
+    """
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * RADIO_TIERRA_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def _reconstruir(pred, i):
+    """Sigue los predecesores desde i hasta el origen"""
+    r = []
+    while i != -1:
+        r.append(i)
+        i = pred[i]
+    return r[::-1]
+
+
+class _EspacioDijkstra:
+    """
+    Dijkstra punto a punto con nodos y arcos excluidos, para búsquedas
+    repetidas sobre la misma red (desvíos de Yen).
+
+    Las listas de distancias y marcas se crean una sola vez; cada búsqueda
+    usa un número de versión nuevo, y una entrada sólo es válida si su marca
+    coincide con la versión actual (no hay que reinicializar V posiciones).
+    """
+
+    def __init__(self, inicio, destino, peso, origen):
+        self.inicio = inicio
+        self.destino = destino
+        self.peso = peso
+        self.origen = origen
+
+        n = len(inicio) - 1
+        self.dist = [math.inf] * n
+        self.arco_pred = [-1] * n
+        self.alcanzado = [0] * n
+        self.fijado = [0] * n
+        self.bloqueado = [0] * n
+        self.version = 0
+        self.explorados = 0  # nodos fijados en la última búsqueda
+
+    def ruta(self, origen, destino, nodos_excluidos=(), arcos_excluidos=(), cota=None):
+        """
+        Args:
+            cota: Cota inferior de la distancia de cada nodo al destino (A*),
+                  indexable por nodo; los nodos con cota infinita no se exploran
+
+        Returns:
+            tuple: (distancia, arcos de la ruta) o None si no hay ruta
+        """
+        self.version += 1
+        version = self.version
+        inicio, vecino, peso = self.inicio, self.destino, self.peso
+        dist, arco_pred = self.dist, self.arco_pred
+        alcanzado, fijado, bloqueado = self.alcanzado, self.fijado, self.bloqueado
+
+        for v in nodos_excluidos:
+            bloqueado[v] = version
+
+        dist[origen] = 0
+        alcanzado[origen] = version
+        arco_pred[origen] = -1
+        cola = [(0, origen)]
+        explorados = 0
+
+        while cola:
+            _, u = heapq.heappop(cola)
+            if fijado[u] == version:
+                continue
+            fijado[u] = version
+            explorados += 1
+            if u == destino:
+                break
+            d_u = dist[u]
+
+            for k in range(inicio[u], inicio[u + 1]):
+                v = vecino[k]
+                if fijado[v] == version or bloqueado[v] == version or k in arcos_excluidos:
+                    continue
+                nueva = d_u + peso[k]
+                if alcanzado[v] != version or nueva < dist[v]:
+                    dist[v] = nueva
+                    alcanzado[v] = version
+                    arco_pred[v] = k
+                    if cota is None:
+                        heapq.heappush(cola, (nueva, v))
+                    elif cota[v] != math.inf:
+                        heapq.heappush(cola, (nueva + cota[v], v))
+
+        self.explorados = explorados
+        if fijado[destino] != version:
+            return None
+
+        arcos = []
+        v = destino
+        while v != origen:
+            arcos.append(arco_pred[v])
+            v = self.origen[arco_pred[v]]
+        return dist[destino], arcos[::-1]
+
+    def nodos(self, origen, arcos):
+        """Secuencia de nodos de una ruta dada por sus arcos"""
+        return [origen] + [self.destino[a] for a in arcos]
+
+
+class _Rutas(Sequence):
+    """Rutas a cada destino, reconstruidas al accederlas"""
+
+    def __init__(self, nodos, dist, pred):
+        self.nodos = nodos
+        self.dist = dist
+        self.pred = pred
+
+    def __len__(self):
+        return len(self.nodos)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+
+        ruta = _reconstruir(self.pred, i)
+        return {
+            "destino": self.nodos[i],
+            "distancia": self.dist[i] if self.dist[i] != math.inf else "∞",
+            "ruta": " → ".join(self.nodos[j] for j in ruta),
+            "ruta_indices": ruta
+        }
+
+
+class _Predecesores(Mapping):
+    """Predecesor de cada nodo por nombre, resuelto al consultarlo"""
+
+    def __init__(self, nodos, pred):
+        self.nodos = nodos
+        self.pred = pred
+        self._indice = None
+
+    def __getitem__(self, nombre):
+        if self._indice is None:
+            self._indice = {n: i for i, n in enumerate(self.nodos)}
+        p = self.pred[self._indice[nombre]]
+        return self.nodos[p] if p != -1 else None
+
+    def __iter__(self):
+        return iter(self.nodos)
+
+    def __len__(self):
+        return len(self.nodos)
\ No newline at end of file
@@ -0,0 +1,234 @@
+"""
+models/redes/ruta_dinamica.py
+Rutas más cortas desde un origen que se reparan cuando cambian los pesos
+de algunos arcos (cierres de vía, tráfico, nuevos costos)
+
+En lugar de repetir Dijkstra sobre toda la red, sólo se recalculan los nodos
+afectados:
+- Si un arco del árbol de rutas sube de peso (o se cierra), se invalida el
+  subárbol que cuelga de él y sus nodos se vuelven a etiquetar desde los
+  arcos que llegan de fuera del subárbol.
+- Si un arco baja de peso y mejora a su destino, la mejora se propaga a
+  partir de ese nodo.
+Ambos casos terminan en un Dijkstra que sólo recorre los nodos cuya
+distancia cambia.
+"""
+
+import heapq
+import math
+
+import numpy as np
+
+from .csr import como_csr
+from .ruta_corta import RutaMasCorta, _Predecesores, _Rutas, _reconstruir
+
+
+class RutaDinamica:
+    """
+    Árbol de rutas más cortas desde un origen con actualización incremental.
+
+    Uso:
+        dinamica = RutaDinamica(red, "Planta_Quito")
+        dinamica.actualizar([("Centro_Quito", "SupermercadoA", math.inf)])
+        dinamica.ruta("SupermercadoA")
+    """
+
+    def __init__(self, red, origen, campo="distancia", dist=None, pred=None):
+        """
+        Args:
+            red: Red o RedCSR
+            origen: Nombre del nodo origen
+            campo: Peso de los arcos ('distancia' o 'costo')
+            dist: Distancias previas por índice de nodo (p. ej. RutaMasCorta.dist);
+                  si no se dan, se calculan con Dijkstra
+            pred: Predecesores previos por índice de nodo (-1 en el origen o sin ruta)
+        """
+        self.csr = como_csr(red)
+        self.campo = campo
+        self.n = self.csr.num_nodos
+
+        if origen not in self.csr.indice:
+            raise ValueError(f"Nodo inválido: {origen}")
+        self.origen = self.csr.indice[origen]
+
+        peso = self.csr.peso(campo)
+        if self.csr.num_arcos and peso.min() < 0:
+            raise ValueError("Dijkstra requiere pesos no negativos")
+
+        # Listas de Python: los pesos cambian y se leen arco por arco
+        self.inicio = self.csr.inicio.tolist()
+        self.destino = self.csr.destino.tolist()
+        self.origen_arco = self.csr.origen.tolist()
+        self.peso = peso.tolist()
+        inicio_inv, orden_inv = self.csr.entrantes()
+        self.inicio_inv = inicio_inv.tolist()
+        self.arcos_inv = orden_inv.tolist()
+        self._arcos_por_par = None
+
+        if dist is None or pred is None:
+            dijkstra = RutaMasCorta.desde_red(self.csr, campo)
+            dijkstra.resolver(self.origen)
+            dist, pred = dijkstra.dist, dijkstra.pred
+        elif len(dist) != self.n or len(pred) != self.n:
+            raise ValueError(f"dist y pred deben tener {self.n} valores")
+
+        self.dist = list(dist)
+        self.pred = list(pred)
+
+        # Hijos de cada nodo en el árbol de rutas (para recorrer subárboles)
+        self.hijos = [set() for _ in range(self.n)]
+        for v, u in enumerate(self.pred):
+            if u != -1:
+                self.hijos[u].add(v)
+
+    def _arcos(self, origen, destino):
+        """Índices de los arcos origen → destino (incluye los paralelos)"""
+        if self._arcos_por_par is None:
+            # Claves origen·n + destino ordenadas: búsqueda binaria sin un dict de E entradas
+            claves = self.csr.origen.astype(np.int64) * self.n + self.csr.destino
+            orden = np.argsort(claves, kind="stable")
+            self._arcos_por_par = (claves[orden], orden)
+
+        try:
+            u, v = self.csr.indice[origen], self.csr.indice[destino]
+        except KeyError as e:
+            raise ValueError(f"Nodo inválido: {e.args[0]}") from None
+
+        claves, orden = self._arcos_por_par
+        clave = u * self.n + v
+        desde, hasta = np.searchsorted(claves, clave), np.searchsorted(claves, clave, side="right")
+        if desde == hasta:
+            raise ValueError(f"No existe el arco {origen} -> {destino}")
+        return orden[desde:hasta].tolist()
+
+    def actualizar(self, cambios):
+        """
+        Aplica nuevos pesos y repara las distancias afectadas.
+
+        Args:
+            cambios: Iterable de (origen, destino, nuevo_peso); math.inf cierra
+                     el arco. Se aplica a todos los arcos paralelos del par.
+
+        Returns:
+            dict: {
+                'nodos_recalculados': nodos sacados de la cola de prioridad,
+                'distancias_cambiadas': {nodo: (antes, después)}
+            }
+        """
+        dist, pred, peso = self.dist, self.pred, self.peso
+        anteriores = {}
+
+        # Peso original de cada arco modificado (un arco puede cambiar varias veces)
+        originales = {}
+        for origen, destino, nuevo in cambios:
+            if nuevo < 0:
+                raise ValueError("Dijkstra requiere pesos no negativos")
+            for k in self._arcos(origen, destino):
+                originales.setdefault(k, peso[k])
+                peso[k] = nuevo
+
+        subidas = [(k, anterior) for k, anterior in originales.items() if peso[k] > anterior]
+        bajadas = [k for k, anterior in originales.items() if peso[k] < anterior]
+
+        # 1. Arcos del árbol que subieron: invalidar el subárbol de su destino
+        invalidos = set()
+        for k, anterior in subidas:
+            u, v = self.origen_arco[k], self.destino[k]
+            if pred[v] == u and v not in invalidos and dist[v] == dist[u] + anterior:
+                self._invalidar_subarbol(v, invalidos, anteriores)
+
+        cola = []
+
+        # 2. Cada nodo invalidado toma la mejor entrada desde fuera del subárbol
+        for v in invalidos:
+            for k in self.arcos_inv[self.inicio_inv[v]:self.inicio_inv[v + 1]]:
+                u = self.origen_arco[k]
+                if u not in invalidos and dist[u] + peso[k] < dist[v]:
+                    self._asignar(v, dist[u] + peso[k], u, anteriores)
+            if dist[v] < math.inf:
+                heapq.heappush(cola, (dist[v], v))
+
+        # 3. Arcos que bajaron y mejoran a su destino
+        for k in bajadas:
+            u, v = self.origen_arco[k], self.destino[k]
+            if dist[u] + peso[k] < dist[v]:
+                self._asignar(v, dist[u] + peso[k], u, anteriores)
+                heapq.heappush(cola, (dist[v], v))
+
+        # 4. Propagar sólo por los nodos cuya distancia cambió
+        recalculados = 0
+        while cola:
+            d_u, u = heapq.heappop(cola)
+            if d_u > dist[u]:
+                continue
+            recalculados += 1
+            for k in range(self.inicio[u], self.inicio[u + 1]):
+                v = self.destino[k]
+                nueva = d_u + peso[k]
+                if nueva < dist[v]:
+                    self._asignar(v, nueva, u, anteriores)
+                    heapq.heappush(cola, (nueva, v))
+
+        return {
+            "nodos_recalculados": recalculados,
+            "distancias_cambiadas": {
+                self.csr.nodos[v]: (antes, dist[v])
+                for v, antes in anteriores.items() if antes != dist[v]
+            }
+        }
+
+    def _invalidar_subarbol(self, raiz, invalidos, anteriores):
+        """Marca el subárbol de `raiz` como sin distancia (inf) y lo separa del árbol"""
+        self._cambiar_padre(raiz, -1)
+        pila = [raiz]
+        while pila:
+            v = pila.pop()
+            invalidos.add(v)
+            anteriores.setdefault(v, self.dist[v])
+            self.dist[v] = math.inf
+            pila.extend(self.hijos[v])
+            for hijo in self.hijos[v]:
+                self.pred[hijo] = -1
+            self.hijos[v].clear()
+
+    def _asignar(self, v, distancia, padre, anteriores):
+        """Nueva distancia y predecesor de v, guardando la distancia anterior"""
+        anteriores.setdefault(v, self.dist[v])
+        self.dist[v] = distancia
+        self._cambiar_padre(v, padre)
+
+    def _cambiar_padre(self, v, padre):
+        anterior = self.pred[v]
+        if anterior != -1:
+            self.hijos[anterior].discard(v)
+        self.pred[v] = padre
+        if padre != -1:
+            self.hijos[padre].add(v)
+
+    def ruta(self, destino):
+        """
+        Ruta más corta actual hasta un nodo.
+
+        Returns:
+            dict: {'destino', 'distancia', 'ruta', 'ruta_indices'}
+        """
+        if destino not in self.csr.indice:
+            raise ValueError(f"Nodo inválido: {destino}")
+        v = self.csr.indice[destino]
+
+        ruta = _reconstruir(self.pred, v) if self.dist[v] != math.inf else []
+        return {
+            "destino": destino,
+            "distancia": self.dist[v] if self.dist[v] != math.inf else "∞",
+            "ruta": " → ".join(self.csr.nodos[j] for j in ruta),
+            "ruta_indices": ruta
+        }
+
+    def resultado(self):
+        """Resultado con el formato de RutaMasCorta.resolver(origen)"""
+        nodos = self.csr.nodos
+        return {
+            "origen": nodos[self.origen],
+            "predecesores": _Predecesores(nodos, list(self.pred)),
+            "rutas": _Rutas(nodos, list(self.dist), list(self.pred))
+        }
@@ -0,0 +1,389 @@
+"""
+models/redes/simplex_redes.py
+Simplex de redes para el flujo de costo mínimo con ofertas y demandas por nodo
+
+Resuelve el problema completo de la Red (varias plantas, centros y puntos de
+venta a la vez) usando `oferta_demanda`: oferta (+) en los nodos que envían y
+demanda (-) en los que reciben.
+
+La base es un árbol generador sobre los nodos más una raíz artificial unida
+a cada nodo por un arco de costo muy alto (fase I y II juntas, "Big M"). En
+cada pivote:
+- Pricing por bloques: se revisan los arcos en bloques de ~√m y entra el de
+  costo reducido más negativo del primer bloque que tenga alguno.
+- El arco que entra cierra un ciclo con el árbol; sale el de menor capacidad
+  residual (el último en caso de empate, regla de árbol fuertemente factible,
+  que evita ciclar en pivotes degenerados).
+- El árbol se guarda con padre, arco al padre, tamaño del subárbol y el hilo
+  de recorrido en profundidad, así el ciclo, el cambio de árbol y la
+  actualización de potenciales sólo recorren los nodos afectados.
+"""
+
+import math
+
+from .csr import como_csr
+
+
+class SimplexRedes:
+    """
+    Flujo de costo mínimo con ofertas y demandas por el método simplex de redes.
+
+    Uso:
+        simplex = SimplexRedes(red)
+        resultado = simplex.resolver()
+    """
+
+    def __init__(self, red, tamano_bloque=None):
+        """
+        Args:
+            red: Red o RedCSR con costo y capacidad por arco y oferta_demanda por nodo
+            tamano_bloque: Arcos revisados por bloque en el pricing (por defecto ⌈√m⌉)
+        """
+        self.csr = como_csr(red)
+        self.tamano_bloque = tamano_bloque
+        self.pivotes = 0
+
+    # -------------------------------------------------
+    # MÉTODO PRINCIPAL
+    # -------------------------------------------------
+    def resolver(self):
+        """
+        Calcula el flujo de costo mínimo que satisface todas las ofertas y demandas.
+
+        Returns:
+            dict: {
+                'costo_total': costo del flujo óptimo,
+                'flujo_arcos': {(origen, destino): flujo} de los arcos con flujo,
+                'flujos': [{'origen', 'destino', 'costo', 'capacidad', 'flujo'}] por arco,
+                'pivotes': cantidad de pivotes del simplex
+            }
+        """
+        csr = self.csr
+        nodos = csr.nodos
+        n, m = csr.num_nodos, csr.num_arcos
+
+        oferta = csr.oferta_demanda.tolist()
+        total = math.fsum(oferta)
+        if not math.isclose(total, 0, abs_tol=1e-9):
+            raise ValueError(
+                f"La red no está balanceada (suma = {total}). "
+                "Oferta total debe ser igual a demanda total."
+            )
+
+        origen, destino = csr.origen.tolist(), csr.destino.tolist()
+        costo, capacidad = csr.costo.tolist(), csr.capacidad.tolist()
+        flujo = [0] * m
+
+        # Los lazos y los arcos sin capacidad no forman parte de la base
+        arcos = [k for k in range(m) if origen[k] != destino[k] and capacidad[k] > 0]
+        lazos = [k for k in range(m) if origen[k] == destino[k] and costo[k] < 0]
+        for k in lazos:
+            flujo[k] = capacidad[k]
+
+        arbol = _ArbolSimplex(
+            n,
+            [origen[k] for k in arcos], [destino[k] for k in arcos],
+            [costo[k] for k in arcos], [capacidad[k] for k in arcos],
+            oferta
+        )
+        self.pivotes = arbol.resolver(self.tamano_bloque)
+
+        if any(arbol.flujo[i] for i in range(len(arcos), len(arcos) + n)):
+            raise ValueError("No existe un flujo factible que cumpla las ofertas y demandas")
+        for i, k in enumerate(arcos):
+            flujo[k] = arbol.flujo[i]
+        if any(flujo[k] == math.inf for k in lazos) or any(
+            capacidad[k] == math.inf and flujo[k] * 2 >= arbol.infinito for k in arcos
+        ):
+            raise ValueError("El problema es ilimitado: hay un ciclo de costo negativo sin límite de capacidad")
+
+        # Arcos en el orden en que se agregaron a la Red
+        flujos = []
+        flujo_arcos = {}
+        for k in sorted(range(m), key=csr.arco_original.__getitem__):
+            u, v = nodos[origen[k]], nodos[destino[k]]
+            flujos.append({
+                "origen": u,
+                "destino": v,
+                "costo": costo[k],
+                "capacidad": capacidad[k],
+                "flujo": flujo[k]
+            })
+            if flujo[k]:
+                flujo_arcos[(u, v)] = flujo_arcos.get((u, v), 0) + flujo[k]
+
+        return {
+            "costo_total": sum(f * c for f, c in zip(flujo, costo) if f),
+            "flujo_arcos": flujo_arcos,
+            "flujos": flujos,
+            "pivotes": self.pivotes
+        }
+
+
+class _ArbolSimplex:
+    """
+    Estado del simplex de redes en listas de Python.
+
+    Los arcos 0..m-1 son los de la red; el arco m + i une el nodo i con la
+    raíz (índice n): i → raíz si i tiene oferta, raíz → i si tiene demanda.
+    El hilo (siguiente/anterior) recorre el árbol en profundidad y ultimo[u]
+    es el último descendiente de u en ese recorrido.
+    """
+
+    def __init__(self, n, origen, destino, costo, capacidad, oferta):
+        self.m = m = len(origen)
+        raiz = n
+
+        # Capacidad "infinita" finita: en una solución básica acotada ningún
+        # arco lleva más que las ofertas más las capacidades finitas, así que
+        # un flujo de la mitad de este valor indica un problema ilimitado
+        finitas = math.fsum(c for c in capacidad if c != math.inf)
+        self.infinito = infinito = 2 * (math.fsum(map(abs, oferta)) + finitas) + 1
+
+        # Costo "Big M" de los arcos artificiales: mayor que el costo de cualquier ruta simple
+        self.costo_artificial = costo_artificial = 2 * math.fsum(map(abs, costo)) + 1
+
+        self.origen = list(origen)
+        self.destino = list(destino)
+        self.costo = list(costo)
+        self.capacidad = [c if c != math.inf else infinito for c in capacidad]
+        self.flujo = [0] * m
+
+        for i, b in enumerate(oferta):
+            if b >= 0:
+                self.origen.append(i)
+                self.destino.append(raiz)
+            else:
+                self.origen.append(raiz)
+                self.destino.append(i)
+            self.costo.append(costo_artificial)
+            self.capacidad.append(infinito)
+            self.flujo.append(abs(b))
+
+        # Árbol inicial: todos los nodos cuelgan de la raíz por su arco artificial;
+        # potenciales con costo reducido c - π(u) + π(v) = 0 en esos arcos
+        self.potencial = [costo_artificial if b >= 0 else -costo_artificial for b in oferta] + [0]
+        self.padre = [raiz] * n + [-1]
+        self.arco_padre = list(range(m, m + n)) + [-1]
+        self.tamano = [1] * n + [n + 1]
+        self.siguiente = list(range(1, n + 1)) + [0]
+        self.anterior = [raiz] + list(range(n))
+        self.ultimo = list(range(n)) + [n - 1 if n else raiz]
+
+    def resolver(self, tamano_bloque=None):
+        """Pivotea hasta que ningún arco tenga costo reducido negativo; devuelve los pivotes"""
+        pivotes = 0
+        for k, p, q in self._arcos_entrantes(tamano_bloque):
+            nodos_ciclo, arcos_ciclo = self._ciclo(k, p, q)
+            j, s, t = self._arco_saliente(nodos_ciclo, arcos_ciclo)
+            self._aumentar(nodos_ciclo, arcos_ciclo, self._residual(j, s))
+            pivotes += 1
+
+            if k != j:
+                if self.padre[t] != s:
+                    s, t = t, s
+                # q debe quedar en el subárbol que se separa (el de t)
+                if arcos_ciclo.index(k) > arcos_ciclo.index(j):
+                    p, q = q, p
+                self._quitar_arco(s, t)
+                self._hacer_raiz(q)
+                self._agregar_arco(k, p, q)
+                self._actualizar_potenciales(k, p, q)
+        return pivotes
+
+    def _arcos_entrantes(self, tamano_bloque):
+        """
+        Pricing por bloques: genera (arco, p, q) con costo reducido negativo,
+        donde el flujo aumentará en el sentido p → q. Termina cuando una vuelta
+        completa de bloques no encuentra candidatos.
+        """
+        m = self.m
+        if m == 0:
+            return
+        bloque = tamano_bloque or math.ceil(math.sqrt(m))
+        bloque = max(1, min(bloque, m))
+        num_bloques = (m + bloque - 1) // bloque
+
+        origen, destino, costo, flujo, potencial = (
+            self.origen, self.destino, self.costo, self.flujo, self.potencial
+        )
+        sin_candidatos = 0
+        primero = 0
+        while sin_candidatos < num_bloques:
+            fin = primero + bloque
+            if fin <= m:
+                rangos = (range(primero, fin),)
+            else:
+                fin -= m
+                rangos = (range(primero, m), range(fin))
+            primero = fin
+
+            mejor, mejor_costo = -1, 0
+            for rango in rangos:
+                for k in rango:
+                    c = costo[k] - potencial[origen[k]] + potencial[destino[k]]
+                    if flujo[k]:
+                        c = -c
+                    if c < mejor_costo:
+                        mejor, mejor_costo = k, c
+
+            if mejor == -1:
+                sin_candidatos += 1
+            else:
+                sin_candidatos = 0
+                if flujo[mejor] == 0:
+                    yield mejor, origen[mejor], destino[mejor]
+                else:
+                    yield mejor, destino[mejor], origen[mejor]
+
+    def _residual(self, k, p):
+        """Capacidad residual del arco k recorrido desde el nodo p"""
+        return self.capacidad[k] - self.flujo[k] if self.origen[k] == p else self.flujo[k]
+
+    def _apice(self, p, q):
+        """Ancestro común más cercano de p y q (subiendo por tamaño de subárbol)"""
+        padre, tamano = self.padre, self.tamano
+        while p != q:
+            if tamano[p] < tamano[q]:
+                p = padre[p]
+            elif tamano[p] > tamano[q]:
+                q = padre[q]
+            else:
+                p, q = padre[p], padre[q]
+        return p
+
+    def _camino(self, p, w):
+        """Nodos y arcos del árbol desde p hasta su ancestro w"""
+        nodos, arcos = [p], []
+        while p != w:
+            arcos.append(self.arco_padre[p])
+            p = self.padre[p]
+            nodos.append(p)
+        return nodos, arcos
+
+    def _ciclo(self, k, p, q):
+        """Ciclo que cierra el arco k (p → q), orientado en el sentido del aumento"""
+        w = self._apice(p, q)
+        nodos, arcos = self._camino(p, w)
+        nodos.reverse()
+        arcos.reverse()
+        if arcos != [k]:
+            arcos.append(k)
+        nodos_q, arcos_q = self._camino(q, w)
+        nodos_q.pop()
+        return nodos + nodos_q, arcos + arcos_q
+
+    def _arco_saliente(self, nodos, arcos):
+        """Arco de menor residual del ciclo (el último en caso de empate)"""
+        j, s = min(zip(reversed(arcos), reversed(nodos)), key=lambda par: self._residual(*par))
+        t = self.destino[j] if self.origen[j] == s else self.origen[j]
+        return j, s, t
+
+    def _aumentar(self, nodos, arcos, cantidad):
+        if not cantidad:
+            return
+        for k, p in zip(arcos, nodos):
+            if self.origen[k] == p:
+                self.flujo[k] += cantidad
+            else:
+                self.flujo[k] -= cantidad
+
+    def _quitar_arco(self, s, t):
+        """Separa del árbol el subárbol de t (padre[t] == s)"""
+        tamano_t = self.tamano[t]
+        anterior_t = self.anterior[t]
+        ultimo_t = self.ultimo[t]
+        despues_t = self.siguiente[ultimo_t]
+
+        self.padre[t] = -1
+        self.arco_padre[t] = -1
+
+        # Sacar el subárbol del hilo y cerrarlo sobre sí mismo
+        self.siguiente[anterior_t] = despues_t
+        self.anterior[despues_t] = anterior_t
+        self.siguiente[ultimo_t] = t
+        self.anterior[t] = ultimo_t
+
+        while s != -1:
+            self.tamano[s] -= tamano_t
+            if self.ultimo[s] == ultimo_t:
+                self.ultimo[s] = anterior_t
+            s = self.padre[s]
+
+    def _hacer_raiz(self, q):
+        """Reorienta el subárbol separado para que q sea su raíz"""
+        ancestros = []
+        while q != -1:
+            ancestros.append(q)
+            q = self.padre[q]
+        ancestros.reverse()
+
+        for p, q in zip(ancestros, ancestros[1:]):
+            tamano_p = self.tamano[p]
+            ultimo_p = self.ultimo[p]
+            anterior_q = self.anterior[q]
+            ultimo_q = self.ultimo[q]
+            despues_q = self.siguiente[ultimo_q]
+
+            # p pasa a ser hijo de q
+            self.padre[p] = q
+            self.padre[q] = -1
+            self.arco_padre[p] = self.arco_padre[q]
+            self.arco_padre[q] = -1
+            self.tamano[p] = tamano_p - self.tamano[q]
+            self.tamano[q] = tamano_p
+
+            # Sacar el subárbol de q del hilo de p
+            self.siguiente[anterior_q] = despues_q
+            self.anterior[despues_q] = anterior_q
+            self.siguiente[ultimo_q] = q
+            self.anterior[q] = ultimo_q
+
+            if ultimo_p == ultimo_q:
+                self.ultimo[p] = anterior_q
+                ultimo_p = anterior_q
+
+            # Lo que queda de p se cuelga al final del recorrido de q
+            self.anterior[p] = ultimo_q
+            self.siguiente[ultimo_q] = p
+            self.siguiente[ultimo_p] = q
+            self.anterior[q] = ultimo_p
+            self.ultimo[q] = ultimo_p
+
+    def _agregar_arco(self, k, p, q):
+        """Cuelga el subárbol con raíz q del nodo p mediante el arco k"""
+        ultimo_p = self.ultimo[p]
+        despues_p = self.siguiente[ultimo_p]
+        tamano_q = self.tamano[q]
+        ultimo_q = self.ultimo[q]
+
+        self.padre[q] = p
+        self.arco_padre[q] = k
+
+        self.siguiente[ultimo_p] = q
+        self.anterior[q] = ultimo_p
+        self.anterior[despues_p] = ultimo_q
+        self.siguiente[ultimo_q] = despues_p
+
+        while p != -1:
+            self.tamano[p] += tamano_q
+            if self.ultimo[p] == ultimo_p:
+                self.ultimo[p] = ultimo_q
+            p = self.padre[p]
+
+    def _actualizar_potenciales(self, k, p, q):
+        """Ajusta los potenciales del subárbol de q para que el arco k quede con costo reducido 0"""
+        potencial = self.potencial
+        if q == self.destino[k]:
+            delta = potencial[p] - self.costo[k] - potencial[q]
+        else:
+            delta = potencial[p] + self.costo[k] - potencial[q]
+
+        siguiente = self.siguiente
+        ultimo = self.ultimo[q]
+        v = q
+        while True:
+            potencial[v] += delta
+            if v == ultimo:
+                break
+            v = siguiente[v]
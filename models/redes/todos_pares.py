@@ -0,0 +1,205 @@
+"""
+models/redes/todos_pares.py
+Distancias más cortas entre todos los pares de nodos de la red
+
+Dos métodos:
+- Dijkstra repetido (redes dispersas): un Dijkstra sobre la forma CSR por
+  cada origen, repartidos en bloques entre procesos.
+- Floyd–Warshall vectorizado con NumPy (redes densas): n pasos, cada uno una
+  operación n×n sobre la matriz completa.
+
+Los resultados se guardan en una caché en memoria indexada por una huella
+(hash) de los arreglos de la red, así un tablero que pide varias veces la
+misma matriz no la recalcula mientras la red no cambie.
+"""
+
+import hashlib
+import math
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .csr import como_csr
+from .ruta_corta import RutaMasCorta, _reconstruir
+
+
+METODOS = ("dijkstra", "floyd_warshall")
+
+# Densidad (arcos / n²) a partir de la cual se usa Floyd–Warshall
+DENSIDAD_FLOYD = 0.1
+
+MAX_CACHE = 8
+_cache = OrderedDict()
+
+
+def todos_los_pares(red, campo="distancia", origenes=None, metodo=None, max_procesos=None):
+    """
+    Calcula la matriz de distancias más cortas entre los nodos de la red.
+
+    Args:
+        red: Red o RedCSR
+        campo: Peso de los arcos ('distancia' o 'costo')
+        origenes: Nombres de los nodos origen (filas); por defecto, todos
+        metodo: 'dijkstra' o 'floyd_warshall'; por defecto según la densidad
+        max_procesos: Procesos para Dijkstra (1 = secuencial; por defecto, los del sistema)
+
+    Returns:
+        dict: {
+            'nodos': nombres de las columnas,
+            'origenes': nombres de las filas,
+            'distancias': np.ndarray k×n float64 (inf si no hay ruta),
+            'predecesores': np.ndarray k×n entero (-1 en el origen o sin ruta),
+            'metodo': método usado
+        }
+        Los arreglos son de sólo lectura (se comparten con la caché).
+    """
+    csr = como_csr(red)
+    n = csr.num_nodos
+
+    if origenes is None:
+        filas = list(range(n))
+    else:
+        try:
+            filas = [csr.indice[nombre] for nombre in origenes]
+        except KeyError as e:
+            raise ValueError(f"Nodo inválido: {e.args[0]}") from None
+
+    if metodo is None:
+        metodo = "floyd_warshall" if csr.num_arcos >= DENSIDAD_FLOYD * n * n else "dijkstra"
+    if metodo not in METODOS:
+        raise ValueError(f"Método desconocido: {metodo}")
+
+    clave = (huella_red(csr, campo), metodo, tuple(filas))
+    if clave in _cache:
+        _cache.move_to_end(clave)
+        return _cache[clave]
+
+    if metodo == "floyd_warshall":
+        distancias, predecesores = _floyd_warshall(csr, campo)
+        if origenes is not None:
+            distancias, predecesores = distancias[filas], predecesores[filas]
+    else:
+        distancias, predecesores = _dijkstra_repetido(csr, campo, filas, max_procesos)
+
+    distancias.setflags(write=False)
+    predecesores.setflags(write=False)
+    resultado = {
+        "nodos": list(csr.nodos),
+        "origenes": [csr.nodos[i] for i in filas],
+        "distancias": distancias,
+        "predecesores": predecesores,
+        "metodo": metodo
+    }
+
+    _cache[clave] = resultado
+    if len(_cache) > MAX_CACHE:
+        _cache.popitem(last=False)
+    return resultado
+
+
+def ruta_entre(resultado, origen, destino):
+    """
+    Reconstruye una ruta a partir de la matriz de predecesores.
+
+    Args:
+        resultado: Diccionario devuelto por todos_los_pares
+        origen: Nombre del nodo origen (debe estar entre las filas)
+        destino: Nombre del nodo destino
+
+    Returns:
+        list: Nombres de los nodos de la ruta (vacía si no hay ruta)
+    """
+    fila = resultado["origenes"].index(origen)
+    j = resultado["nodos"].index(destino)
+    if math.isinf(resultado["distancias"][fila, j]):
+        return []
+
+    indices = _reconstruir(resultado["predecesores"][fila].tolist(), j)
+    return [resultado["nodos"][i] for i in indices]
+
+
+def huella_red(red, campo="distancia"):
+    """Hash de los nodos y arcos (con el peso indicado) de la red"""
+    csr = como_csr(red)
+    h = hashlib.blake2b(digest_size=16)
+    h.update("\0".join(map(str, csr.nodos)).encode())
+    for arreglo in (csr.origen, csr.destino, csr.peso(campo)):
+        h.update(np.ascontiguousarray(arreglo).tobytes())
+    return h.hexdigest()
+
+
+def limpiar_cache():
+    """Vacía la caché de matrices de distancias"""
+    _cache.clear()
+
+
+def _tipo_predecesor(n):
+    """Entero con signo más pequeño que representa los índices 0..n-1 y -1"""
+    return np.int16 if n < 2 ** 15 else np.int32
+
+
+def _floyd_warshall(csr, campo):
+    """Floyd–Warshall con una actualización vectorizada n×n por nodo intermedio"""
+    n = csr.num_nodos
+    dist = csr.a_matriz(campo)
+
+    pred = np.full((n, n), -1, dtype=_tipo_predecesor(n))
+    filas, columnas = np.nonzero(np.isfinite(dist))
+    pred[filas, columnas] = filas
+    np.fill_diagonal(pred, -1)
+
+    for k in range(n):
+        nueva = dist[:, k, None] + dist[None, k, :]
+        mejora = nueva < dist
+        if mejora.any():
+            np.copyto(dist, nueva, where=mejora)
+            np.copyto(pred, np.broadcast_to(pred[k], (n, n)), where=mejora)
+
+    if np.any(np.diag(dist) < 0):
+        raise ValueError("La red tiene un ciclo de peso negativo")
+    return dist, pred
+
+
+def _dijkstra_repetido(csr, campo, filas, max_procesos):
+    """Un Dijkstra por origen, repartidos en bloques entre procesos"""
+    if csr.num_arcos and csr.peso(campo).min() < 0:
+        raise ValueError("Dijkstra requiere pesos no negativos; use metodo='floyd_warshall'")
+
+    procesos = max_procesos if max_procesos is not None else (os.cpu_count() or 1)
+    procesos = max(1, min(procesos, len(filas)))
+    tamano = max(1, math.ceil(len(filas) / procesos))
+    bloques = [(csr, campo, filas[i:i + tamano]) for i in range(0, len(filas), tamano)]
+
+    if procesos > 1:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            partes = list(pool.map(_dijkstra_bloque, bloques))
+    else:
+        partes = [_dijkstra_bloque(bloque) for bloque in bloques]
+
+    if not partes:
+        n = csr.num_nodos
+        return np.empty((0, n)), np.empty((0, n), dtype=_tipo_predecesor(n))
+    return np.vstack([d for d, _ in partes]), np.vstack([p for _, p in partes])
+
+
+def _dijkstra_bloque(tarea):
+    """
+    Resuelve un bloque de orígenes con una sola instancia de RutaMasCorta
+    (a nivel de módulo para poder enviarlo a otro proceso).
+
+    Returns:
+        tuple: (distancias, predecesores) del bloque
+    """
+    csr, campo, filas = tarea
+    n = csr.num_nodos
+    dijkstra = RutaMasCorta.desde_red(csr, campo)
+
+    distancias = np.empty((len(filas), n))
+    predecesores = np.empty((len(filas), n), dtype=_tipo_predecesor(n))
+    for fila, origen in enumerate(filas):
+        dijkstra.resolver(origen)
+        distancias[fila] = dijkstra.dist
+        predecesores[fila] = dijkstra.pred
+    return distancias, predecesores
@@ -1,5 +1,14 @@
 """Módulo de Problemas de Transporte"""
 
 from .esquina_noroeste import EsquinaNoreste
+from .dispersos import CostosDispersos
+from .problema import ProblemaTransporte
+from .balanceo import balancear_problema, quitar_ficticios
+from .asignacion import MetodoHungaro, AlgoritmoSubasta
+from .transbordo import Transbordo
+from .multiproducto import TransporteMultiproducto
+from .comparacion import comparar_metodos
 
-__all__ = ['EsquinaNoreste']
\ No newline at end of file
+__all__ = ['EsquinaNoreste', 'CostosDispersos', 'ProblemaTransporte', 'balancear_problema', 'quitar_ficticios',
+           'MetodoHungaro', 'AlgoritmoSubasta', 'Transbordo', 'TransporteMultiproducto',
+           'comparar_metodos']
\ No newline at end of file
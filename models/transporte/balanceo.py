@@ -0,0 +1,146 @@
+"""
+models/transporte/balanceo.py
+Balanceo automático de problemas de transporte (origen/destino ficticio)
+"""
+
+import math
+
+import numpy as np
+
+from .dispersos import CostosDispersos
+from .problema import redondear_cantidad
+
+
+def balancear_problema(costos, oferta, demanda, penalizacion_origen=0, penalizacion_destino=0):
+    """
+    Balancea un problema de transporte agregando un origen o destino ficticio.
+
+    - Si la demanda total supera a la oferta, se agrega un origen ficticio
+      cuya "oferta" es el faltante; su costo representa la penalización por
+      demanda insatisfecha (ventas perdidas).
+    - Si la oferta total supera a la demanda, se agrega un destino ficticio
+      que absorbe el excedente; su costo representa el costo de mantener la
+      producción no despachada.
+
+    Args:
+        costos: Matriz de costos (listas anidadas) o CostosDispersos
+        oferta: Oferta de cada origen
+        demanda: Demanda de cada destino
+        penalizacion_origen: Costo unitario del origen ficticio (escalar o uno por destino)
+        penalizacion_destino: Costo unitario del destino ficticio (escalar o uno por origen)
+
+    Returns:
+        dict: Problema balanceado con las claves 'costos', 'oferta', 'demanda',
+              'origen_ficticio', 'destino_ficticio' y 'diferencia'
+              (oferta total - demanda total del problema original)
+    """
+    oferta = list(oferta)
+    demanda = list(demanda)
+    filas, columnas = len(oferta), len(demanda)
+    diferencia = diferencia_oferta_demanda(oferta, demanda)
+
+    origen_ficticio = diferencia < 0
+    destino_ficticio = diferencia > 0
+
+    if origen_ficticio:
+        fila_extra = _como_vector(penalizacion_origen, columnas, "penalizacion_origen")
+        oferta.append(-diferencia)
+    if destino_ficticio:
+        columna_extra = _como_vector(penalizacion_destino, filas, "penalizacion_destino")
+        demanda.append(diferencia)
+
+    if isinstance(costos, CostosDispersos):
+        arcos = list(zip(costos.origen.tolist(), costos.destino.tolist(), costos.costo.tolist()))
+        if origen_ficticio:
+            arcos.extend((filas, j, fila_extra[j]) for j in range(columnas))
+        if destino_ficticio:
+            arcos.extend((i, columnas, columna_extra[i]) for i in range(filas))
+        costos_balanceados = CostosDispersos(arcos, len(oferta), len(demanda))
+    else:
+        costos_balanceados = [list(fila) for fila in costos]
+        if destino_ficticio:
+            for i, fila in enumerate(costos_balanceados):
+                fila.append(columna_extra[i])
+        if origen_ficticio:
+            costos_balanceados.append(list(fila_extra))
+
+    return {
+        'costos': costos_balanceados,
+        'oferta': oferta,
+        'demanda': demanda,
+        'origen_ficticio': origen_ficticio,
+        'destino_ficticio': destino_ficticio,
+        'diferencia': diferencia
+    }
+
+
+def diferencia_oferta_demanda(oferta, demanda):
+    """
+    Oferta total menos demanda total.
+
+    Con cantidades decimales la suma arrastra error de redondeo (0.1 + 0.2 +
+    0.4 frente a 0.3 + 0.15 + 0.25 difieren en 1.1e-16); la diferencia se
+    redondea respecto de los totales para que ese residuo cuente como 0.
+    """
+    diferencia = sum(oferta) - sum(demanda)
+    if isinstance(diferencia, float):
+        oferta_total, demanda_total = math.fsum(oferta), math.fsum(demanda)
+        diferencia = redondear_cantidad(oferta_total - demanda_total, max(oferta_total, demanda_total))
+    return diferencia
+
+
+def quitar_ficticios(asignacion, balance):
+    """
+    Elimina la fila/columna ficticia de una asignación del problema balanceado.
+
+    Args:
+        asignacion: Matriz de asignación (listas anidadas o arreglo) o
+                    diccionario {(i, j): cantidad}
+        balance: Diccionario devuelto por balancear_problema
+
+    Returns:
+        dict: {
+            'asignacion': asignación sobre orígenes/destinos reales,
+            'demanda_insatisfecha': cantidad cubierta por el origen ficticio en cada destino,
+            'oferta_sobrante': cantidad enviada al destino ficticio desde cada origen
+        }
+    """
+    filas = len(balance['oferta']) - (1 if balance['origen_ficticio'] else 0)
+    columnas = len(balance['demanda']) - (1 if balance['destino_ficticio'] else 0)
+
+    demanda_insatisfecha = [0] * columnas
+    oferta_sobrante = [0] * filas
+
+    if isinstance(asignacion, dict):
+        real = {}
+        for (i, j), cantidad in asignacion.items():
+            if i == filas and balance['origen_ficticio']:
+                demanda_insatisfecha[j] += cantidad
+            elif j == columnas and balance['destino_ficticio']:
+                oferta_sobrante[i] += cantidad
+            else:
+                real[(i, j)] = cantidad
+    else:
+        matriz = np.asarray(asignacion)
+        if balance['origen_ficticio']:
+            demanda_insatisfecha = matriz[filas, :columnas].tolist()
+        if balance['destino_ficticio']:
+            oferta_sobrante = matriz[:filas, columnas].tolist()
+        real = matriz[:filas, :columnas].tolist()
+
+    return {
+        'asignacion': real,
+        'demanda_insatisfecha': demanda_insatisfecha,
+        'oferta_sobrante': oferta_sobrante
+    }
+
+
+def _como_vector(valor, longitud, nombre):
+    """Expande una penalización escalar a una lista o valida su longitud"""
+    if np.isscalar(valor):
+        return [valor] * longitud
+
+    valor = list(valor)
+    if len(valor) != longitud:
+        raise ValueError(f"{nombre} debe tener {longitud} valores")
+    return valor
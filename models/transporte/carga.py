@@ -0,0 +1,212 @@
+"""
+models/transporte/carga.py
+Carga masiva de instancias de transporte desde CSV o Parquet (pyarrow)
+
+Las tablas se leen con el lector columnar de pyarrow (multihilo para CSV) y
+cada columna numérica se entrega a NumPy sin copiar cuando está en un solo
+bloque y no tiene valores vacíos.
+
+Formatos admitidos:
+- Matriz de costos (ancho): una fila por origen y una columna numérica por
+  destino; una columna de texto opcional con el nombre del origen. Las celdas
+  vacías se consideran rutas prohibidas (costo infinito).
+- Vector de oferta o demanda: una columna numérica y una columna de texto
+  opcional con los nombres.
+- Rutas (largo): una fila por ruta permitida con columnas origen, destino y
+  costo; se carga como CostosDispersos.
+"""
+
+import os
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+
+from .dispersos import CostosDispersos
+
+
+FORMATOS = {".csv": "csv", ".parquet": "parquet", ".pq": "parquet"}
+
+
+def leer_tabla(fuente, formato=None):
+    """
+    Lee un archivo CSV o Parquet como tabla de Arrow.
+
+    Args:
+        fuente: Ruta o archivo abierto en modo binario (p. ej. st.file_uploader)
+        formato: 'csv' o 'parquet'; por defecto se deduce de la extensión
+
+    Returns:
+        pyarrow.Table
+    """
+    if formato is None:
+        nombre = fuente if isinstance(fuente, (str, os.PathLike)) else getattr(fuente, "name", "")
+        formato = FORMATOS.get(os.path.splitext(str(nombre))[1].lower())
+        if formato is None:
+            raise ValueError("No se pudo deducir el formato; use formato='csv' o 'parquet'")
+
+    if formato == "csv":
+        return pv.read_csv(fuente)
+    if formato == "parquet":
+        return pq.read_table(fuente)
+    raise ValueError(f"Formato desconocido: {formato}")
+
+
+def a_numpy(columna, dtype=None, vacio=None):
+    """
+    Convierte una columna de Arrow a un arreglo NumPy.
+
+    No copia si la columna tiene un solo bloque, es de tipo primitivo y no
+    tiene valores vacíos (el arreglo resultante es de sólo lectura).
+
+    Args:
+        columna: pyarrow.Array o ChunkedArray
+        dtype: Tipo NumPy deseado (sólo se convierte si difiere)
+        vacio: Valor para las celdas vacías; si es None, se rechazan
+
+    Returns:
+        np.ndarray
+    """
+    if isinstance(columna, pa.ChunkedArray):
+        columna = columna.chunk(0) if columna.num_chunks == 1 else columna.combine_chunks()
+
+    if columna.null_count:
+        if vacio is None:
+            raise ValueError("La columna tiene valores vacíos")
+        columna = pc.fill_null(columna, pa.scalar(vacio, type=columna.type))
+
+    arreglo = columna.to_numpy(zero_copy_only=False)
+    if dtype is not None and arreglo.dtype != dtype:
+        arreglo = arreglo.astype(dtype)
+    return arreglo
+
+
+def cargar_matriz_costos(fuente, formato=None):
+    """
+    Carga una matriz de costos en formato ancho.
+
+    Returns:
+        tuple: (costos np.ndarray m×n float64, nombres de orígenes, nombres de destinos)
+    """
+    tabla = leer_tabla(fuente, formato)
+    etiquetas, numericas = _separar_columnas(tabla)
+    if not numericas:
+        raise ValueError("La tabla de costos no tiene columnas numéricas")
+
+    # Arrow guarda por columnas: la matriz por filas requiere una única copia
+    costos = np.empty((tabla.num_rows, len(numericas)), dtype=np.float64)
+    for j, nombre in enumerate(numericas):
+        columna = tabla.column(nombre).cast(pa.float64())
+        costos[:, j] = a_numpy(columna, vacio=np.inf)
+
+    return costos, _nombres(tabla, etiquetas, "O"), numericas
+
+
+def cargar_vector(fuente, columna=None, formato=None):
+    """
+    Carga un vector de oferta o demanda.
+
+    Args:
+        fuente: Ruta o archivo
+        columna: Columna numérica a usar (por defecto, la primera)
+        formato: 'csv' o 'parquet' (opcional)
+
+    Returns:
+        tuple: (valores np.ndarray, nombres)
+    """
+    tabla = leer_tabla(fuente, formato)
+    etiquetas, numericas = _separar_columnas(tabla)
+
+    if columna is None:
+        if not numericas:
+            raise ValueError("La tabla no tiene columnas numéricas")
+        columna = numericas[0]
+    elif columna not in numericas:
+        raise ValueError(f"La columna '{columna}' no existe o no es numérica")
+
+    return a_numpy(tabla.column(columna)), _nombres(tabla, etiquetas, "")
+
+
+def cargar_rutas(fuente, origen="origen", destino="destino", costo="costo",
+                 origenes=None, destinos=None, formato=None):
+    """
+    Carga rutas en formato largo (una fila por ruta permitida) como CostosDispersos.
+
+    Los nombres se codifican a índices con un diccionario de Arrow (en C),
+    sin recorrer las filas en Python.
+
+    Args:
+        fuente: Ruta o archivo
+        origen, destino, costo: Nombres de las columnas
+        origenes: Orden de los orígenes (por defecto, orden de aparición)
+        destinos: Orden de los destinos (por defecto, orden de aparición)
+        formato: 'csv' o 'parquet' (opcional)
+
+    Returns:
+        tuple: (CostosDispersos, nombres de orígenes, nombres de destinos)
+    """
+    tabla = leer_tabla(fuente, formato)
+    for nombre in (origen, destino, costo):
+        if nombre not in tabla.column_names:
+            raise ValueError(f"Falta la columna '{nombre}'")
+
+    idx_origen, origenes = _codificar(tabla.column(origen), origenes)
+    idx_destino, destinos = _codificar(tabla.column(destino), destinos)
+    costos = a_numpy(tabla.column(costo).cast(pa.float64()))
+
+    dispersos = CostosDispersos.desde_arreglos(idx_origen, idx_destino, costos, len(origenes), len(destinos))
+    return dispersos, origenes, destinos
+
+
+def _separar_columnas(tabla):
+    """
+    Devuelve (columna de etiquetas o None, columnas numéricas).
+
+    Una columna sin ningún valor llega con tipo null; se toma como numérica
+    (toda vacía), no como etiquetas.
+    """
+    etiquetas = None
+    numericas = []
+    for nombre, columna in zip(tabla.column_names, tabla.columns):
+        tipo = columna.type
+        if pa.types.is_integer(tipo) or pa.types.is_floating(tipo) or pa.types.is_null(tipo):
+            numericas.append(nombre)
+        elif etiquetas is None:
+            etiquetas = nombre
+        else:
+            raise ValueError(f"La columna '{nombre}' no es numérica")
+    return etiquetas, numericas
+
+
+def _nombres(tabla, etiquetas, prefijo):
+    """Nombres de las filas: la columna de etiquetas o prefijo + número"""
+    if etiquetas is not None:
+        return [str(valor) for valor in tabla.column(etiquetas).to_pylist()]
+    return [f"{prefijo}{i + 1}" for i in range(tabla.num_rows)]
+
+
+def _codificar(columna, nombres=None):
+    """
+    Convierte una columna de nombres a índices enteros.
+
+    Returns:
+        tuple: (índices np.ndarray int64, lista de nombres)
+    """
+    if isinstance(columna, pa.ChunkedArray):
+        columna = columna.combine_chunks()
+    if columna.null_count:
+        raise ValueError("Hay rutas sin origen o destino")
+
+    if nombres is None:
+        codificada = pc.dictionary_encode(columna)
+        indices = a_numpy(codificada.indices, dtype=np.int64)
+        return indices, codificada.dictionary.to_pylist()
+
+    nombres = list(nombres)
+    indices = pc.index_in(columna, value_set=pa.array(nombres, type=columna.type))
+    if indices.null_count:
+        desconocido = pc.filter(columna, pc.is_null(indices))[0].as_py()
+        raise ValueError(f"Nombre desconocido en las rutas: {desconocido}")
+    return a_numpy(indices, dtype=np.int64), nombres
@@ -0,0 +1,123 @@
+"""
+models/transporte/comparacion.py
+Comparación de los métodos de solución inicial (Esquina Noroeste, Costo Mínimo
+y Vogel) y optimización con MODI de la mejor solución
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .esquina_noroeste import EsquinaNoreste
+from .costo_minimo import CostoMinimo
+from .vogel import MetodoVogel
+from .optimalidad import OptimizadorTransporte
+from .dispersos import CostosDispersos
+from .problema import ProblemaTransporte
+
+
+METODOS_INICIALES = {
+    "Esquina Noroeste": EsquinaNoreste,
+    "Costo Mínimo": CostoMinimo,
+    "Vogel": MetodoVogel,
+}
+
+
+def comparar_metodos(costos, oferta=None, demanda=None, metodos=None, max_procesos=None):
+    """
+    Ejecuta los métodos de solución inicial en paralelo, elige el de menor
+    costo y lo optimiza con MODI.
+
+    Los tres métodos son independientes y sólo leen el problema (inmutable),
+    así que cada uno corre en su propio proceso. Con costos dispersos se omite
+    Esquina Noroeste, que sólo trabaja sobre matrices densas.
+
+    MODI se ejecuta siempre en su versión dispersa (base explícita como árbol
+    generador), que maneja correctamente las soluciones iniciales degeneradas;
+    la solución óptima se entrega como {(i, j): cantidad}.
+
+    Args:
+        costos: Matriz de costos, CostosDispersos o ProblemaTransporte
+        oferta: Oferta de cada origen (no se usa si `costos` es un ProblemaTransporte)
+        demanda: Demanda de cada destino (idem)
+        metodos: Nombres de METODOS_INICIALES a ejecutar (por defecto, todos)
+        max_procesos: Procesos del pool (1 = secuencial; por defecto uno por método)
+
+    Returns:
+        dict: {
+            'metodos': [{'metodo', 'costo_inicial', 'tiempo', 'iteraciones'}, ...],
+            'mejor_metodo', 'solucion_inicial', 'costo_inicial',
+            'solucion_optima', 'costo_optimo', 'iteraciones_modi', 'tiempo_modi',
+            'tiempo_total'
+        }
+    """
+    inicio = time.perf_counter()
+    problema = ProblemaTransporte.desde(costos, oferta, demanda)
+
+    if metodos is None:
+        metodos = [nombre for nombre in METODOS_INICIALES
+                   if not (problema.disperso and nombre == "Esquina Noroeste")]
+    for nombre in metodos:
+        if nombre not in METODOS_INICIALES:
+            raise ValueError(f"Método inicial desconocido: {nombre}")
+        if problema.disperso and nombre == "Esquina Noroeste":
+            raise ValueError("Esquina Noroeste no admite costos dispersos")
+
+    tareas = [(nombre, problema) for nombre in metodos]
+    procesos = max_procesos if max_procesos is not None else len(tareas)
+
+    if procesos > 1:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            resultados = list(pool.map(_ejecutar_metodo, tareas))
+    else:
+        resultados = [_ejecutar_metodo(tarea) for tarea in tareas]
+
+    mejor = min(resultados, key=lambda r: r["costo_inicial"])
+
+    inicio_modi = time.perf_counter()
+    if problema.disperso:
+        problema_modi = problema
+    else:
+        problema_modi = ProblemaTransporte(
+            CostosDispersos.desde_matriz(problema.costos), problema.oferta, problema.demanda
+        )
+    optimizador = OptimizadorTransporte(problema_modi, mejor["asignacion"])
+    solucion = optimizador.resolver()
+    tiempo_modi = time.perf_counter() - inicio_modi
+
+    return {
+        "metodos": [
+            {clave: r[clave] for clave in ("metodo", "costo_inicial", "tiempo", "iteraciones")}
+            for r in resultados
+        ],
+        "mejor_metodo": mejor["metodo"],
+        "solucion_inicial": mejor["asignacion"],
+        "costo_inicial": mejor["costo_inicial"],
+        "solucion_optima": solucion,
+        "costo_optimo": float(optimizador.obtener_costo_total()),
+        "iteraciones_modi": optimizador.iteracion,
+        "tiempo_modi": tiempo_modi,
+        "tiempo_total": time.perf_counter() - inicio
+    }
+
+
+def _ejecutar_metodo(tarea):
+    """
+    Resuelve un método inicial (a nivel de módulo para poder enviarlo a otro proceso).
+
+    Returns:
+        dict: 'metodo', 'asignacion', 'costo_inicial', 'tiempo' e 'iteraciones'
+    """
+    nombre, problema = tarea
+
+    inicio = time.perf_counter()
+    metodo = METODOS_INICIALES[nombre](problema)
+    metodo.resolver()
+    tiempo = time.perf_counter() - inicio
+
+    return {
+        "metodo": nombre,
+        "asignacion": metodo.obtener_asignacion(),
+        "costo_inicial": float(metodo.obtener_costo_total()),
+        "tiempo": tiempo,
+        "iteraciones": len(metodo.obtener_pasos())
+    }
@@ -4,72 +4,172 @@ Modelo de Costo Mínimo adaptado para Coca-Cola
 """
 
 import numpy as np
-import copy
+
+from .dispersos import completar_con_artificiales
+from .problema import ProblemaTransporte
 
 
 class CostoMinimo:
-    def __init__(self, costos, oferta, demanda):
-        self.costos = np.array(costos, dtype=float)
-        self.oferta = np.array(oferta, dtype=int)
-        self.demanda = np.array(demanda, dtype=int)
-        self.filas = len(oferta)
-        self.columnas = len(demanda)
+    def __init__(self, costos, oferta=None, demanda=None):
+        # Acepta un ProblemaTransporte o la forma (costos, oferta, demanda).
+        # Con CostosDispersos la asignación se guarda como {(i, j): cantidad}
+        self.problema = ProblemaTransporte.desde(costos, oferta, demanda)
+        self.disperso = self.problema.disperso
+        self.costos = self.problema.costos
+        self.oferta = self.problema.oferta
+        self.demanda = self.problema.demanda
+        self.filas = self.problema.filas
+        self.columnas = self.problema.columnas
         self.pasos = []
         self.asignacion = None
 
-    def resolver(self):
-        asignacion = np.zeros((self.filas, self.columnas), dtype=int)
-        oferta_restante = self.oferta.copy()
-        demanda_restante = self.demanda.copy()
+    def iterar_pasos(self):
+        """
+        Generador que produce cada paso en el momento en que se realiza la asignación.
+
+        Los pasos se registran como deltas (celda, cantidad); la matriz completa
+        se reconstruye sólo al mostrarla (ver models/transporte/pasos.py).
+        """
+        if self.disperso:
+            yield from self._iterar_pasos_disperso()
+            return
 
-        costos_temp = self.costos.copy()
+        asignacion = self.problema.asignacion_vacia()
+        self.asignacion = asignacion
+        ajustar = self.problema.ajustar
+        oferta_restante = self.oferta.tolist()
+        demanda_restante = self.demanda.tolist()
+        filas_vivas = sum(1 for valor in oferta_restante if valor > 0)
+        columnas_vivas = sum(1 for valor in demanda_restante if valor > 0)
+
+        # Recorrer las celdas en el orden por costo que cachea el problema
+        # equivale a buscar el mínimo de la matriz en cada iteración (argmin
+        # desempata igual, por filas), sin revisar las m·n celdas en cada paso
+        columnas = self.columnas
         iteracion = 0
 
-        while np.sum(oferta_restante) > 0 and np.sum(demanda_restante) > 0:
-            iteracion += 1
+        for k in self.problema.orden_global.tolist():
+            if filas_vivas == 0 or columnas_vivas == 0:
+                break
 
-            min_idx = np.unravel_index(np.argmin(costos_temp), costos_temp.shape)
-            i, j = min_idx
+            i, j = divmod(k, columnas)
+            if oferta_restante[i] <= 0 or demanda_restante[j] <= 0:
+                continue
 
+            iteracion += 1
             cantidad = min(oferta_restante[i], demanda_restante[j])
 
             asignacion[i, j] = cantidad
-            oferta_restante[i] -= cantidad
-            demanda_restante[j] -= cantidad
+            oferta_restante[i] = ajustar(oferta_restante[i] - cantidad)
+            demanda_restante[j] = ajustar(demanda_restante[j] - cantidad)
 
-            paso = {
+            yield {
                 'iteracion': iteracion,
                 'celda': (i, j),
                 'costo_unitario': float(self.costos[i, j]),
-                'cantidad': int(cantidad),
+                'cantidad': cantidad,
                 'costo_celda': float(self.costos[i, j] * cantidad),
-                'oferta_restante': int(oferta_restante[i]),
-                'demanda_restante': int(demanda_restante[j]),
-                'matriz': asignacion.copy().tolist()
+                'oferta_restante': oferta_restante[i],
+                'demanda_restante': demanda_restante[j]
             }
-            self.pasos.append(paso)
 
             if oferta_restante[i] == 0:
-                costos_temp[i, :] = np.inf
+                filas_vivas -= 1
             if demanda_restante[j] == 0:
-                costos_temp[:, j] = np.inf
-
+                columnas_vivas -= 1
+
+    def _iterar_pasos_disperso(self):
+        """
+        Costo Mínimo sobre la lista de arcos permitidos.
+
+        Recorrer los arcos ordenados por costo y saltar los de filas/columnas
+        agotadas equivale a buscar repetidamente el mínimo global, pero cuesta
+        O(E log E) en lugar de O(m·n) por iteración. Si las rutas permitidas no
+        alcanzan, lo pendiente se asigna a celdas artificiales (costo infinito
+        hasta que MODI las elimine).
+        """
+        asignacion = {}
         self.asignacion = asignacion
-        costo_total = float(np.sum(asignacion * self.costos))
+        ajustar = self.problema.ajustar
+        oferta_restante = self.oferta.tolist()
+        demanda_restante = self.demanda.tolist()
+        pendiente = ajustar(min(sum(oferta_restante), sum(demanda_restante)))
+
+        # Orden estable (cacheado en el problema): a igual costo se respeta el orden por filas
+        orden = self.problema.orden_global.tolist()
+        origen = self.costos.origen.tolist()
+        destino = self.costos.destino.tolist()
+        iteracion = 0
+
+        for k in orden:
+            if pendiente <= 0:
+                break
+
+            i, j = origen[k], destino[k]
+            if oferta_restante[i] <= 0 or demanda_restante[j] <= 0:
+                continue
+
+            iteracion += 1
+            costo = float(self.costos.costo[k])
+            cantidad = min(oferta_restante[i], demanda_restante[j])
+
+            asignacion[(i, j)] = cantidad
+            oferta_restante[i] = ajustar(oferta_restante[i] - cantidad)
+            demanda_restante[j] = ajustar(demanda_restante[j] - cantidad)
+            pendiente = ajustar(pendiente - cantidad)
+
+            yield {
+                'iteracion': iteracion,
+                'celda': (i, j),
+                'costo_unitario': costo,
+                'cantidad': cantidad,
+                'costo_celda': costo * cantidad,
+                'oferta_restante': oferta_restante[i],
+                'demanda_restante': demanda_restante[j]
+            }
+
+        # Rutas permitidas agotadas: completar con celdas artificiales (Gran M)
+        if pendiente > 0:
+            for i, j, cantidad in completar_con_artificiales(oferta_restante, demanda_restante, ajustar):
+                iteracion += 1
+                asignacion[(i, j)] = cantidad
+                oferta_restante[i] = ajustar(oferta_restante[i] - cantidad)
+                demanda_restante[j] = ajustar(demanda_restante[j] - cantidad)
+
+                yield {
+                    'iteracion': iteracion,
+                    'celda': (i, j),
+                    'costo_unitario': np.inf,
+                    'cantidad': cantidad,
+                    'costo_celda': np.inf,
+                    'oferta_restante': oferta_restante[i],
+                    'demanda_restante': demanda_restante[j],
+                    'artificial': True
+                }
+
+    def resolver(self):
+        self.pasos = []
+        for paso in self.iterar_pasos():
+            self.pasos.append(paso)
 
         return {
-            "asignacion": asignacion.tolist(),
-            "costo_total": costo_total
+            "asignacion": self.obtener_asignacion(),
+            "costo_total": self.obtener_costo_total()
         }
 
     def obtener_costo_total(self):
         if self.asignacion is None:
             return 0
+        if self.disperso:
+            return float(sum(cantidad * self.costos.obtener_costo(i, j)
+                             for (i, j), cantidad in self.asignacion.items()))
         return float(np.sum(self.asignacion * self.costos))
 
     def obtener_asignacion(self):
         if self.asignacion is None:
             return None
+        if self.disperso:
+            return dict(self.asignacion)
         return self.asignacion.tolist()
 
     def obtener_pasos(self):
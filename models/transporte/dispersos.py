@@ -0,0 +1,247 @@
+"""
+models/transporte/dispersos.py
+Representación dispersa de costos de transporte (sólo rutas permitidas)
+"""
+
+import numpy as np
+
+
+class CostosDispersos:
+    """
+    Matriz de costos de transporte almacenada como lista de arcos permitidos.
+
+    En la red real no todas las rutas planta → centro → punto de venta existen.
+    En lugar de rellenar una matriz m×n con costos enormes para las rutas
+    prohibidas, se guardan únicamente los arcos (i, j, costo) válidos. La
+    memoria y el trabajo de los métodos de transporte escalan entonces con el
+    número de rutas reales.
+
+    Los arcos se guardan ordenados por (origen, destino) y se precalculan los
+    índices por fila y por columna ordenados por costo, que usan Costo Mínimo,
+    Vogel y MODI.
+    """
+
+    def __init__(self, arcos, filas, columnas):
+        """
+        Inicializa la matriz dispersa.
+
+        Args:
+            arcos: Iterable de tuplas (i, j, costo) con las rutas permitidas
+            filas: Número de orígenes
+            columnas: Número de destinos
+        """
+        arcos = list(arcos)
+
+        if arcos:
+            origen, destino, costo = zip(*arcos)
+        else:
+            origen, destino, costo = (), (), ()
+
+        self._construir(origen, destino, costo, filas, columnas)
+
+    @classmethod
+    def desde_arreglos(cls, origen, destino, costo, filas, columnas):
+        """
+        Construye la matriz dispersa directamente desde arreglos paralelos
+        (por ejemplo, columnas leídas con pyarrow), sin pasar por tuplas.
+
+        Args:
+            origen: Índice de origen de cada arco
+            destino: Índice de destino de cada arco
+            costo: Costo de cada arco
+            filas: Número de orígenes
+            columnas: Número de destinos
+
+        Returns:
+            CostosDispersos
+        """
+        costos = cls.__new__(cls)
+        costos._construir(origen, destino, costo, filas, columnas)
+        return costos
+
+    def _construir(self, origen, destino, costo, filas, columnas):
+        """Valida, ordena e indexa los arcos"""
+        self.filas = int(filas)
+        self.columnas = int(columnas)
+
+        origen = np.asarray(origen, dtype=np.int64)
+        destino = np.asarray(destino, dtype=np.int64)
+        costo = np.asarray(costo, dtype=float)
+
+        if not (origen.shape == destino.shape == costo.shape) or origen.ndim != 1:
+            raise ValueError("origen, destino y costo deben tener la misma longitud")
+        if origen.size and (origen.min() < 0 or origen.max() >= self.filas):
+            raise ValueError("Hay arcos con un origen fuera de rango")
+        if destino.size and (destino.min() < 0 or destino.max() >= self.columnas):
+            raise ValueError("Hay arcos con un destino fuera de rango")
+
+        # Orden canónico por (origen, destino)
+        orden = np.lexsort((destino, origen))
+        self.origen = origen[orden]
+        self.destino = destino[orden]
+        self.costo = costo[orden]
+
+        repetidos = np.flatnonzero((self.origen[1:] == self.origen[:-1]) & (self.destino[1:] == self.destino[:-1]))
+        if repetidos.size:
+            i, j = int(self.origen[repetidos[0]]), int(self.destino[repetidos[0]])
+            raise ValueError(f"Arco duplicado: ({i + 1}, {j + 1})")
+        self._indice_arcos = None
+
+        # Índices por fila y por columna, ordenados por costo (desempate por posición)
+        self.orden_filas = np.lexsort((self.destino, self.costo, self.origen))
+        self.inicio_filas = np.searchsorted(self.origen[self.orden_filas], np.arange(self.filas + 1))
+
+        self.orden_columnas = np.lexsort((self.origen, self.costo, self.destino))
+        self.inicio_columnas = np.searchsorted(self.destino[self.orden_columnas], np.arange(self.columnas + 1))
+
+    @classmethod
+    def desde_diccionario(cls, costos, origenes, destinos):
+        """
+        Construye la matriz dispersa desde un diccionario anidado
+        {origen: {destino: costo}} como COSTOS_TRANSPORTE_VENTA.
+
+        Las rutas que no aparecen en el diccionario quedan prohibidas.
+
+        Args:
+            costos: Diccionario {origen: {destino: costo}}
+            origenes: Lista ordenada de nombres de orígenes
+            destinos: Lista ordenada de nombres de destinos
+
+        Returns:
+            CostosDispersos
+        """
+        idx_origen = {nombre: i for i, nombre in enumerate(origenes)}
+        idx_destino = {nombre: j for j, nombre in enumerate(destinos)}
+
+        arcos = []
+        for origen, fila in costos.items():
+            if origen not in idx_origen:
+                continue
+            for destino, costo in fila.items():
+                if destino in idx_destino:
+                    arcos.append((idx_origen[origen], idx_destino[destino], costo))
+
+        return cls(arcos, len(origenes), len(destinos))
+
+    @classmethod
+    def desde_matriz(cls, matriz, prohibido=np.inf):
+        """
+        Construye la matriz dispersa desde una matriz densa, descartando las
+        celdas con costo `prohibido` (por defecto infinito) o None.
+
+        Args:
+            matriz: Matriz de costos (listas anidadas o arreglo)
+            prohibido: Valor que marca una ruta inexistente
+
+        Returns:
+            CostosDispersos
+        """
+        arcos = []
+        for i, fila in enumerate(matriz):
+            for j, costo in enumerate(fila):
+                if costo is None or costo == prohibido:
+                    continue
+                arcos.append((i, j, costo))
+
+        return cls(arcos, len(matriz), len(matriz[0]) if len(matriz) else 0)
+
+    @property
+    def _indice(self):
+        """Diccionario {(i, j): posición}, construido la primera vez que se consulta"""
+        if self._indice_arcos is None:
+            self._indice_arcos = {
+                celda: k for k, celda in enumerate(zip(self.origen.tolist(), self.destino.tolist()))
+            }
+        return self._indice_arcos
+
+    def __len__(self):
+        return int(self.costo.size)
+
+    def permitido(self, i, j):
+        """Indica si la ruta (i, j) existe"""
+        return (i, j) in self._indice
+
+    def obtener_costo(self, i, j):
+        """
+        Costo unitario de la ruta (i, j).
+
+        Returns:
+            float: Costo de la ruta, o infinito si la ruta está prohibida
+        """
+        k = self._indice.get((i, j))
+        if k is None:
+            return np.inf
+        return float(self.costo[k])
+
+    def indice_arco(self, i, j):
+        """Posición del arco (i, j) en los arreglos, o None si no existe"""
+        return self._indice.get((i, j))
+
+    def arcos_fila(self, i):
+        """Índices de los arcos que salen del origen i, ordenados por costo"""
+        return self.orden_filas[self.inicio_filas[i]:self.inicio_filas[i + 1]]
+
+    def arcos_columna(self, j):
+        """Índices de los arcos que llegan al destino j, ordenados por costo"""
+        return self.orden_columnas[self.inicio_columnas[j]:self.inicio_columnas[j + 1]]
+
+    def a_matriz(self, valor_prohibido=np.inf):
+        """
+        Expande a una matriz densa (sólo para visualizar instancias pequeñas).
+
+        Args:
+            valor_prohibido: Valor para las rutas inexistentes
+
+        Returns:
+            list: Matriz de costos (listas anidadas)
+        """
+        matriz = np.full((self.filas, self.columnas), valor_prohibido, dtype=float)
+        matriz[self.origen, self.destino] = self.costo
+        return matriz.tolist()
+
+    def __repr__(self):
+        return (
+            f"CostosDispersos(filas={self.filas}, "
+            f"columnas={self.columnas}, arcos={len(self)})"
+        )
+
+
+def completar_con_artificiales(oferta_restante, demanda_restante, ajustar=None):
+    """
+    Completa una asignación inicial que quedó bloqueada por rutas prohibidas.
+
+    Los métodos voraces (Costo Mínimo, Vogel) pueden agotar todas las rutas
+    permitidas de un origen aunque el problema sea factible. La oferta y
+    demanda pendientes se reparten con Esquina Noroeste sobre celdas
+    artificiales (costo Gran M), que OptimizadorTransporte se encarga de
+    sacar de la base.
+
+    Args:
+        oferta_restante: Oferta pendiente por origen
+        demanda_restante: Demanda pendiente por destino
+        ajustar: Función que quita el error de redondeo de cada resto
+                 (ProblemaTransporte.ajustar); por defecto no se modifica
+
+    Yields:
+        tuple: (i, j, cantidad) de cada celda artificial
+    """
+    filas = [i for i, valor in enumerate(oferta_restante) if valor > 0]
+    columnas = [j for j, valor in enumerate(demanda_restante) if valor > 0]
+    oferta = {i: oferta_restante[i] for i in filas}
+    demanda = {j: demanda_restante[j] for j in columnas}
+
+    a, b = 0, 0
+    while a < len(filas) and b < len(columnas):
+        i, j = filas[a], columnas[b]
+        cantidad = min(oferta[i], demanda[j])
+        oferta[i] -= cantidad
+        demanda[j] -= cantidad
+        if ajustar is not None:
+            oferta[i] = ajustar(oferta[i])
+            demanda[j] = ajustar(demanda[j])
+        yield i, j, cantidad
+
+        if oferta[i] == 0:
+            a += 1
+        if demanda[j] == 0:
+            b += 1
@@ -5,22 +5,33 @@ Modelo de Esquina Noroeste adaptado para Coca-Cola
 
 import numpy as np
 
+from .problema import ProblemaTransporte
+
 
 class EsquinaNoreste:
-    def __init__(self, costos, oferta, demanda):
-        self.costos = np.array(costos, dtype=float)
-        self.oferta = list(oferta)
-        self.demanda = list(demanda)
-        self.filas = len(oferta)
-        self.columnas = len(demanda)
+    def __init__(self, costos, oferta=None, demanda=None):
+        # Acepta un ProblemaTransporte o la forma (costos, oferta, demanda)
+        self.problema = ProblemaTransporte.desde(costos, oferta, demanda)
+        self.costos = self.problema.costos
+        self.oferta = self.problema.oferta.tolist()
+        self.demanda = self.problema.demanda.tolist()
+        self.filas = self.problema.filas
+        self.columnas = self.problema.columnas
         self.pasos = []
         self.asignacion = None
 
-    def resolver(self):
+    def iterar_pasos(self):
+        """
+        Generador que produce cada paso en el momento en que se realiza la asignación.
+
+        Los pasos se registran como deltas (celda, cantidad); la matriz completa
+        se reconstruye sólo al mostrarla (ver models/transporte/pasos.py).
+        """
         oferta_restante = self.oferta.copy()
         demanda_restante = self.demanda.copy()
 
-        asignacion = np.zeros((self.filas, self.columnas), dtype=int)
+        asignacion = self.problema.asignacion_vacia()
+        self.asignacion = asignacion
 
         i = 0
         j = 0
@@ -31,32 +42,32 @@ class EsquinaNoreste:
             cantidad = min(oferta_restante[i], demanda_restante[j])
 
             asignacion[i, j] = cantidad
-            oferta_restante[i] -= cantidad
-            demanda_restante[j] -= cantidad
+            oferta_restante[i] = self.problema.ajustar(oferta_restante[i] - cantidad)
+            demanda_restante[j] = self.problema.ajustar(demanda_restante[j] - cantidad)
 
-            paso = {
+            yield {
                 'iteracion': iteracion,
                 'celda': (i, j),
                 'costo_unitario': float(self.costos[i, j]),
-                'cantidad': int(cantidad),
+                'cantidad': cantidad,
                 'costo_celda': float(self.costos[i, j] * cantidad),
-                'oferta_restante': int(oferta_restante[i]),
-                'demanda_restante': int(demanda_restante[j]),
-                'matriz': asignacion.copy().astype(int).tolist()
+                'oferta_restante': oferta_restante[i],
+                'demanda_restante': demanda_restante[j]
             }
-            self.pasos.append(paso)
 
             if oferta_restante[i] == 0:
                 i += 1
             else:
                 j += 1
 
-        self.asignacion = asignacion
-        costo_total = float(np.sum(asignacion * self.costos))
+    def resolver(self):
+        self.pasos = []
+        for paso in self.iterar_pasos():
+            self.pasos.append(paso)
 
         return {
-            "asignacion": asignacion.tolist(),
-            "costo_total": costo_total
+            "asignacion": self.asignacion.tolist(),
+            "costo_total": self.obtener_costo_total()
         }
 
     def obtener_costo_total(self):
@@ -67,7 +78,7 @@ class EsquinaNoreste:
     def obtener_asignacion(self):
         if self.asignacion is None:
             return None
-        return self.asignacion.astype(int).tolist()
+        return self.asignacion.tolist()
 
     def obtener_pasos(self):
         return self.pasos
\ No newline at end of file
@@ -0,0 +1,353 @@
+"""
+models/transporte/multiproducto.py
+Transporte Multiproducto (Coca-Cola, Sprite, Fanta) con capacidad compartida por ruta
+
+Cada planta elabora sólo algunos productos y los camiones de una ruta se
+comparten entre todos ellos. El problema se descompone con Dantzig–Wolfe
+(generación de columnas): el maestro reparte la capacidad de las rutas y
+cada producto es un problema de transporte independiente (Vogel + MODI
+disperso) que se resuelve en paralelo.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.optimize import linprog
+from scipy.sparse import coo_matrix
+
+from .dispersos import CostosDispersos
+from .vogel import MetodoVogel
+from .optimalidad import OptimizadorTransporte
+
+
+class TransporteMultiproducto:
+    """
+    Problema de transporte multiproducto con capacidad compartida por ruta.
+
+        min  Σ_k Σ_ij c_ij x_ijk
+        s.a. Σ_j x_ijk ≤ oferta_ik          (sólo plantas que elaboran k)
+             Σ_i x_ijk = demanda_jk
+             Σ_k x_ijk ≤ u_ij               (capacidad compartida de la ruta)
+
+    Generación de columnas:
+    - Maestro restringido (PL): elige una combinación convexa de planes de
+      envío de cada producto respetando las capacidades u_ij.
+    - Subproblema de precios por producto: transporte sin capacidades con
+      costos c_ij - π_ij (π = precios sombra de las rutas saturadas). Los
+      subproblemas no dependen entre sí y se resuelven en paralelo.
+
+    El proceso termina cuando ningún producto ofrece una columna de costo
+    reducido negativo; la cota de Lagrange acota el óptimo en cada iteración.
+    """
+
+    def __init__(self, productos, costos, oferta, demanda, capacidad_rutas,
+                 origenes=None, destinos=None, penalizacion_demanda=None,
+                 max_iteraciones=50, max_procesos=None):
+        """
+        Args:
+            productos: Lista de nombres de productos
+            costos: Matriz m×n de costos unitarios o CostosDispersos (rutas permitidas)
+            oferta: {producto: oferta por origen}; 0 si la planta no elabora el producto
+            demanda: {producto: demanda por destino}
+            capacidad_rutas: {(i, j): capacidad} o matriz m×n (inf = sin límite)
+            origenes: Nombres de los orígenes (opcional)
+            destinos: Nombres de los destinos (opcional)
+            penalizacion_demanda: Costo unitario de la demanda no cubierta
+            max_iteraciones: Límite de iteraciones de generación de columnas
+            max_procesos: Procesos para los subproblemas (1 = secuencial)
+        """
+        self.productos = list(productos)
+        self.costos = costos if isinstance(costos, CostosDispersos) else CostosDispersos.desde_matriz(costos)
+        self.filas, self.columnas = self.costos.filas, self.costos.columnas
+        self.oferta = {k: list(oferta[k]) for k in self.productos}
+        self.demanda = {k: list(demanda[k]) for k in self.productos}
+        self.capacidad = self._capacidades(capacidad_rutas)
+        self.origenes = list(origenes) if origenes else [f"O{i + 1}" for i in range(self.filas)]
+        self.destinos = list(destinos) if destinos else [f"D{j + 1}" for j in range(self.columnas)]
+
+        costo_max = float(np.abs(self.costos.costo).max()) if len(self.costos) else 0.0
+        self.gran_m = (costo_max + 1) * (self.filas + self.columnas + 1)
+        self.penalizacion_demanda = self.gran_m if penalizacion_demanda is None else penalizacion_demanda
+
+        self.max_iteraciones = max_iteraciones
+        self.max_procesos = max_procesos
+        self.iteraciones = []
+
+    @classmethod
+    def desde_datos_empresa(cls, **kwargs):
+        """
+        Plantas → centros de distribución con los datos mensuales de la empresa:
+        oferta por producto según CAPACIDAD_PRODUCCION (sólo productos que la
+        planta elabora), demanda de DEMANDA_MENSUAL repartida por región y
+        capacidad compartida de CAPACIDAD_RUTAS_DISTRIBUCION.
+        """
+        from empresa.datos_empresa import (
+            PLANTAS, CENTROS_DISTRIBUCION, PRODUCTOS, CAPACIDAD_PRODUCCION,
+            DEMANDA_MENSUAL, DISTRIBUCION_DEMANDA_REGIONAL,
+            COSTOS_TRANSPORTE_DISTRIBUCION, CAPACIDAD_RUTAS_DISTRIBUCION
+        )
+
+        plantas = list(PLANTAS)
+        centros = list(CENTROS_DISTRIBUCION)
+        productos = list(PRODUCTOS)
+
+        costos = CostosDispersos.desde_diccionario(COSTOS_TRANSPORTE_DISTRIBUCION, plantas, centros)
+        capacidad = {
+            (i, j): CAPACIDAD_RUTAS_DISTRIBUCION[p][c]
+            for i, p in enumerate(plantas)
+            for j, c in enumerate(centros)
+            if c in CAPACIDAD_RUTAS_DISTRIBUCION.get(p, {})
+        }
+
+        oferta = {}
+        for k in productos:
+            oferta[k] = [
+                CAPACIDAD_PRODUCCION[p][k]
+                if k in {nombre.replace("-", "_") for nombre in PLANTAS[p]["productos"]} else 0
+                for p in plantas
+            ]
+
+        demanda = {
+            k: [round(DEMANDA_MENSUAL[k] * DISTRIBUCION_DEMANDA_REGIONAL[CENTROS_DISTRIBUCION[c]["ubicacion"]])
+                for c in centros]
+            for k in productos
+        }
+
+        return cls(productos, costos, oferta, demanda, capacidad,
+                   origenes=plantas, destinos=centros, **kwargs)
+
+    def _capacidades(self, capacidad_rutas):
+        """Normaliza las capacidades a {(i, j): u_ij} sólo para rutas limitadas"""
+        if isinstance(capacidad_rutas, dict):
+            return {celda: u for celda, u in capacidad_rutas.items() if np.isfinite(u)}
+
+        return {
+            (i, j): u
+            for i, fila in enumerate(capacidad_rutas)
+            for j, u in enumerate(fila)
+            if np.isfinite(u)
+        }
+
+    def resolver(self):
+        """
+        Ejecuta la generación de columnas.
+
+        Returns:
+            dict: {
+                'costo_total', 'cota_inferior', 'flujos' {producto: {(origen, destino): cantidad}},
+                'uso_rutas' {(origen, destino): (cantidad, capacidad)},
+                'demanda_insatisfecha' {producto: total}, 'factible', 'iteraciones'
+            }
+        """
+        rutas = sorted(self.capacidad)
+        fila_ruta = {celda: r for r, celda in enumerate(rutas)}
+        capacidades = np.array([self.capacidad[celda] for celda in rutas], dtype=float)
+
+        columnas = []  # (producto, plan {(i, j): cantidad}, costo, faltante)
+        duales_rutas = np.zeros(len(rutas))
+        self.iteraciones = []
+
+        procesos = self.max_procesos if self.max_procesos is not None else len(self.productos)
+        with _Ejecutor(procesos) as ejecutor:
+            for iteracion in range(1, self.max_iteraciones + 1):
+                # Subproblemas de precios (uno por producto, en paralelo)
+                costos_reducidos = self._costos_con_duales(duales_rutas, fila_ruta)
+                tareas = [
+                    (costos_reducidos, self.oferta[k], self.demanda[k], self.penalizacion_demanda)
+                    for k in self.productos
+                ]
+                planes = list(ejecutor.map(_resolver_subproblema, tareas))
+
+                if iteracion == 1:
+                    duales_producto = np.full(len(self.productos), np.inf)
+
+                nuevas = 0
+                valor_lagrange = 0.0
+                for k, (plan, faltante) in enumerate(planes):
+                    costo_reducido = (
+                        sum(q * costos_reducidos.obtener_costo(i, j) for (i, j), q in plan.items())
+                        + self.penalizacion_demanda * faltante
+                    )
+                    valor_lagrange += costo_reducido
+                    if costo_reducido - duales_producto[k] < -1e-7 * max(1.0, abs(costo_reducido)):
+                        costo = sum(q * self.costos.obtener_costo(i, j) for (i, j), q in plan.items())
+                        columnas.append((k, plan, costo + self.penalizacion_demanda * faltante, faltante))
+                        nuevas += 1
+
+                # Cota de Lagrange: Σ_k min costo reducido + π·u
+                cota_inferior = valor_lagrange + float(duales_rutas @ capacidades)
+
+                if nuevas == 0:
+                    self.iteraciones[-1]["cota_inferior"] = max(self.iteraciones[-1]["cota_inferior"], cota_inferior)
+                    break
+
+                # Maestro restringido
+                valor, lambdas, holguras, duales_rutas, duales_producto = self._resolver_maestro(
+                    columnas, rutas, fila_ruta, capacidades
+                )
+
+                self.iteraciones.append({
+                    "iteracion": iteracion,
+                    "columnas_nuevas": nuevas,
+                    "columnas_totales": len(columnas),
+                    "costo_maestro": valor,
+                    "cota_inferior": cota_inferior
+                })
+
+        return self._resultado(columnas, lambdas, holguras, rutas)
+
+    def _costos_con_duales(self, duales_rutas, fila_ruta):
+        """Costos c_ij - π_ij para el subproblema de precios"""
+        costo = self.costos.costo.copy()
+        for (i, j), r in fila_ruta.items():
+            k = self.costos.indice_arco(i, j)
+            if k is not None:
+                costo[k] -= duales_rutas[r]
+
+        return CostosDispersos(
+            zip(self.costos.origen.tolist(), self.costos.destino.tolist(), costo.tolist()),
+            self.filas, self.columnas
+        )
+
+    def _resolver_maestro(self, columnas, rutas, fila_ruta, capacidades):
+        """
+        Resuelve el maestro restringido con HiGHS.
+
+        Variables: λ de cada columna y una holgura (costo Gran M) por ruta
+        limitada que permite exceder la capacidad mientras no haya columnas
+        suficientes para respetarla.
+        """
+        n_col, n_rutas = len(columnas), len(rutas)
+
+        filas_ub, cols_ub, valores_ub = [], [], []
+        for c, (_, plan, _, _) in enumerate(columnas):
+            for celda, q in plan.items():
+                r = fila_ruta.get(celda)
+                if r is not None and q:
+                    filas_ub.append(r)
+                    cols_ub.append(c)
+                    valores_ub.append(q)
+        for r in range(n_rutas):
+            filas_ub.append(r)
+            cols_ub.append(n_col + r)
+            valores_ub.append(-1.0)
+
+        a_ub = coo_matrix((valores_ub, (filas_ub, cols_ub)), shape=(n_rutas, n_col + n_rutas)).tocsr()
+        a_eq = coo_matrix(
+            (np.ones(n_col), ([k for k, _, _, _ in columnas], list(range(n_col)))),
+            shape=(len(self.productos), n_col + n_rutas)
+        ).tocsr()
+
+        c = np.concatenate([[costo for _, _, costo, _ in columnas], np.full(n_rutas, self.gran_m)])
+
+        resultado = linprog(
+            c,
+            A_ub=a_ub if n_rutas else None,
+            b_ub=capacidades if n_rutas else None,
+            A_eq=a_eq,
+            b_eq=np.ones(len(self.productos)),
+            bounds=(0, None),
+            method="highs"
+        )
+        if resultado.status != 0:
+            raise ValueError(f"No se pudo resolver el problema maestro: {resultado.message}")
+
+        duales_rutas = resultado.ineqlin.marginals if n_rutas else np.zeros(0)
+        return (
+            float(resultado.fun),
+            resultado.x[:n_col],
+            resultado.x[n_col:],
+            np.asarray(duales_rutas, dtype=float),
+            np.asarray(resultado.eqlin.marginals, dtype=float)
+        )
+
+    def _resultado(self, columnas, lambdas, holguras, rutas):
+        """Combina las columnas con sus pesos λ en flujos por producto"""
+        flujos = {k: {} for k in self.productos}
+        uso = {}
+        faltantes = {k: 0.0 for k in self.productos}
+        costo_total = 0.0
+
+        for (k, plan, _, faltante), peso in zip(columnas, lambdas):
+            if peso <= 1e-12:
+                continue
+            producto = self.productos[k]
+            faltantes[producto] += peso * faltante
+            for (i, j), q in plan.items():
+                nombre = (self.origenes[i], self.destinos[j])
+                flujos[producto][nombre] = flujos[producto].get(nombre, 0.0) + peso * q
+                uso[(i, j)] = uso.get((i, j), 0.0) + peso * q
+                costo_total += peso * q * self.costos.obtener_costo(i, j)
+
+        uso_rutas = {
+            (self.origenes[i], self.destinos[j]): (float(cantidad), self.capacidad.get((i, j), np.inf))
+            for (i, j), cantidad in uso.items()
+        }
+
+        return {
+            "costo_total": costo_total,
+            "cota_inferior": self.iteraciones[-1]["cota_inferior"] if self.iteraciones else costo_total,
+            "flujos": flujos,
+            "uso_rutas": uso_rutas,
+            "demanda_insatisfecha": {k: float(v) for k, v in faltantes.items()},
+            "factible": bool(np.all(holguras <= 1e-6)) and all(f <= 1e-6 for f in faltantes.values()),
+            "iteraciones": self.iteraciones
+        }
+
+
+def _resolver_subproblema(tarea):
+    """
+    Subproblema de precios de un producto: transporte sin capacidades.
+
+    Se define a nivel de módulo para poder enviarlo a otros procesos.
+
+    Returns:
+        tuple: (plan {(i, j): cantidad}, demanda no cubierta)
+    """
+    costos, oferta, demanda, penalizacion = tarea
+    filas, columnas = costos.filas, costos.columnas
+
+    # Holguras siempre presentes (como en Transbordo): el subproblema queda
+    # balanceado y es factible aunque algún destino no tenga rutas
+    arcos = list(zip(costos.origen.tolist(), costos.destino.tolist(), costos.costo.tolist()))
+    arcos.extend((i, columnas, 0) for i in range(filas))
+    arcos.extend((filas, j, penalizacion) for j in range(columnas))
+    arcos.append((filas, columnas, 0))
+    costos = CostosDispersos(arcos, filas + 1, columnas + 1)
+    oferta = list(oferta) + [sum(demanda)]
+    demanda = list(demanda) + [sum(oferta[:filas])]
+
+    inicial = MetodoVogel(costos, oferta, demanda).resolver()
+    solucion = OptimizadorTransporte(costos, inicial).resolver()
+
+    plan = {}
+    faltante = 0
+    for (i, j), cantidad in solucion.items():
+        if i < filas and j < columnas:
+            plan[(i, j)] = cantidad
+        elif i == filas and j < columnas:
+            faltante += cantidad
+
+    return plan, float(faltante)
+
+
+class _Ejecutor:
+    """Pool de procesos reutilizado entre iteraciones; secuencial si procesos <= 1"""
+
+    def __init__(self, procesos):
+        self.procesos = procesos
+        self.pool = None
+
+    def __enter__(self):
+        if self.procesos and self.procesos > 1:
+            self.pool = ProcessPoolExecutor(max_workers=self.procesos)
+        return self
+
+    def map(self, funcion, tareas):
+        if self.pool is None:
+            return map(funcion, tareas)
+        return self.pool.map(funcion, tareas)
+
+    def __exit__(self, *args):
+        if self.pool is not None:
+            self.pool.shutdown()
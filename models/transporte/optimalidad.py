@@ -7,6 +7,11 @@ Descripción: Implementación del método MODI (Modified Distribution) y Steppin
 
 import copy
 
+import numpy as np
+
+from .dispersos import CostosDispersos
+from .problema import ProblemaTransporte
+
 
 class OptimizadorTransporte:
     """
@@ -15,21 +20,46 @@ class OptimizadorTransporte:
     El método MODI calcula los potenciales u y v para cada fila y columna, luego
     evalúa las celdas no básicas para ver si pueden mejorar la solución. Si se
     encuentra una mejora, usa Stepping Stone para ajustar la asignación.
+
+    Si los costos se entregan como CostosDispersos, sólo se evalúan las rutas
+    permitidas y la solución se maneja como diccionario {(i, j): cantidad}.
     """
 
-    def __init__(self, costos, solucion_inicial):
+    def __init__(self, costos, solucion_inicial, max_iteraciones=None):
         """
         Inicializa el optimizador.
 
         Args:
-            costos: Matriz de costos unitarios
-            solucion_inicial: Matriz de solución inicial (obtenida de Vogel u otro método)
+            costos: Matriz de costos unitarios, CostosDispersos o ProblemaTransporte
+                    (con el problema se reutilizan sus costos y su orden por costo)
+            solucion_inicial: Matriz de solución inicial (obtenida de Vogel u otro método),
+                              o diccionario {(i, j): cantidad} para costos dispersos
+            max_iteraciones: Límite de iteraciones (por defecto 50 en el caso denso
+                             y 100·(m+n) en el disperso)
         """
-        self.costos = copy.deepcopy(costos)
-        self.solucion = copy.deepcopy(solucion_inicial)
-
-        self.num_origenes = len(costos)
-        self.num_destinos = len(costos[0])
+        # Los costos no se modifican durante la optimización: se comparten sin copiarlos
+        self.problema = costos if isinstance(costos, ProblemaTransporte) else None
+        if self.problema is not None:
+            costos = self.problema.costos if self.problema.disperso else self.problema.costos_lista
+        self.disperso = isinstance(costos, CostosDispersos)
+
+        if self.disperso:
+            self.costos = costos
+            self.solucion = self._solucion_a_diccionario(solucion_inicial)
+            self.num_origenes = costos.filas
+            self.num_destinos = costos.columnas
+            # Costo Gran M de las celdas artificiales que dejan Costo Mínimo/Vogel
+            costo_max = float(np.abs(costos.costo).max()) if len(costos) else 0.0
+            self.gran_m = (costo_max + 1) * (self.num_origenes + self.num_destinos + 1)
+        else:
+            self.costos = costos
+            self.solucion = [list(fila) for fila in solucion_inicial]
+            self.num_origenes = len(costos)
+            self.num_destinos = len(costos[0])
+
+        if max_iteraciones is None:
+            max_iteraciones = 100 * (self.num_origenes + self.num_destinos) if self.disperso else 50
+        self.max_iteraciones = max_iteraciones
 
         self.pasos = []
         self.iteracion = 0
@@ -306,11 +336,14 @@ class OptimizadorTransporte:
         Ejecuta el proceso completo de optimización con MODI y Stepping Stone.
 
         Returns:
-            list: Matriz de solución óptima
+            list: Matriz de solución óptima ({(i, j): cantidad} si los costos son dispersos)
         """
+        if self.disperso:
+            return self._resolver_disperso()
+
         self.pasos = []
         self.iteracion = 0
-        max_iteraciones = 50
+        max_iteraciones = self.max_iteraciones
 
         while self.iteracion < max_iteraciones:
             self.iteracion += 1
@@ -390,8 +423,228 @@ class OptimizadorTransporte:
         Returns:
             float: Costo total
         """
+        if self.disperso:
+            return sum(cantidad * self.costos.obtener_costo(i, j)
+                       for (i, j), cantidad in self.solucion.items())
+
         costo = 0
         for i in range(self.num_origenes):
             for j in range(self.num_destinos):
                 costo += self.solucion[i][j] * self.costos[i][j]
-        return costo
\ No newline at end of file
+        return costo
+
+    # ---------------------------------------------------------------
+    # VERSIÓN DISPERSA (sólo rutas permitidas)
+    # ---------------------------------------------------------------
+    @staticmethod
+    def _solucion_a_diccionario(solucion):
+        """Convierte una matriz o diccionario de asignación a {(i, j): cantidad > 0}"""
+        if isinstance(solucion, dict):
+            return {celda: cantidad for celda, cantidad in solucion.items() if cantidad > 0}
+
+        return {
+            (i, j): cantidad
+            for i, fila in enumerate(solucion)
+            for j, cantidad in enumerate(fila)
+            if cantidad > 0
+        }
+
+    def _completar_base(self):
+        """
+        Construye una base de m+n-1 celdas (árbol generador) a partir de la solución.
+
+        Las celdas con asignación positiva entran primero (incluidas las
+        artificiales); si la solución es degenerada se completa con rutas
+        permitidas de asignación cero, de menor a mayor costo, que unan
+        componentes distintas.
+
+        Returns:
+            set: Celdas básicas (i, j)
+        """
+        m = self.num_origenes
+        padre = list(range(m + self.num_destinos))
+
+        def encontrar(x):
+            while padre[x] != x:
+                padre[x] = padre[padre[x]]
+                x = padre[x]
+            return x
+
+        base = set()
+        for (i, j) in self.solucion:
+            ri, rj = encontrar(i), encontrar(m + j)
+            if ri == rj:
+                raise ValueError("La solución inicial no es básica: contiene un ciclo")
+            padre[ri] = rj
+            base.add((i, j))
+
+        objetivo = m + self.num_destinos - 1
+        if len(base) < objetivo:
+            origen = self.costos.origen.tolist()
+            destino = self.costos.destino.tolist()
+            if self.problema is not None:
+                orden = self.problema.orden_global.tolist()
+            else:
+                orden = np.argsort(self.costos.costo, kind='stable').tolist()
+            for k in orden:
+                ri, rj = encontrar(origen[k]), encontrar(m + destino[k])
+                if ri != rj:
+                    padre[ri] = rj
+                    base.add((origen[k], destino[k]))
+                    if len(base) == objetivo:
+                        break
+
+        return base
+
+    def _costo_celda(self, i, j):
+        """Costo de una celda básica: el real, o Gran M si es artificial"""
+        costo = self.costos.obtener_costo(i, j)
+        return self.gran_m if costo == np.inf else costo
+
+    def _potenciales_base(self, base):
+        """
+        Calcula u_i, v_j recorriendo el árbol de la base (u = 0 en cada raíz).
+
+        Los nodos 0..m-1 son filas y m..m+n-1 columnas.
+
+        Returns:
+            tuple: (u, v, padre, profundidad) con u y v como arreglos de NumPy
+        """
+        m = self.num_origenes
+        total = m + self.num_destinos
+        vecinos = [[] for _ in range(total)]
+        for (i, j) in base:
+            vecinos[i].append(m + j)
+            vecinos[m + j].append(i)
+
+        potencial = np.zeros(total)
+        padre = [-1] * total
+        profundidad = [-1] * total
+
+        for raiz in range(total):
+            if profundidad[raiz] != -1:
+                continue
+            profundidad[raiz] = 0
+            pila = [raiz]
+            while pila:
+                x = pila.pop()
+                for y in vecinos[x]:
+                    if profundidad[y] != -1:
+                        continue
+                    padre[y] = x
+                    profundidad[y] = profundidad[x] + 1
+                    i, j = (x, y - m) if x < m else (y, x - m)
+                    # u_i + v_j = c_ij
+                    potencial[y] = self._costo_celda(i, j) - potencial[x]
+                    pila.append(y)
+
+        return potencial[:m], potencial[m:], padre, profundidad
+
+    def _ciclo_en_base(self, i_entra, j_entra, padre, profundidad):
+        """
+        Ciclo formado al agregar la celda (i_entra, j_entra) al árbol de la base.
+
+        Returns:
+            list: Tuplas (i, j, signo) empezando por la celda entrante con '+'
+        """
+        m = self.num_origenes
+        a, b = i_entra, m + j_entra
+
+        # Subir desde ambos extremos hasta el ancestro común
+        desde_b, desde_a = [b], [a]
+        while profundidad[b] > profundidad[a]:
+            b = padre[b]
+            desde_b.append(b)
+        while profundidad[a] > profundidad[b]:
+            a = padre[a]
+            desde_a.append(a)
+        while a != b:
+            a, b = padre[a], padre[b]
+            desde_a.append(a)
+            desde_b.append(b)
+
+        camino = desde_b + desde_a[-2::-1]  # columna entrante → ... → fila entrante
+
+        ciclo = [(i_entra, j_entra, '+')]
+        for idx in range(len(camino) - 1):
+            x, y = camino[idx], camino[idx + 1]
+            i, j = (x, y - m) if x < m else (y, x - m)
+            ciclo.append((i, j, '-' if idx % 2 == 0 else '+'))
+
+        return ciclo
+
+    def _resolver_disperso(self):
+        """
+        MODI + Stepping Stone sobre rutas permitidas.
+
+        La base se mantiene explícitamente como árbol generador, de modo que los
+        potenciales y el ciclo se obtienen recorriendo el árbol (O(m+n)) y los
+        costos marginales se evalúan de forma vectorizada sólo sobre los arcos
+        existentes (O(E)), sin construir matrices m×n. Las celdas artificiales
+        de la solución inicial cuestan Gran M y nunca vuelven a entrar.
+
+        Returns:
+            dict: Solución óptima {(i, j): cantidad}
+        """
+        self.pasos = []
+        self.iteracion = 0
+        base = self._completar_base()
+        origen = self.costos.origen
+        destino = self.costos.destino
+
+        while self.iteracion < self.max_iteraciones:
+            self.iteracion += 1
+
+            u, v, padre, profundidad = self._potenciales_base(base)
+            marginales = self.costos.costo - u[origen] - v[destino]
+            k = int(np.argmin(marginales))
+            mejor_valor = float(marginales[k])
+
+            if mejor_valor >= -1e-9:
+                artificiales = [celda for celda in self.solucion if not self.costos.permitido(*celda)]
+                if artificiales:
+                    raise ValueError(
+                        "El problema no tiene solución factible con las rutas permitidas "
+                        f"(quedan {len(artificiales)} celdas artificiales en la solución)"
+                    )
+
+                self.pasos.append({
+                    'iteracion': self.iteracion,
+                    'status': 'optimo',
+                    'mensaje': '✅ **SOLUCIÓN ÓPTIMA ALCANZADA**\n\nTodos los costos marginales son ≥ 0. No es posible mejorar más la solución.',
+                    'costo_total': self.obtener_costo_total()
+                })
+                break
+
+            i_mejor, j_mejor = int(origen[k]), int(destino[k])
+            ciclo = self._ciclo_en_base(i_mejor, j_mejor, padre, profundidad)
+
+            # Theta: mínimo en las celdas '-' (la primera en alcanzarlo sale de la base)
+            theta, celda_sale = None, None
+            for (i, j, signo) in ciclo:
+                if signo == '-':
+                    valor = self.solucion.get((i, j), 0)
+                    if theta is None or valor < theta:
+                        theta, celda_sale = valor, (i, j)
+
+            for (i, j, signo) in ciclo:
+                valor = self.solucion.get((i, j), 0) + (theta if signo == '+' else -theta)
+                if valor > 0:
+                    self.solucion[(i, j)] = valor
+                else:
+                    self.solucion.pop((i, j), None)
+
+            base.remove(celda_sale)
+            base.add((i_mejor, j_mejor))
+
+            self.pasos.append({
+                'iteracion': self.iteracion,
+                'celda_entrante': (i_mejor, j_mejor),
+                'celda_saliente': celda_sale,
+                'costo_marginal': mejor_valor,
+                'ciclo': " → ".join([f"({i + 1},{j + 1}){s}" for i, j, s in ciclo]),
+                'theta': theta,
+                'costo_total': self.obtener_costo_total()
+            })
+
+        return self.solucion
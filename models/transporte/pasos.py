@@ -0,0 +1,59 @@
+"""
+models/transporte/pasos.py
+Reconstrucción de matrices de asignación a partir de pasos registrados como deltas
+"""
+
+import numpy as np
+
+
+def matrices_por_paso(pasos, filas, columnas):
+    """
+    Generador que reconstruye la matriz de asignación después de cada paso.
+
+    Cada paso sólo guarda la celda modificada y la cantidad asignada, por lo
+    que la matriz se acumula sobre un único arreglo de trabajo y se copia
+    únicamente cuando la vista la solicita.
+
+    Args:
+        pasos: Lista (o iterable) de pasos con claves 'celda' y 'cantidad'
+        filas: Número de orígenes
+        columnas: Número de destinos
+
+    Yields:
+        list: Matriz de asignación (listas anidadas) tras cada paso
+    """
+    matriz = np.zeros((filas, columnas), dtype=float)
+
+    for paso in pasos:
+        i, j = paso['celda']
+        matriz[i, j] = paso['cantidad']
+        yield _a_lista(matriz)
+
+
+def matriz_en_paso(pasos, filas, columnas, indice):
+    """
+    Reconstruye la matriz de asignación tal como estaba tras el paso `indice`.
+
+    Args:
+        pasos: Lista de pasos con claves 'celda' y 'cantidad'
+        filas: Número de orígenes
+        columnas: Número de destinos
+        indice: Posición (base 0) del paso en la lista
+
+    Returns:
+        list: Matriz de asignación (listas anidadas)
+    """
+    matriz = np.zeros((filas, columnas), dtype=float)
+
+    for paso in pasos[:indice + 1]:
+        i, j = paso['celda']
+        matriz[i, j] = paso['cantidad']
+
+    return _a_lista(matriz)
+
+
+def _a_lista(matriz):
+    """Convierte a listas anidadas conservando enteros cuando no hay fracciones"""
+    if np.all(np.mod(matriz, 1) == 0):
+        return matriz.astype(int).tolist()
+    return matriz.tolist()
@@ -0,0 +1,213 @@
+"""
+models/transporte/problema.py
+Contenedor tipado de un problema de transporte (costos, oferta y demanda)
+"""
+
+import math
+from functools import cached_property
+
+import numpy as np
+
+from .dispersos import CostosDispersos
+
+
+# Cifras significativas (respecto del total) que se conservan al restar cantidades float64
+CIFRAS_CANTIDADES = 12
+
+
+class ProblemaTransporte:
+    """
+    Problema de transporte con arreglos NumPy contiguos y un único tipo de
+    cantidades para todos los métodos.
+
+    El tipo (int64 o float64) se elige una sola vez al construir el problema:
+    enteros si toda la oferta y la demanda son enteras (botellas, camiones) y
+    float64 si hay fracciones (pallets parciales, litros de materia prima).
+    Los métodos de transporte usan este tipo para la asignación y los pasos,
+    en lugar de convertir a int y truncar las fracciones.
+
+    El problema es inmutable: los arreglos son de sólo lectura y los órdenes
+    por costo (global, por fila y por columna) se calculan una única vez y se
+    comparten entre Esquina Noroeste, Costo Mínimo, Vogel y MODI. Comparar los
+    tres métodos iniciales sobre la misma instancia no vuelve a convertir,
+    copiar ni ordenar los costos.
+    """
+
+    def __init__(self, costos, oferta, demanda, tipo=None):
+        """
+        Args:
+            costos: Matriz m×n de costos (listas anidadas o arreglo) o CostosDispersos
+            oferta: Oferta de cada origen
+            demanda: Demanda de cada destino
+            tipo: Tipo de las cantidades (np.int64 o np.float64); por defecto se deduce
+        """
+        self.disperso = isinstance(costos, CostosDispersos)
+        self.tipo = np.dtype(tipo) if tipo is not None else tipo_cantidades(oferta, demanda)
+
+        if self.tipo not in (np.dtype(np.int64), np.dtype(np.float64)):
+            raise ValueError("El tipo de las cantidades debe ser int64 o float64")
+
+        # .view(): marcar sólo lectura no debe afectar a los arreglos del llamador
+        self.oferta = np.ascontiguousarray(oferta, dtype=self.tipo).view()
+        self.demanda = np.ascontiguousarray(demanda, dtype=self.tipo).view()
+        self.filas = self.oferta.size
+        self.columnas = self.demanda.size
+
+        if self.disperso:
+            self.costos = costos
+            forma = (costos.filas, costos.columnas)
+        else:
+            self.costos = np.ascontiguousarray(costos, dtype=np.float64).view()
+            forma = self.costos.shape
+
+        if forma != (self.filas, self.columnas):
+            raise ValueError(
+                f"La matriz de costos es {forma[0]}×{forma[1] if len(forma) > 1 else 0} "
+                f"pero hay {self.filas} orígenes y {self.columnas} destinos"
+            )
+        if np.any(self.oferta < 0) or np.any(self.demanda < 0):
+            raise ValueError("La oferta y la demanda no pueden ser negativas")
+
+        for arreglo in (self.oferta, self.demanda) if self.disperso else (self.oferta, self.demanda, self.costos):
+            arreglo.setflags(write=False)
+        self._congelado = True
+
+    def __setattr__(self, nombre, valor):
+        if getattr(self, "_congelado", False):
+            raise AttributeError("ProblemaTransporte es inmutable")
+        super().__setattr__(nombre, valor)
+
+    @classmethod
+    def desde(cls, costos, oferta=None, demanda=None):
+        """
+        Devuelve `costos` si ya es un ProblemaTransporte o construye uno nuevo.
+
+        Permite que los métodos acepten tanto el contenedor como la forma
+        tradicional (costos, oferta, demanda).
+        """
+        if isinstance(costos, cls):
+            return costos
+        if oferta is None or demanda is None:
+            raise ValueError("Se requieren la oferta y la demanda")
+        return cls(costos, oferta, demanda)
+
+    @property
+    def entero(self):
+        """Indica si las cantidades son enteras"""
+        return self.tipo.kind == "i"
+
+    def cantidad(self, valor):
+        """Convierte una cantidad al escalar de Python del tipo del problema"""
+        return int(valor) if self.entero else float(valor)
+
+    @cached_property
+    def _escala(self):
+        return max(float(self.oferta.sum()), float(self.demanda.sum()))
+
+    def ajustar(self, valor):
+        """
+        Quita el error de redondeo de una cantidad restante.
+
+        Con cantidades float64, restar decimales deja residuos como
+        0.3 - 0.1 = 0.19999999999999998 o 2.8e-17 en lugar de 0, que luego
+        fallan las comparaciones con 0 y agregan celdas básicas falsas. Se
+        redondea a CIFRAS_CANTIDADES cifras respecto del total de la oferta o
+        la demanda; las cantidades enteras no cambian.
+        """
+        if self.entero:
+            return valor
+        return redondear_cantidad(valor, self._escala)
+
+    def asignacion_vacia(self):
+        """Matriz m×n de ceros del tipo del problema"""
+        return np.zeros((self.filas, self.columnas), dtype=self.tipo)
+
+    # Los órdenes se calculan la primera vez que un método los pide
+    # (cached_property escribe en __dict__ sin pasar por __setattr__)
+
+    @cached_property
+    def orden_global(self):
+        """
+        Celdas ordenadas por costo (orden estable: a igual costo, por filas).
+
+        Returns:
+            np.ndarray: Índices planos i·n + j (denso) o índices de arco (disperso)
+        """
+        costos = self.costos.costo if self.disperso else self.costos.ravel()
+        return _solo_lectura(np.argsort(costos, kind="stable"))
+
+    @cached_property
+    def orden_filas(self):
+        """
+        Denso: matriz m×n con las columnas de cada fila ordenadas por costo.
+        Disperso: índices de arco agrupados por fila (ver CostosDispersos.arcos_fila).
+        """
+        if self.disperso:
+            return self.costos.orden_filas
+        return _solo_lectura(np.argsort(self.costos, axis=1, kind="stable"))
+
+    @cached_property
+    def orden_columnas(self):
+        """
+        Denso: matriz n×m con las filas de cada columna ordenadas por costo.
+        Disperso: índices de arco agrupados por columna (ver CostosDispersos.arcos_columna).
+        """
+        if self.disperso:
+            return self.costos.orden_columnas
+        return _solo_lectura(np.ascontiguousarray(np.argsort(self.costos, axis=0, kind="stable").T))
+
+    @cached_property
+    def costos_lista(self):
+        """Costos densos como listas anidadas, para los recorridos en Python puro (Vogel, MODI)"""
+        if self.disperso:
+            raise ValueError("costos_lista sólo está disponible para costos densos")
+        return self.costos.tolist()
+
+    def __repr__(self):
+        return (
+            f"ProblemaTransporte(filas={self.filas}, columnas={self.columnas}, "
+            f"tipo={self.tipo.name}, disperso={self.disperso})"
+        )
+
+
+def _solo_lectura(arreglo):
+    """Marca un arreglo cacheado como de sólo lectura"""
+    arreglo.setflags(write=False)
+    return arreglo
+
+
+def tipo_cantidades(*cantidades):
+    """
+    Elige int64 si todas las cantidades son enteras y float64 en otro caso.
+
+    Args:
+        *cantidades: Listas o arreglos de oferta/demanda
+
+    Returns:
+        np.dtype: Tipo común para las cantidades
+    """
+    valores = [np.asarray(c) for c in cantidades]
+    if all(v.dtype.kind in "iub" for v in valores):
+        return np.dtype(np.int64)
+
+    for v in valores:
+        v = v.astype(np.float64)
+        if not np.all(np.isfinite(v)) or np.any(v != np.floor(v)) or np.any(np.abs(v) >= 2 ** 53):
+            return np.dtype(np.float64)
+    return np.dtype(np.int64)
+
+
+def redondear_cantidad(valor, escala):
+    """
+    Redondea una cantidad float a CIFRAS_CANTIDADES cifras significativas
+    respecto de `escala` (p. ej. el total de la oferta), así los residuos como
+    1.1e-16 quedan en 0.
+    """
+    decimales = CIFRAS_CANTIDADES - math.ceil(math.log10(max(escala, 1.0)))
+    return round(valor, decimales) + 0.0  # + 0.0: sin -0.0
+
+
+def como_cantidad(valor):
+    """Escalar de Python para mostrar una cantidad: int si no tiene fracción"""
+    valor = float(valor)
+    return int(valor) if valor.is_integer() else valor
@@ -0,0 +1,192 @@
+"""
+models/transporte/transbordo.py
+Modelo de Transbordo: plantas → centros de distribución → puntos de venta
+
+Resuelve las dos capas de costos (COSTOS_TRANSPORTE_DISTRIBUCION y
+COSTOS_TRANSPORTE_VENTA) en un solo problema, en lugar de dos problemas de
+transporte independientes.
+"""
+
+from .dispersos import CostosDispersos
+from .vogel import MetodoVogel
+from .costo_minimo import CostoMinimo
+from .optimalidad import OptimizadorTransporte
+
+
+class Transbordo:
+    """
+    Problema de transbordo de dos niveles resuelto como un único problema de
+    transporte disperso (flujo de costo mínimo).
+
+    Reducción clásica: cada centro aparece como origen y como destino con un
+    "colchón" igual a su capacidad de almacenamiento B. El arco centro → sí
+    mismo cuesta 0 y absorbe la capacidad no usada, de modo que el flujo que
+    pasa por el centro es B - x_cc ≤ B. Sólo existen los arcos planta → centro,
+    centro → punto de venta y centro → sí mismo, por lo que se usa
+    CostosDispersos en lugar de rellenar las rutas inexistentes con costos
+    enormes.
+
+    Filas: plantas + centros + origen ficticio (demanda insatisfecha)
+    Columnas: centros + puntos de venta + destino ficticio (oferta sobrante)
+    """
+
+    def __init__(self, oferta_plantas, capacidad_centros, demanda_puntos,
+                 costos_distribucion, costos_venta, penalizacion_demanda=None):
+        """
+        Args:
+            oferta_plantas: Diccionario {planta: oferta}
+            capacidad_centros: Diccionario {centro: capacidad}
+            demanda_puntos: Diccionario {punto_venta: demanda}
+            costos_distribucion: {planta: {centro: costo}}
+            costos_venta: {centro: {punto_venta: costo}}
+            penalizacion_demanda: Costo unitario de la demanda que no se puede cubrir
+                                  (por defecto, mayor que cualquier ruta planta → centro → punto,
+                                  de modo que sólo queda demanda sin cubrir si falta capacidad)
+        """
+        self.plantas = list(oferta_plantas)
+        self.centros = list(capacidad_centros)
+        self.puntos = list(demanda_puntos)
+        self.oferta_plantas = dict(oferta_plantas)
+        self.capacidad_centros = dict(capacidad_centros)
+        self.demanda_puntos = dict(demanda_puntos)
+        self.costos_distribucion = costos_distribucion
+        self.costos_venta = costos_venta
+
+        if penalizacion_demanda is None:
+            penalizacion_demanda = 1 + _costo_maximo(costos_distribucion) + _costo_maximo(costos_venta)
+        self.penalizacion_demanda = penalizacion_demanda
+
+        self.optimizador = None
+        self.solucion = None
+
+    @classmethod
+    def desde_datos_empresa(cls, penalizacion_demanda=None):
+        """
+        Construye el problema con los datos diarios de la empresa
+        (capacidad diaria de plantas, capacidad de almacenamiento de centros
+        y demanda diaria de puntos de venta).
+        """
+        from empresa.datos_empresa import (
+            PLANTAS, CENTROS_DISTRIBUCION, PUNTOS_VENTA,
+            COSTOS_TRANSPORTE_DISTRIBUCION, COSTOS_TRANSPORTE_VENTA
+        )
+
+        return cls(
+            {p: datos["capacidad_diaria"] for p, datos in PLANTAS.items()},
+            {c: datos["capacidad_almacenamiento"] for c, datos in CENTROS_DISTRIBUCION.items()},
+            {v: datos["demanda_diaria"] for v, datos in PUNTOS_VENTA.items()},
+            COSTOS_TRANSPORTE_DISTRIBUCION,
+            COSTOS_TRANSPORTE_VENTA,
+            penalizacion_demanda=penalizacion_demanda
+        )
+
+    def construir_problema(self):
+        """
+        Arma el problema de transporte disperso equivalente.
+
+        Returns:
+            tuple: (CostosDispersos, oferta, demanda)
+        """
+        np_, nc, nv = len(self.plantas), len(self.centros), len(self.puntos)
+        idx_centro = {c: k for k, c in enumerate(self.centros)}
+        idx_punto = {v: k for k, v in enumerate(self.puntos)}
+
+        arcos = []
+        for i, planta in enumerate(self.plantas):
+            for centro, costo in self.costos_distribucion.get(planta, {}).items():
+                if centro in idx_centro:
+                    arcos.append((i, idx_centro[centro], costo))
+
+        for k, centro in enumerate(self.centros):
+            arcos.append((np_ + k, k, 0))
+            for punto, costo in self.costos_venta.get(centro, {}).items():
+                if punto in idx_punto:
+                    arcos.append((np_ + k, nc + idx_punto[punto], costo))
+
+        capacidades = [self.capacidad_centros[c] for c in self.centros]
+        oferta = [self.oferta_plantas[p] for p in self.plantas] + capacidades
+        demanda = capacidades + [self.demanda_puntos[v] for v in self.puntos]
+        filas, columnas = np_ + nc, nc + nv
+
+        # Holguras, siempre presentes para que el problema quede balanceado y
+        # sea factible aunque algún punto de venta no tenga rutas:
+        # - destino ficticio: oferta de plantas que no se despacha (costo 0)
+        # - origen ficticio: demanda que no se cubre (penalización)
+        oferta_total, demanda_total = sum(oferta[:np_]), sum(demanda[nc:])
+        arcos.extend((i, columnas, 0) for i in range(np_))
+        arcos.extend((filas, nc + j, self.penalizacion_demanda) for j in range(nv))
+        arcos.append((filas, columnas, 0))
+        oferta.append(demanda_total)
+        demanda.append(oferta_total)
+        filas += 1
+        columnas += 1
+
+        return CostosDispersos(arcos, filas, columnas), oferta, demanda
+
+    def resolver(self, metodo_inicial="vogel"):
+        """
+        Resuelve el transbordo completo con una solución inicial (Vogel o
+        Costo Mínimo) y MODI sobre los arcos permitidos.
+
+        Returns:
+            dict: Plan de envíos con claves 'costo_total', 'envios_distribucion',
+                  'envios_venta', 'flujo_centros', 'oferta_sobrante',
+                  'demanda_insatisfecha' e 'iteraciones'
+        """
+        costos, oferta, demanda = self.construir_problema()
+
+        if metodo_inicial == "vogel":
+            inicial = MetodoVogel(costos, oferta, demanda).resolver()
+        elif metodo_inicial == "costo_minimo":
+            inicial = CostoMinimo(costos, oferta, demanda).resolver()["asignacion"]
+        else:
+            raise ValueError(f"Método inicial desconocido: {metodo_inicial}")
+
+        self.optimizador = OptimizadorTransporte(costos, inicial)
+        self.solucion = self.optimizador.resolver()
+
+        return self._interpretar(self.solucion)
+
+    def _interpretar(self, solucion):
+        """Traduce la solución del problema equivalente a envíos por nivel"""
+        np_, nc, nv = len(self.plantas), len(self.centros), len(self.puntos)
+
+        envios_distribucion = {}
+        envios_venta = {}
+        oferta_sobrante = {p: 0 for p in self.plantas}
+        demanda_insatisfecha = {v: 0 for v in self.puntos}
+        costo_total = 0
+
+        for (i, j), cantidad in solucion.items():
+            if i < np_ and j < nc:
+                planta, centro = self.plantas[i], self.centros[j]
+                envios_distribucion[(planta, centro)] = cantidad
+                costo_total += cantidad * self.costos_distribucion[planta][centro]
+            elif i < np_:
+                oferta_sobrante[self.plantas[i]] += cantidad
+            elif i < np_ + nc and nc <= j < nc + nv:
+                centro, punto = self.centros[i - np_], self.puntos[j - nc]
+                envios_venta[(centro, punto)] = cantidad
+                costo_total += cantidad * self.costos_venta[centro][punto]
+            elif i == np_ + nc and nc <= j < nc + nv:
+                demanda_insatisfecha[self.puntos[j - nc]] += cantidad
+                costo_total += cantidad * self.penalizacion_demanda
+
+        flujo_centros = {c: 0 for c in self.centros}
+        for (_, centro), cantidad in envios_distribucion.items():
+            flujo_centros[centro] += cantidad
+
+        return {
+            "costo_total": costo_total,
+            "envios_distribucion": envios_distribucion,
+            "envios_venta": envios_venta,
+            "flujo_centros": flujo_centros,
+            "oferta_sobrante": oferta_sobrante,
+            "demanda_insatisfecha": demanda_insatisfecha,
+            "iteraciones": self.optimizador.iteracion if self.optimizador else 0
+        }
+
+
+def _costo_maximo(costos):
+    """Mayor costo de un diccionario anidado {origen: {destino: costo}}"""
+    return max((costo for fila in costos.values() for costo in fila.values()), default=0)
@@ -3,19 +3,50 @@ models/transporte/vogel.py
 Método de Vogel adaptado para Coca-Cola
 """
 
+from .dispersos import completar_con_artificiales
+from .problema import ProblemaTransporte
+
 
 class MetodoVogel:
-    def __init__(self, costos, oferta, demanda):
-        self.costos = costos
-        self.oferta = list(oferta)
-        self.demanda = list(demanda)
-        self.filas = len(oferta)
-        self.cols = len(demanda)
-        self.asignacion = [[0 for _ in range(self.cols)] for _ in range(self.filas)]
+    def __init__(self, costos, oferta=None, demanda=None):
+        # Acepta un ProblemaTransporte o la forma (costos, oferta, demanda)
+        self.problema = ProblemaTransporte.desde(costos, oferta, demanda)
+        self.costos = self.problema.costos
+        self.oferta = self.problema.oferta.tolist()
+        self.demanda = self.problema.demanda.tolist()
+        self.filas = self.problema.filas
+        self.cols = self.problema.columnas
+        # Con CostosDispersos la asignación se guarda como {(i, j): cantidad}
+        self.disperso = self.problema.disperso
+        if self.disperso:
+            self.asignacion = {}
+        else:
+            cero = self.problema.cantidad(0)
+            self.asignacion = [[cero for _ in range(self.cols)] for _ in range(self.filas)]
         # AQUÍ GUARDAMOS LA HISTORIA PASO A PASO
         self.pasos = []
 
-    def resolver(self):
+    def iterar_pasos(self):
+        """
+        Generador que produce cada paso en el momento en que se realiza la asignación.
+
+        Los pasos se registran como deltas (celda, cantidad); la matriz completa
+        se reconstruye sólo al mostrarla (ver models/transporte/pasos.py).
+        """
+        if self.disperso:
+            yield from self._iterar_pasos_disperso()
+            return
+
+        # Órdenes por costo cacheados en el problema: cada fila/columna avanza un
+        # puntero sobre ellos en lugar de reordenar sus costos en cada paso
+        costos = self.problema.costos_lista
+        orden_f = self.problema.orden_filas.tolist()
+        orden_c = self.problema.orden_columnas.tolist()
+        todas_f = range(self.filas)
+        todas_c = range(self.cols)
+        puntero_f = [0] * self.filas
+        puntero_c = [0] * self.cols
+
         fila_agotada = [False] * self.filas
         col_agotada = [False] * self.cols
         contador = 0
@@ -29,9 +60,8 @@ class MetodoVogel:
             info_penal_f = []  # Solo para mostrar en el log
             for i in range(self.filas):
                 if not fila_agotada[i]:
-                    validos = [self.costos[i][j] for j in range(self.cols) if not col_agotada[j]]
+                    validos = [costos[i][j] for j in self._menores_vivos(orden_f[i], puntero_f, i, todas_c, col_agotada)]
                     if len(validos) >= 2:
-                        validos.sort()
                         penal_f.append((validos[1] - validos[0], i))
                         info_penal_f.append(f"F{i + 1}: {validos[1]}-{validos[0]} = {validos[1] - validos[0]}")
                     elif len(validos) == 1:
@@ -43,9 +73,8 @@ class MetodoVogel:
             info_penal_c = []  # Solo para mostrar en el log
             for j in range(self.cols):
                 if not col_agotada[j]:
-                    validos = [self.costos[i][j] for i in range(self.filas) if not fila_agotada[i]]
+                    validos = [costos[i][j] for i in self._menores_vivos(orden_c[j], puntero_c, j, todas_f, fila_agotada)]
                     if len(validos) >= 2:
-                        validos.sort()
                         penal_c.append((validos[1] - validos[0], j))
                         info_penal_c.append(f"D{j + 1}: {validos[1]}-{validos[0]} = {validos[1] - validos[0]}")
                     elif len(validos) == 1:
@@ -68,37 +97,123 @@ class MetodoVogel:
             if max_f[0] >= max_c[0]:
                 f_sel = max_f[1]
                 paso_info["decision"] = f"🔎 Mayor penalización en Fila {f_sel + 1} (Valor: {max_f[0]})"
-                min_cost = float('inf')
-                for j in range(self.cols):
-                    if not col_agotada[j] and self.costos[f_sel][j] < min_cost:
-                        min_cost = self.costos[f_sel][j]
-                        c_sel = j
+                c_sel = orden_f[f_sel][puntero_f[f_sel]]
             else:
                 c_sel = max_c[1]
                 paso_info["decision"] = f"🔎 Mayor penalización en Columna {c_sel + 1} (Valor: {max_c[0]})"
-                min_cost = float('inf')
-                for i in range(self.filas):
-                    if not fila_agotada[i] and self.costos[i][c_sel] < min_cost:
-                        min_cost = self.costos[i][c_sel]
-                        f_sel = i
+                f_sel = orden_c[c_sel][puntero_c[c_sel]]
 
             # 4. Asignar
             qty = min(self.oferta[f_sel], self.demanda[c_sel])
             self.asignacion[f_sel][c_sel] = qty
-            self.oferta[f_sel] -= qty
-            self.demanda[c_sel] -= qty
+            self.oferta[f_sel] = self.problema.ajustar(self.oferta[f_sel] - qty)
+            self.demanda[c_sel] = self.problema.ajustar(self.demanda[c_sel] - qty)
 
             paso_info[
-                "asignacion"] = f"✏️ Asignamos {qty} unidades a la celda más barata (F{f_sel + 1}, D{c_sel + 1}) [Costo: {self.costos[f_sel][c_sel]}]"
+                "asignacion"] = f"✏️ Asignamos {qty} unidades a la celda más barata (F{f_sel + 1}, D{c_sel + 1}) [Costo: {costos[f_sel][c_sel]}]"
 
             # ⭐ AGREGAR INFORMACIÓN DE LA CELDA
             paso_info["celda"] = (f_sel, c_sel)
             paso_info["cantidad"] = qty
-            paso_info["costo_unitario"] = self.costos[f_sel][c_sel]
+            paso_info["costo_unitario"] = costos[f_sel][c_sel]
+
+            if self.oferta[f_sel] == 0:
+                fila_agotada[f_sel] = True
+            else:
+                col_agotada[c_sel] = True
+
+            contador += 1
 
-            # Guardamos una COPIA de la matriz actual
-            paso_info["matriz"] = [fila[:] for fila in self.asignacion]
-            self.pasos.append(paso_info)
+            yield paso_info
+
+    def _iterar_pasos_disperso(self):
+        """
+        Vogel sobre la lista de arcos permitidos.
+
+        Cada fila/columna recorre sus arcos ordenados por costo con un puntero
+        que sólo avanza (las filas y columnas agotadas nunca reviven), así que
+        las dos menores penalizaciones se obtienen sin reordenar en cada paso.
+        Si las rutas permitidas no alcanzan, lo pendiente se asigna a celdas
+        artificiales (costo infinito hasta que MODI las elimine).
+        """
+        costo = self.costos.costo.tolist()
+        origen = self.costos.origen.tolist()
+        destino = self.costos.destino.tolist()
+        arcos_fila = [self.costos.arcos_fila(i).tolist() for i in range(self.filas)]
+        arcos_col = [self.costos.arcos_columna(j).tolist() for j in range(self.cols)]
+        puntero_f = [0] * self.filas
+        puntero_c = [0] * self.cols
+
+        fila_agotada = [False] * self.filas
+        col_agotada = [False] * self.cols
+        contador = 0
+
+        while True:
+            paso_info = {"iteracion": contador + 1}
+
+            # 1. Penalizaciones de filas (sólo sobre columnas vivas)
+            penal_f = []
+            info_penal_f = []
+            for i in range(self.filas):
+                if fila_agotada[i]:
+                    continue
+                menores = self._menores_vivos(arcos_fila[i], puntero_f, i, destino, col_agotada)
+                if len(menores) >= 2:
+                    c0, c1 = costo[menores[0]], costo[menores[1]]
+                    penal_f.append((c1 - c0, i))
+                    info_penal_f.append(f"F{i + 1}: {c1}-{c0} = {c1 - c0}")
+                elif len(menores) == 1:
+                    penal_f.append((costo[menores[0]], i))
+                    info_penal_f.append(f"F{i + 1}: {costo[menores[0]]} (Único)")
+
+            # 2. Penalizaciones de columnas (sólo sobre filas vivas)
+            penal_c = []
+            info_penal_c = []
+            for j in range(self.cols):
+                if col_agotada[j]:
+                    continue
+                menores = self._menores_vivos(arcos_col[j], puntero_c, j, origen, fila_agotada)
+                if len(menores) >= 2:
+                    c0, c1 = costo[menores[0]], costo[menores[1]]
+                    penal_c.append((c1 - c0, j))
+                    info_penal_c.append(f"D{j + 1}: {c1}-{c0} = {c1 - c0}")
+                elif len(menores) == 1:
+                    penal_c.append((costo[menores[0]], j))
+                    info_penal_c.append(f"D{j + 1}: {costo[menores[0]]} (Único)")
+
+            if not penal_f and not penal_c:
+                break
+
+            paso_info["penal_filas_txt"] = info_penal_f
+            paso_info["penal_cols_txt"] = info_penal_c
+
+            # 3. Seleccionar mayor penalización; la celda más barata es el primer arco vivo
+            max_f = max(penal_f, key=lambda x: x[0]) if penal_f else (-1, -1)
+            max_c = max(penal_c, key=lambda x: x[0]) if penal_c else (-1, -1)
+
+            if max_f[0] >= max_c[0]:
+                f_sel = max_f[1]
+                paso_info["decision"] = f"🔎 Mayor penalización en Fila {f_sel + 1} (Valor: {max_f[0]})"
+                k = arcos_fila[f_sel][puntero_f[f_sel]]
+                c_sel = destino[k]
+            else:
+                c_sel = max_c[1]
+                paso_info["decision"] = f"🔎 Mayor penalización en Columna {c_sel + 1} (Valor: {max_c[0]})"
+                k = arcos_col[c_sel][puntero_c[c_sel]]
+                f_sel = origen[k]
+
+            # 4. Asignar
+            qty = min(self.oferta[f_sel], self.demanda[c_sel])
+            if qty > 0:
+                self.asignacion[(f_sel, c_sel)] = qty
+            self.oferta[f_sel] = self.problema.ajustar(self.oferta[f_sel] - qty)
+            self.demanda[c_sel] = self.problema.ajustar(self.demanda[c_sel] - qty)
+
+            paso_info[
+                "asignacion"] = f"✏️ Asignamos {qty} unidades a la celda más barata (F{f_sel + 1}, D{c_sel + 1}) [Costo: {costo[k]}]"
+            paso_info["celda"] = (f_sel, c_sel)
+            paso_info["cantidad"] = qty
+            paso_info["costo_unitario"] = costo[k]
 
             if self.oferta[f_sel] == 0:
                 fila_agotada[f_sel] = True
@@ -107,6 +222,64 @@ class MetodoVogel:
 
             contador += 1
 
+            yield paso_info
+
+        # Rutas permitidas agotadas: completar con celdas artificiales (Gran M)
+        if self.problema.ajustar(sum(self.oferta)) > 0 and self.problema.ajustar(sum(self.demanda)) > 0:
+            for f_sel, c_sel, qty in completar_con_artificiales(self.oferta, self.demanda,
+                                                                self.problema.ajustar):
+                self.asignacion[(f_sel, c_sel)] = qty
+                self.oferta[f_sel] = self.problema.ajustar(self.oferta[f_sel] - qty)
+                self.demanda[c_sel] = self.problema.ajustar(self.demanda[c_sel] - qty)
+                contador += 1
+
+                yield {
+                    "iteracion": contador,
+                    "penal_filas_txt": [],
+                    "penal_cols_txt": [],
+                    "decision": "⚠️ Sin rutas permitidas disponibles: se usa una celda artificial",
+                    "asignacion": f"✏️ Asignamos {qty} unidades a la celda artificial (F{f_sel + 1}, D{c_sel + 1})",
+                    "celda": (f_sel, c_sel),
+                    "cantidad": qty,
+                    "costo_unitario": float('inf'),
+                    "artificial": True
+                }
+
+    @staticmethod
+    def _menores_vivos(arcos, punteros, pos, extremo, agotado):
+        """
+        Devuelve los (hasta) dos arcos más baratos cuyo otro extremo sigue vivo.
+
+        Args:
+            arcos: Índices de arcos de la fila/columna ordenados por costo
+            punteros: Lista de punteros por fila/columna (se actualiza)
+            pos: Fila o columna consultada
+            extremo: Arreglo con el otro extremo de cada arco
+            agotado: Marcas de filas/columnas agotadas del otro extremo
+
+        Returns:
+            list: Índices de hasta dos arcos
+        """
+        p = punteros[pos]
+        while p < len(arcos) and agotado[extremo[arcos[p]]]:
+            p += 1
+        punteros[pos] = p
+
+        if p >= len(arcos):
+            return []
+
+        menores = [arcos[p]]
+        for k in arcos[p + 1:]:
+            if not agotado[extremo[k]]:
+                menores.append(k)
+                break
+        return menores
+
+    def resolver(self):
+        self.pasos = []
+        for paso in self.iterar_pasos():
+            self.pasos.append(paso)
+
         return self.asignacion
 
     def obtener_costo_total(self):
@@ -117,6 +290,10 @@ class MetodoVogel:
         Returns:
             float: El costo total de transporte
         """
+        if self.disperso:
+            return sum(cantidad * self.costos.obtener_costo(i, j)
+                       for (i, j), cantidad in self.asignacion.items())
+
         costo_total = 0
         for i in range(self.filas):
             for j in range(self.cols):
@@ -128,7 +305,7 @@ class MetodoVogel:
         Retorna la matriz de asignación actual.
 
         Returns:
-            list: Matriz de asignaciones
+            list: Matriz de asignaciones ({(i, j): cantidad} si los costos son dispersos)
         """
         return self.asignacion
 
@@ -245,7 +245,7 @@ def mostrar_resolucion_flujo_costo_minimo(resultado, origen, destino, flujo_requ
                 unsafe_allow_html=True)
 
     # Calcular flujos por arco
-    nodos = list(resultado.get('flujo_arcos', {}).keys()) if isinstance(resultado.get('flujo_arcos'), dict) else []
+    nodos = sorted({nodo for arco in resultado.get('flujo_arcos', {}) for nodo in arco})
     arcos_flujo = resultado.get('flujo_arcos', {})
 
     if arcos_flujo:
@@ -4,6 +4,8 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 from models.transporte.esquina_noroeste import EsquinaNoreste
+from models.transporte.pasos import matrices_por_paso
+from models.transporte.problema import como_cantidad
 from gemini import generar_analisis_gemini
 from huggingface_analisis_pl import generar_analisis_huggingface
 from ollama_analisis_pl import generar_analisis_ollama, verificar_ollama_disponible
@@ -49,7 +51,7 @@ def crear_grafo_transporte_esquina(orígenes, destinos, asignacion, costos, nomb
                     x0, y0 = posiciones[origen]
                     x1, y1 = posiciones[destino]
 
-                    cantidad = int(asignacion[i][j])
+                    cantidad = como_cantidad(asignacion[i][j])
                     costo = float(costos[i][j])
                     costo_total = cantidad * costo
 
@@ -200,9 +202,12 @@ def mostrar_resolucion_esquina_noroeste(costos, oferta, demanda, orígenes, dest
         tab_list = [f"Paso {p['iteracion']}" for p in pasos]
         tabs_iter = st.tabs(tab_list)
 
+        matrices = matrices_por_paso(pasos, len(orígenes), len(destinos))
+
         for idx, tab in enumerate(tabs_iter):
             with tab:
                 paso = pasos[idx]
+                matriz_actual = next(matrices)
 
                 st.markdown(
                     f"<div class='iteration-header'><h3>Paso {paso['iteracion']}: Asignación {orígenes[paso['celda'][0]]} → {destinos[paso['celda'][1]]}</h3></div>",
@@ -236,7 +241,7 @@ def mostrar_resolucion_esquina_noroeste(costos, oferta, demanda, orígenes, dest
 
                 st.subheader("📊 Matriz de Asignación Actual")
                 matriz_df = pd.DataFrame(
-                    paso['matriz'],
+                    matriz_actual,
                     index=orígenes,
                     columns=destinos
                 )
@@ -282,7 +287,7 @@ def mostrar_resolucion_esquina_noroeste(costos, oferta, demanda, orígenes, dest
 
                 desglose_data.append({
                     'Ruta': f"{orígenes[i]} → {destinos[j]}",
-                    'Cantidad': int(cant),
+                    'Cantidad': como_cantidad(cant),
                     'Costo Unitario': f"${costo_unit:.4f}",
                     'Costo Total': f"${costo_total_asign:.2f}"
                 })
@@ -299,8 +304,8 @@ def mostrar_resolucion_esquina_noroeste(costos, oferta, demanda, orígenes, dest
         verif_data.append({
             'Origen': orígenes[i],
             'Oferta': oferta[i],
-            'Asignado': int(suma_fila),
-            'Cumple': "✓" if suma_fila == oferta[i] else "✗"
+            'Asignado': como_cantidad(suma_fila),
+            'Cumple': "✓" if np.isclose(suma_fila, oferta[i]) else "✗"
         })
 
     for j in range(len(destinos)):
@@ -308,8 +313,8 @@ def mostrar_resolucion_esquina_noroeste(costos, oferta, demanda, orígenes, dest
         verif_data.append({
             'Origen': destinos[j],
             'Demanda': demanda[j],
-            'Recibido': int(suma_col),
-            'Cumple': "✓" if suma_col == demanda[j] else "✗"
+            'Recibido': como_cantidad(suma_col),
+            'Cumple': "✓" if np.isclose(suma_col, demanda[j]) else "✗"
         })
 
     verif_df = pd.DataFrame(verif_data)
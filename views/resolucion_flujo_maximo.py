@@ -245,11 +245,11 @@ def mostrar_resolucion_flujo_maximo(resultado, nodos, origen, destino):
     st.markdown("<h2 class='section-header'>🗺️ VISUALIZACIÓN GRÁFICA DEL FLUJO</h2>",
                 unsafe_allow_html=True)
 
-    # Calcular flujos por arco
-    arcos_flujo = {}
-    for iter_info in resultado['iteraciones']:
-        for u, v in iter_info['ruta']:
-            arcos_flujo[(u, v)] = arcos_flujo.get((u, v), 0) + iter_info['flujo_enviado']
+    # Flujo final por arco (los caminos que usan arcos inversos ya están descontados)
+    arcos_flujo = {
+        (arco['origen'], arco['destino']): arco['flujo']
+        for arco in resultado['flujos'] if arco['flujo'] > 0
+    }
 
     fig_flujo = crear_grafo_flujo(nodos, arcos_flujo, origen, destino)
     st.plotly_chart(fig_flujo, use_container_width=True)
@@ -266,6 +266,23 @@ def mostrar_resolucion_flujo_maximo(resultado, nodos, origen, destino):
     with col3:
         st.metric("Saturados", "✓")
 
+    # CORTE MÍNIMO
+    st.write("---")
+    st.subheader("✂️ Corte Mínimo (Cuellos de Botella)")
+
+    corte = resultado['corte_minimo']
+    st.write(f"**Lado del origen:** {', '.join(map(str, corte['alcanzables']))}")
+    if corte['arcos']:
+        corte_df = pd.DataFrame([
+            {
+                'Arco': f"{arco['origen']} → {arco['destino']}",
+                'Capacidad': f"{arco['capacidad']:.2f}"
+            }
+            for arco in corte['arcos']
+        ])
+        st.dataframe(corte_df, use_container_width=True, hide_index=True)
+    st.caption(f"Capacidad del corte: {corte['capacidad']:.2f} = flujo máximo")
+
     # PROPIEDADES
     st.write("---")
     st.subheader("⚙️ Propiedades del Algoritmo")
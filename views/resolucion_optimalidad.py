@@ -4,6 +4,7 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 from models.transporte.optimalidad import OptimizadorTransporte
+from models.transporte.problema import como_cantidad
 from gemini import generar_analisis_gemini
 from huggingface_analisis_pl import generar_analisis_huggingface
 from ollama_analisis_pl import generar_analisis_ollama, verificar_ollama_disponible
@@ -49,7 +50,7 @@ def crear_grafo_transporte_optimalidad(orígenes, destinos, asignacion, costos):
                     x0, y0 = posiciones[origen]
                     x1, y1 = posiciones[destino]
 
-                    cantidad = int(asignacion[i][j])
+                    cantidad = como_cantidad(asignacion[i][j])
                     costo = float(costos[i][j])
                     costo_total = cantidad * costo
 
@@ -145,9 +146,13 @@ def crear_grafo_transporte_optimalidad(orígenes, destinos, asignacion, costos):
     return fig
 
 
-def mostrar_resolucion_optimalidad(costos, oferta, demanda, solucion_inicial, nombre_metodo, orígenes, destinos):
+def mostrar_resolucion_optimalidad(costos, oferta, demanda, solucion_inicial, nombre_metodo, orígenes, destinos,
+                                   problema=None):
     """
     Muestra la optimización de la solución inicial usando MODI + Stepping Stone
+
+    Si se entrega el ProblemaTransporte usado para la solución inicial, MODI
+    reutiliza sus costos en lugar de volver a convertirlos.
     """
 
     st.success("✅ Optimización de Solución Iniciada (MODI + Stepping Stone)")
@@ -184,7 +189,7 @@ def mostrar_resolucion_optimalidad(costos, oferta, demanda, solucion_inicial, no
     st.metric("💰 Costo Inicial", f"${costo_inicial:.2f}")
 
     try:
-        optimizador = OptimizadorTransporte(costos, solucion_inicial)
+        optimizador = OptimizadorTransporte(problema if problema is not None else costos, solucion_inicial)
         resultado = optimizador.resolver()
         pasos = optimizador.pasos
     except Exception as e:
@@ -303,7 +308,7 @@ def mostrar_resolucion_optimalidad(costos, oferta, demanda, solucion_inicial, no
 
                     desglose_data.append({
                         'Ruta': f"{orígenes[i]} → {destinos[j]}",
-                        'Cantidad': int(cant),
+                        'Cantidad': como_cantidad(cant),
                         'Costo Unitario': f"${costo_unit:.4f}",
                         'Costo Total': f"${costo_total_asign:.2f}"
                     })
@@ -324,8 +329,8 @@ def mostrar_resolucion_optimalidad(costos, oferta, demanda, solucion_inicial, no
             verif_data.append({
                 'Origen': orígenes[i],
                 'Oferta': oferta_original[i],
-                'Asignado': int(suma_fila),
-                'Cumple': "✓" if suma_fila == oferta_original[i] else "✗"
+                'Asignado': como_cantidad(suma_fila),
+                'Cumple': "✓" if np.isclose(suma_fila, oferta_original[i]) else "✗"
             })
 
         for j in range(len(destinos)):
@@ -333,8 +338,8 @@ def mostrar_resolucion_optimalidad(costos, oferta, demanda, solucion_inicial, no
             verif_data.append({
                 'Origen': destinos[j],
                 'Demanda': demanda_original[j],
-                'Recibido': int(suma_col),
-                'Cumple': "✓" if suma_col == demanda_original[j] else "✗"
+                'Recibido': como_cantidad(suma_col),
+                'Cumple': "✓" if np.isclose(suma_col, demanda_original[j]) else "✗"
             })
 
         verif_df = pd.DataFrame(verif_data)
@@ -3,6 +3,8 @@ views/transporte.py
 Vista principal para Problemas de Transporte adaptada a Coca-Cola
 """
 
+import numpy as np
+import pandas as pd
 import streamlit as st
 from views.resolucion_esquina_noroeste import mostrar_resolucion_esquina_noroeste, ejemplo_esquina_noroeste
 from views.resolucion_costo_minimo_transporte import mostrar_resolucion_costo_minimo_transporte, \
@@ -13,6 +15,9 @@ from views.resolucion_optimalidad import mostrar_resolucion_optimalidad, ejemplo
 from models.transporte.esquina_noroeste import EsquinaNoreste
 from models.transporte.costo_minimo import CostoMinimo
 from models.transporte.vogel import MetodoVogel
+from models.transporte.balanceo import balancear_problema, diferencia_oferta_demanda, quitar_ficticios
+from models.transporte.problema import ProblemaTransporte, como_cantidad
+from models.transporte.carga import cargar_matriz_costos, cargar_vector
 from empresa.datos_empresa import (
     PLANTAS, CENTROS_DISTRIBUCION, COSTOS_TRANSPORTE_DISTRIBUCION,
     PUNTOS_VENTA, COSTOS_TRANSPORTE_VENTA
@@ -139,8 +144,8 @@ def _mostrar_esquina_noroeste():
 
     # Procesar datos
     try:
-        oferta = [int(x.strip()) for x in oferta_input.strip().split('\n') if x.strip()]
-        demanda = [int(x.strip()) for x in demanda_input.strip().split('\n') if x.strip()]
+        oferta = _leer_cantidades(oferta_input)
+        demanda = _leer_cantidades(demanda_input)
 
         costos = []
         for linea in costos_input.strip().split('\n'):
@@ -156,12 +161,18 @@ def _mostrar_esquina_noroeste():
         st.error(f"❌ Error al procesar datos: {str(e)}")
         return
 
+    # Archivos CSV/Parquet (opcional): reemplazan a los datos escritos arriba
+    archivos = _cargar_archivos("esquina")
+    if archivos is not None:
+        costos, oferta, demanda = archivos
+
+    # Balancear (origen/destino ficticio) y generar nombres de orígenes y destinos
+    costos, oferta, demanda, orígenes, destinos, balance = _balancear_entrada(costos, oferta, demanda, "esquina")
+
     # Botón ejecutar
     if st.button("▶️ Resolver Esquina Noroeste", key="btn_exec_esquina_metodo"):
-        # Generar nombres de orígenes y destinos
-        orígenes = [f"O{i+1}" for i in range(len(oferta))]
-        destinos = [f"D{j+1}" for j in range(len(demanda))]
-        mostrar_resolucion_esquina_noroeste(costos, oferta, demanda, orígenes, destinos)
+        resultado = mostrar_resolucion_esquina_noroeste(costos, oferta, demanda, orígenes, destinos)
+        _mostrar_ficticios(resultado['asignacion'], balance, orígenes, destinos)
 
     # Ejemplo
     st.write("---")
@@ -199,8 +210,8 @@ def _mostrar_costo_minimo():
         )
 
     try:
-        oferta = [int(x.strip()) for x in oferta_input.strip().split('\n') if x.strip()]
-        demanda = [int(x.strip()) for x in demanda_input.strip().split('\n') if x.strip()]
+        oferta = _leer_cantidades(oferta_input)
+        demanda = _leer_cantidades(demanda_input)
 
         costos = []
         for linea in costos_input.strip().split('\n'):
@@ -212,11 +223,17 @@ def _mostrar_costo_minimo():
         st.error(f"❌ Error al procesar datos: {str(e)}")
         return
 
+    # Archivos CSV/Parquet (opcional): reemplazan a los datos escritos arriba
+    archivos = _cargar_archivos("costo")
+    if archivos is not None:
+        costos, oferta, demanda = archivos
+
+    # Balancear (origen/destino ficticio) y generar nombres de orígenes y destinos
+    costos, oferta, demanda, orígenes, destinos, balance = _balancear_entrada(costos, oferta, demanda, "costo")
+
     if st.button("▶️ Resolver Costo Mínimo", key="btn_exec_costo_minimo_metodo"):
-        # Generar nombres de orígenes y destinos
-        orígenes = [f"O{i+1}" for i in range(len(oferta))]
-        destinos = [f"D{j+1}" for j in range(len(demanda))]
-        mostrar_resolucion_costo_minimo_transporte(costos, oferta, demanda, orígenes, destinos)
+        resultado = mostrar_resolucion_costo_minimo_transporte(costos, oferta, demanda, orígenes, destinos)
+        _mostrar_ficticios(resultado['asignacion'], balance, orígenes, destinos)
 
     st.write("---")
     ejemplo_costo_minimo_transporte()
@@ -253,8 +270,8 @@ def _mostrar_vogel():
         )
 
     try:
-        oferta = [int(x.strip()) for x in oferta_input.strip().split('\n') if x.strip()]
-        demanda = [int(x.strip()) for x in demanda_input.strip().split('\n') if x.strip()]
+        oferta = _leer_cantidades(oferta_input)
+        demanda = _leer_cantidades(demanda_input)
 
         costos = []
         for linea in costos_input.strip().split('\n'):
@@ -266,11 +283,17 @@ def _mostrar_vogel():
         st.error(f"❌ Error al procesar datos: {str(e)}")
         return
 
+    # Archivos CSV/Parquet (opcional): reemplazan a los datos escritos arriba
+    archivos = _cargar_archivos("vogel")
+    if archivos is not None:
+        costos, oferta, demanda = archivos
+
+    # Balancear (origen/destino ficticio) y generar nombres de orígenes y destinos
+    costos, oferta, demanda, orígenes, destinos, balance = _balancear_entrada(costos, oferta, demanda, "vogel")
+
     if st.button("▶️ Resolver Vogel", key="btn_exec_vogel_metodo"):
-        # Generar nombres de orígenes y destinos
-        orígenes = [f"O{i+1}" for i in range(len(oferta))]
-        destinos = [f"D{j+1}" for j in range(len(demanda))]
-        mostrar_resolucion_vogel(costos, oferta, demanda, orígenes, destinos)
+        asignacion = mostrar_resolucion_vogel(costos, oferta, demanda, orígenes, destinos)
+        _mostrar_ficticios(asignacion, balance, orígenes, destinos)
 
     st.write("---")
     ejemplo_vogel()
@@ -319,8 +342,8 @@ def _mostrar_optimizar():
         )
 
     try:
-        oferta = [int(x.strip()) for x in oferta_input.strip().split('\n') if x.strip()]
-        demanda = [int(x.strip()) for x in demanda_input.strip().split('\n') if x.strip()]
+        oferta = _leer_cantidades(oferta_input)
+        demanda = _leer_cantidades(demanda_input)
 
         costos = []
         for linea in costos_input.strip().split('\n'):
@@ -332,31 +355,165 @@ def _mostrar_optimizar():
         st.error(f"❌ Error al procesar datos: {str(e)}")
         return
 
+    # Archivos CSV/Parquet (opcional): reemplazan a los datos escritos arriba
+    archivos = _cargar_archivos("opt")
+    if archivos is not None:
+        costos, oferta, demanda = archivos
+
+    # Balancear (origen/destino ficticio) y generar nombres de orígenes y destinos
+    costos, oferta, demanda, orígenes, destinos, balance = _balancear_entrada(costos, oferta, demanda, "opt")
+
     if st.button("▶️ Resolver y Optimizar", key="btn_exec_optimizar_metodo_final"):
-        # Generar nombres de orígenes y destinos
-        orígenes = [f"O{i+1}" for i in range(len(oferta))]
-        destinos = [f"D{j+1}" for j in range(len(demanda))]
+        # Un único problema (arreglos y órdenes por costo) para el método inicial y MODI
+        problema = ProblemaTransporte(costos, oferta, demanda)
 
         # Generar solución inicial según método seleccionado
         if metodo_inicial == "Esquina Noroeste":
-            metodo = EsquinaNoreste(costos, oferta, demanda)
+            metodo = EsquinaNoreste(problema)
             nombre = "Esquina Noroeste"
             resultado = metodo.resolver()
             solucion_inicial = resultado['asignacion']
 
         elif metodo_inicial == "Costo Mínimo":
-            metodo = CostoMinimo(costos, oferta, demanda)
+            metodo = CostoMinimo(problema)
             nombre = "Costo Mínimo"
             resultado = metodo.resolver()
             solucion_inicial = resultado['asignacion']
 
         else:  # Vogel
-            metodo = MetodoVogel(costos, oferta, demanda)
+            metodo = MetodoVogel(problema)
             nombre = "Vogel (VAM)"
             solucion_inicial = metodo.resolver()
 
         # Optimizar
-        mostrar_resolucion_optimalidad(costos, oferta, demanda, solucion_inicial, nombre, orígenes, destinos)
+        solucion_optima = mostrar_resolucion_optimalidad(costos, oferta, demanda, solucion_inicial, nombre,
+                                                         orígenes, destinos, problema=problema)
+        _mostrar_ficticios(solucion_optima, balance, orígenes, destinos)
+
+    st.write("---")
+    ejemplo_optimalidad_transporte()
+
+
+def _cargar_archivos(prefijo):
+    """
+    Permite cargar costos, oferta y demanda desde archivos CSV o Parquet.
+
+    Returns:
+        tuple: (costos, oferta, demanda) o None si no se subieron los tres archivos
+    """
+    with st.expander("📂 Cargar desde archivos (CSV / Parquet)"):
+        st.caption("Costos: una fila por origen y una columna por destino. "
+                   "Oferta y demanda: una columna numérica (y opcionalmente una de nombres).")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            archivo_costos = st.file_uploader("Costos", type=["csv", "parquet"], key=f"{prefijo}_archivo_costos")
+        with col2:
+            archivo_oferta = st.file_uploader("Oferta", type=["csv", "parquet"], key=f"{prefijo}_archivo_oferta")
+        with col3:
+            archivo_demanda = st.file_uploader("Demanda", type=["csv", "parquet"], key=f"{prefijo}_archivo_demanda")
+
+    if archivo_costos is None or archivo_oferta is None or archivo_demanda is None:
+        return None
+
+    try:
+        costos, _, _ = cargar_matriz_costos(archivo_costos)
+        oferta, _ = cargar_vector(archivo_oferta)
+        demanda, _ = cargar_vector(archivo_demanda)
+    except Exception as e:
+        st.error(f"❌ Error al leer los archivos: {str(e)}")
+        return None
+
+    if costos.shape != (len(oferta), len(demanda)):
+        st.error("❌ Dimensiones inconsistentes entre los archivos")
+        return None
+
+    # Las celdas vacías son rutas prohibidas (costo infinito): estos métodos
+    # trabajan sobre la matriz completa y no las admiten
+    if not np.isfinite(costos).all():
+        st.error("❌ El archivo de costos tiene celdas vacías (rutas prohibidas); "
+                 "estos métodos requieren un costo para cada origen y destino")
+        return None
+
+    st.success(f"✅ Instancia cargada: {costos.shape[0]} orígenes × {costos.shape[1]} destinos")
+    return costos.tolist(), [como_cantidad(x) for x in oferta], [como_cantidad(x) for x in demanda]
+
+
+def _balancear_entrada(costos, oferta, demanda, prefijo):
+    """
+    Detecta si oferta y demanda totales difieren y, de ser así, agrega un
+    origen o destino ficticio con el costo de penalización elegido.
+
+    Returns:
+        tuple: (costos, oferta, demanda, orígenes, destinos, balance) del problema
+               balanceado; balance es None si no hizo falta un ficticio
+    """
+    orígenes = [f"O{i+1}" for i in range(len(oferta))]
+    destinos = [f"D{j+1}" for j in range(len(demanda))]
+
+    # Con decimales, una diferencia de 1e-16 es error de redondeo, no un desbalance
+    diferencia = como_cantidad(diferencia_oferta_demanda(oferta, demanda))
+    if diferencia == 0:
+        return costos, oferta, demanda, orígenes, destinos, None
+
+    if diferencia > 0:
+        st.warning(f"⚖️ La oferta supera a la demanda en {diferencia} unidades: "
+                   f"se agrega un destino ficticio que absorbe el excedente.")
+        penalizacion = st.number_input("Costo unitario del destino ficticio (excedente)",
+                                       value=0.0, key=f"{prefijo}_penal_destino_ficticio")
+        balance = balancear_problema(costos, oferta, demanda, penalizacion_destino=penalizacion)
+        destinos.append("D_Ficticio")
+    else:
+        st.warning(f"⚖️ La demanda supera a la oferta en {-diferencia} unidades: "
+                   f"se agrega un origen ficticio que representa la demanda insatisfecha.")
+        penalizacion = st.number_input("Costo unitario del origen ficticio (demanda insatisfecha)",
+                                       value=0.0, key=f"{prefijo}_penal_origen_ficticio")
+        balance = balancear_problema(costos, oferta, demanda, penalizacion_origen=penalizacion)
+        orígenes.append("O_Ficticio")
+
+    return balance['costos'], balance['oferta'], balance['demanda'], orígenes, destinos, balance
+
+
+def _mostrar_ficticios(asignacion, balance, orígenes, destinos):
+    """
+    Separa lo asignado al origen/destino ficticio (quitar_ficticios) y muestra
+    su penalización aparte del costo de transporte real.
+    """
+    if balance is None or asignacion is None:
+        return
+
+    separado = quitar_ficticios(asignacion, balance)
+    costos = np.asarray(balance['costos'], dtype=float)
+    real = np.asarray(separado['asignacion'], dtype=float)
+    filas, columnas = real.shape
+
+    costo_real = float(np.sum(real * costos[:filas, :columnas]))
+    if balance['destino_ficticio']:
+        cantidades = separado['oferta_sobrante']
+        penalizacion = float(np.dot(cantidades, costos[:filas, columnas]))
+        tabla = pd.DataFrame({
+            'Origen': orígenes[:filas],
+            'Oferta sin despachar': [como_cantidad(x) for x in cantidades]
+        })
+    else:
+        cantidades = separado['demanda_insatisfecha']
+        penalizacion = float(np.dot(cantidades, costos[filas, :columnas]))
+        tabla = pd.DataFrame({
+            'Destino': destinos[:columnas],
+            'Demanda insatisfecha': [como_cantidad(x) for x in cantidades]
+        })
 
     st.write("---")
-    ejemplo_optimalidad_transporte()
\ No newline at end of file
+    st.markdown("### ⚖️ Origen / Destino Ficticio")
+    st.caption("Las cantidades asignadas al ficticio no son envíos reales: su costo es la "
+               "penalización elegida y se informa aparte del costo de transporte.")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("🚚 Costo de Transporte Real", f"${costo_real:.2f}")
+    with col2:
+        st.metric("⚠️ Penalización del Ficticio", f"${penalizacion:.2f}")
+    st.dataframe(tabla, use_container_width=True, hide_index=True)
+
+
+def _leer_cantidades(texto):
+    """Lee una cantidad por línea; acepta decimales (pallets parciales, litros)"""
+    return [como_cantidad(float(x.strip())) for x in texto.strip().split('\n') if x.strip()]
\ No newline at end of file